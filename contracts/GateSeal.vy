@@ -59,6 +59,12 @@ MAX_SEALABLES: constant(uint256) = 8
 MAX_EXPIRY_PERIOD_DAYS: constant(uint256) = 365
 MAX_EXPIRY_PERIOD_SECONDS: constant(uint256) = SECONDS_PER_DAY * MAX_EXPIRY_PERIOD_DAYS
 
+# The reasons why a sealable failed to seal, reported in the `seal()` error message.
+# The `pauseFor` call reverted.
+FAILURE_PAUSE_REVERTED: constant(uint256) = 1
+# The `pauseFor` call succeeded but the sealable is still not paused.
+FAILURE_NOT_PAUSED: constant(uint256) = 2
+
 # To simplify the code, we chose not to implement committees in GateSeals.
 # Instead, GateSeals are operated by a single account which must be a multisig.
 # The code does not perform any such checks but we pinky-promise that
@@ -150,9 +156,9 @@ def seal(_sealables: DynArray[address, MAX_SEALABLES]):
 
     # Instead of reverting the transaction as soon as one of the sealables fails,
     # we iterate through the entire list and collect the indexes of those that failed
-    # and report them in the dynamically-generated error message.
+    # along with the reasons and report them in the error message, see `_encode_failure`.
     # This will make it easier for us to debug in a hectic situation.
-    failed_indexes: DynArray[uint256, MAX_SEALABLES] = []
+    failures: uint256 = 0
     sealable_index: uint256 = 0
 
     for sealable in _sealables:
@@ -171,15 +177,18 @@ def seal(_sealables: DynArray[address, MAX_SEALABLES]):
             max_outsize=32,
             revert_on_failure=False
         )
-        
-        if success and IPausableUntil(sealable).isPaused():
-            log Sealed(self, SEALING_COMMITTEE, SEAL_DURATION_SECONDS, sealable, block.timestamp)
+
+        if not success:
+            failures += self._encode_failure(sealable_index, FAILURE_PAUSE_REVERTED)
+        elif not IPausableUntil(sealable).isPaused():
+            failures += self._encode_failure(sealable_index, FAILURE_NOT_PAUSED)
         else:
-            failed_indexes.append(sealable_index)
-    
+            log Sealed(self, SEALING_COMMITTEE, SEAL_DURATION_SECONDS, sealable, block.timestamp)
+
         sealable_index += 1
 
-    assert len(failed_indexes) == 0, self._to_error_string(failed_indexes)
+    # return type of `uint2str` is String[78] because 2^256 has 78 digits
+    assert failures == 0, uint2str(failures)
 
 
 @internal
@@ -212,25 +221,18 @@ def _has_duplicates(_sealables: DynArray[address, MAX_SEALABLES]) -> bool:
 
 @internal
 @pure
-def _to_error_string(_failed_indexes: DynArray[uint256, MAX_SEALABLES]) -> String[78]:
+def _encode_failure(_sealable_index: uint256, _reason: uint256) -> uint256:
     """
-    @notice converts a list of indexes into an error message to faciliate debugging
-    @dev    The indexes in the error message are given in the descending order to avoid
-            losing leading zeros when casting to string,
+    @notice encodes a failed sealable for the error message to faciliate debugging
+    @dev    The error message is the decimal string of the sum of the encoded failures:
+            bits 0..7 are the bitmask of the failed indexes and
+            bits 8 + 2 * i and 9 + 2 * i are the failure reason of the sealable at index i,
 
-            e.g. [0, 2, 3, 6] -> "6320"
-    @param _failed_indexes a list of sealable indexes that failed to seal 
-    """
-    indexes_as_decimal: uint256 = 0
-    loop_index: uint256 = 0
-
-    # convert failed indexes to a decimal representation
-    for failed_index in _failed_indexes:
-        indexes_as_decimal += failed_index * 10 ** loop_index
-        loop_index += 1
+            e.g. index 0 reverted, index 3 not paused
+            -> 0b10_00_00_01_00001001 -> "33033"
 
-    # generate error message with indexes as a decimal string
-    # return type of `uint2str` is String[78] because 2^256 has 78 digits
-    error_message: String[78] = uint2str(indexes_as_decimal)
-
-    return error_message
+            see `utils/seal_errors.py` for the decoder
+    @param _sealable_index index of the failed sealable in the `seal()` argument
+    @param _reason the reason the sealable failed, one of the FAILURE_* constants
+    """
+    return 2 ** _sealable_index + _reason * 2 ** (MAX_SEALABLES + 2 * _sealable_index)
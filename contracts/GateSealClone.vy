@@ -0,0 +1,200 @@
+# @version 0.3.7
+
+"""
+@title GateSealClone
+@notice A one-time panic button for pausable contracts, deployable as a minimal proxy
+@dev GateSealClone is the implementation behind the minimal proxies (EIP-1167) created by
+     GateSealCloneFactory. It behaves exactly like GateSeal, see GateSeal.vy for details,
+     except that the configuration is written to the storage of the proxy by `initialize`
+     instead of the constructor, because proxies do not run the constructor of
+     the implementation and cannot have their own immutables.
+
+     The factory creates and initializes each proxy in the same transaction,
+     so there is no window in which someone else could initialize it.
+     The implementation itself is locked at construction and cannot be initialized.
+"""
+
+
+event Sealed:
+    gate_seal: address
+    sealed_by: address
+    sealed_for: uint256
+    sealable: address
+    sealed_at: uint256
+
+interface IPausableUntil:
+    def pauseFor(_duration: uint256): nonpayable
+    def isPaused() -> bool: view
+
+SECONDS_PER_DAY: constant(uint256) = 60 * 60 * 24
+
+# The seal duration and expiry limits are the same as in GateSeal, see GateSeal.vy for details
+MIN_SEAL_DURATION_DAYS: constant(uint256) = 4
+MIN_SEAL_DURATION_SECONDS: constant(uint256) = SECONDS_PER_DAY * MIN_SEAL_DURATION_DAYS
+
+MAX_SEAL_DURATION_DAYS: constant(uint256) = 14
+MAX_SEAL_DURATION_SECONDS: constant(uint256) = SECONDS_PER_DAY * MAX_SEAL_DURATION_DAYS
+
+MAX_SEALABLES: constant(uint256) = 8
+
+MAX_EXPIRY_PERIOD_DAYS: constant(uint256) = 365
+MAX_EXPIRY_PERIOD_SECONDS: constant(uint256) = SECONDS_PER_DAY * MAX_EXPIRY_PERIOD_DAYS
+
+# The reasons why a sealable failed to seal, see GateSeal.vy
+FAILURE_PAUSE_REVERTED: constant(uint256) = 1
+FAILURE_NOT_PAUSED: constant(uint256) = 2
+
+# A proxy is initialized once it has a sealing committee
+sealing_committee: address
+seal_duration_seconds: uint256
+sealables: DynArray[address, MAX_SEALABLES]
+expiry_timestamp: uint256
+
+
+@external
+def __init__():
+    # lock the implementation; the expiry timestamp stays zero, so it is also expired
+    self.sealing_committee = self
+
+
+@external
+def initialize(
+    _sealing_committee: address,
+    _seal_duration_seconds: uint256,
+    _sealables: DynArray[address, MAX_SEALABLES],
+    _expiry_timestamp: uint256
+):
+    """
+    @notice Initialize the GateSeal proxy, performs the same checks as the GateSeal constructor.
+    @param _sealing_committee address of the multisig committee
+    @param _seal_duration_seconds duration of the seal in seconds
+    @param _sealables addresses of pausable contracts
+    @param _expiry_timestamp unix timestamp when the GateSeal will naturally expire
+    """
+    assert self.sealing_committee == empty(address), "gate seal: already initialized"
+    assert _sealing_committee != empty(address), "sealing committee: zero address"
+    assert _seal_duration_seconds >= MIN_SEAL_DURATION_SECONDS, "seal duration: too short"
+    assert _seal_duration_seconds <= MAX_SEAL_DURATION_SECONDS, "seal duration: exceeds max"
+    assert len(_sealables) > 0, "sealables: empty list"
+    assert _expiry_timestamp > block.timestamp, "expiry timestamp: must be in the future"
+    assert _expiry_timestamp <= block.timestamp + MAX_EXPIRY_PERIOD_SECONDS, "expiry timestamp: exceeds max expiry period"
+    for sealable in _sealables:
+        assert sealable != empty(address), "sealables: includes zero address"
+    assert not self._has_duplicates(_sealables), "sealables: includes duplicates"
+
+    self.sealing_committee = _sealing_committee
+    self.seal_duration_seconds = _seal_duration_seconds
+    self.sealables = _sealables
+    self.expiry_timestamp = _expiry_timestamp
+
+
+@external
+@view
+def get_sealing_committee() -> address:
+    return self.sealing_committee
+
+
+@external
+@view
+def get_seal_duration_seconds() -> uint256:
+    return self.seal_duration_seconds
+
+
+@external
+@view
+def get_sealables() -> DynArray[address, MAX_SEALABLES]:
+    return self.sealables
+
+
+@external
+@view
+def get_expiry_timestamp() -> uint256:
+    return self.expiry_timestamp
+
+
+@external
+@view
+def is_expired() -> bool:
+    return self._is_expired()
+
+
+@external
+def seal(_sealables: DynArray[address, MAX_SEALABLES]):
+    """
+    @notice Seal the contract(s).
+    @dev    Immediately expires GateSeal and, thus, can only be called once.
+    @param _sealables a list of sealables to seal; may include all or only a subset.
+    """
+    sealing_committee: address = self.sealing_committee
+    seal_duration_seconds: uint256 = self.seal_duration_seconds
+
+    assert msg.sender == sealing_committee, "sender: not SEALING_COMMITTEE"
+    assert not self._is_expired(), "gate seal: expired"
+    assert len(_sealables) > 0, "sealables: empty subset"
+    assert not self._has_duplicates(_sealables), "sealables: includes duplicates"
+
+    self.expiry_timestamp = block.timestamp
+
+    # see GateSeal.vy::seal() on how the failures are reported
+    failures: uint256 = 0
+    sealable_index: uint256 = 0
+
+    for sealable in _sealables:
+        assert sealable in self.sealables, "sealables: includes a non-sealable"
+
+        success: bool = False
+        response: Bytes[32] = b""
+
+        # see GateSeal.vy::seal() on why `max_outsize` is required
+        success, response = raw_call(
+            sealable,
+            _abi_encode(seal_duration_seconds, method_id=method_id("pauseFor(uint256)")),
+            max_outsize=32,
+            revert_on_failure=False
+        )
+
+        if not success:
+            failures += self._encode_failure(sealable_index, FAILURE_PAUSE_REVERTED)
+        elif not IPausableUntil(sealable).isPaused():
+            failures += self._encode_failure(sealable_index, FAILURE_NOT_PAUSED)
+        else:
+            log Sealed(self, sealing_committee, seal_duration_seconds, sealable, block.timestamp)
+
+        sealable_index += 1
+
+    assert failures == 0, uint2str(failures)
+
+
+@internal
+@view
+def _is_expired() -> bool:
+    return block.timestamp >= self.expiry_timestamp
+
+
+@internal
+@pure
+def _has_duplicates(_sealables: DynArray[address, MAX_SEALABLES]) -> bool:
+    """
+    @notice checks the list for duplicates
+    @param  _sealables list of addresses to check
+    """
+    unique: DynArray[address, MAX_SEALABLES] = []
+
+    for sealable in _sealables:
+        if sealable in unique:
+            return True
+        unique.append(sealable)
+
+    return False
+
+
+@internal
+@pure
+def _encode_failure(_sealable_index: uint256, _reason: uint256) -> uint256:
+    """
+    @notice encodes a failed sealable for the error message
+    @dev    see GateSeal.vy::_encode_failure()
+    @param _sealable_index index of the failed sealable in the `seal()` argument
+    @param _reason the reason the sealable failed, one of the FAILURE_* constants
+    """
+    return 2 ** _sealable_index + _reason * 2 ** (MAX_SEALABLES + 2 * _sealable_index)
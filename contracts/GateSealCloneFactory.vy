@@ -0,0 +1,82 @@
+# @version 0.3.7
+
+"""
+@title GateSealCloneFactory
+@notice A factory contract for GateSeal minimal proxies
+@dev An alternative to GateSealFactory that, instead of deploying the full GateSeal code
+     from the blueprint, deploys an EIP-1167 minimal proxy using `create_minimal_proxy_to`
+     which delegates all calls to a single GateSealClone implementation.
+     The proxy is initialized with the given parameters in the same transaction.
+
+     Creating a proxy is much cheaper than deploying the GateSeal code but every call
+     to the proxy pays for the extra DELEGATECALL and the configuration is read from
+     storage instead of the code.
+
+     More on minimal proxies
+     https://docs.vyperlang.org/en/v0.3.7/built-in-functions.html#create_minimal_proxy_to
+
+     More on EIP-1167
+     https://eips.ethereum.org/EIPS/eip-1167
+"""
+
+event GateSealCreated:
+    gate_seal: address
+
+# The maximum number of sealables is 8, see GateSealFactory.vy
+MAX_SEALABLES: constant(uint256) = 8
+
+interface IGateSealClone:
+    def initialize(
+        _sealing_committee: address,
+        _seal_duration_seconds: uint256,
+        _sealables: DynArray[address, MAX_SEALABLES],
+        _expiry_timestamp: uint256
+    ): nonpayable
+
+# Address of the GateSealClone implementation that must be deployed beforehand
+IMPLEMENTATION: immutable(address)
+
+# @dev Error messages
+IMPLEMENTATION_ZERO_ADDRESS: constant(String[32]) = "implementation: zero address"
+
+@external
+def __init__(_implementation: address):
+    """
+    @notice Initialize the factory with a GateSealClone implementation
+    @param _implementation The address of the implementation contract
+    """
+    assert _implementation != empty(address), IMPLEMENTATION_ZERO_ADDRESS
+    IMPLEMENTATION = _implementation
+
+
+@external
+@view
+def get_implementation() -> address:
+    return IMPLEMENTATION
+
+
+@external
+def create_gate_seal(
+    _sealing_committee: address,
+    _seal_duration_seconds: uint256,
+    _sealables: DynArray[address, MAX_SEALABLES],
+    _expiry_timestamp: uint256
+):
+    """
+    @notice Create a new GateSeal minimal proxy.
+    @dev    All of the security checks are done inside GateSealClone `initialize`.
+    @param _sealing_committee address of the multisig committee
+    @param _seal_duration_seconds duration of the seal in seconds
+    @param _sealables addresses of pausable contracts
+    @param _expiry_timestamp unix timestamp when the GateSeal will naturally expire
+    """
+    gate_seal: address = create_minimal_proxy_to(IMPLEMENTATION)
+
+    IGateSealClone(gate_seal).initialize(
+        _sealing_committee,
+        _seal_duration_seconds,
+        _sealables,
+        _expiry_timestamp
+    )
+
+    log GateSealCreated(gate_seal)
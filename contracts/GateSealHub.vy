@@ -0,0 +1,264 @@
+# @version 0.3.7
+
+"""
+@title GateSealHub
+@notice Many one-time panic buttons for pausable contracts in a single contract
+@dev GateSealHub keeps the configurations of many GateSeals in its storage instead of
+     deploying a separate contract for each one. Creating a GateSeal only costs the storage
+     writes for its configuration. Each GateSeal is identified by its id and follows
+     the same rules as the standalone GateSeal: it is operated by a single sealing committee,
+     can only be used once and expires on its expiry timestamp if never used.
+
+     Unlike standalone GateSeals, all GateSeals in a hub pause the sealables on behalf of
+     the hub, i.e. the hub itself must have the permission to pause the contracts.
+     Because of that, anyone able to create a GateSeal could pause any contract the hub
+     has the permission for, which is why only the hub admin can create GateSeals.
+"""
+
+
+event GateSealCreated:
+    gate_seal_id: uint256
+
+event Sealed:
+    gate_seal_id: uint256
+    sealed_by: address
+    sealed_for: uint256
+    sealable: address
+    sealed_at: uint256
+
+interface IPausableUntil:
+    def pauseFor(_duration: uint256): nonpayable
+    def isPaused() -> bool: view
+
+SECONDS_PER_DAY: constant(uint256) = 60 * 60 * 24
+
+# The seal duration and expiry limits are the same as in GateSeal, see GateSeal.vy for details
+MIN_SEAL_DURATION_DAYS: constant(uint256) = 4
+MIN_SEAL_DURATION_SECONDS: constant(uint256) = SECONDS_PER_DAY * MIN_SEAL_DURATION_DAYS
+
+MAX_SEAL_DURATION_DAYS: constant(uint256) = 14
+MAX_SEAL_DURATION_SECONDS: constant(uint256) = SECONDS_PER_DAY * MAX_SEAL_DURATION_DAYS
+
+MAX_SEALABLES: constant(uint256) = 8
+
+MAX_EXPIRY_PERIOD_DAYS: constant(uint256) = 365
+MAX_EXPIRY_PERIOD_SECONDS: constant(uint256) = SECONDS_PER_DAY * MAX_EXPIRY_PERIOD_DAYS
+
+# The reasons why a sealable failed to seal, see GateSeal.vy
+FAILURE_PAUSE_REVERTED: constant(uint256) = 1
+FAILURE_NOT_PAUSED: constant(uint256) = 2
+
+# The sealing committee, the seal duration and the expiry timestamp of a GateSeal
+# are packed into a single storage word to create and read a GateSeal with one SSTORE/SLOAD:
+# bits 0..159 - sealing committee
+# bits 160..207 - seal duration in seconds, at most 14 days
+# bits 208..255 - expiry timestamp, at most 1 year from now
+ADDRESS_MASK: constant(uint256) = 2 ** 160 - 1
+UINT48_MASK: constant(uint256) = 2 ** 48 - 1
+SEAL_DURATION_SECONDS_SHIFT: constant(int128) = 160
+EXPIRY_TIMESTAMP_SHIFT: constant(int128) = 208
+
+# The account that creates GateSeals, e.g. the DAO agent
+ADMIN: immutable(address)
+
+gate_seals_count: uint256
+
+# GateSeal id -> packed sealing committee, seal duration and expiry timestamp
+configs: HashMap[uint256, uint256]
+
+# GateSeal id -> addresses of pausable contracts
+sealables: HashMap[uint256, DynArray[address, MAX_SEALABLES]]
+
+
+@external
+def __init__(_admin: address):
+    assert _admin != empty(address), "admin: zero address"
+    ADMIN = _admin
+
+
+@external
+@view
+def get_admin() -> address:
+    return ADMIN
+
+
+@external
+@view
+def get_gate_seals_count() -> uint256:
+    return self.gate_seals_count
+
+
+@external
+def create_gate_seal(
+    _sealing_committee: address,
+    _seal_duration_seconds: uint256,
+    _sealables: DynArray[address, MAX_SEALABLES],
+    _expiry_timestamp: uint256
+) -> uint256:
+    """
+    @notice Create a new GateSeal.
+    @dev    Performs the same checks as the GateSeal constructor.
+    @param _sealing_committee address of the multisig committee
+    @param _seal_duration_seconds duration of the seal in seconds
+    @param _sealables addresses of pausable contracts
+    @param _expiry_timestamp unix timestamp when the GateSeal will naturally expire
+    @return id of the new GateSeal
+    """
+    assert msg.sender == ADMIN, "sender: not ADMIN"
+    assert _sealing_committee != empty(address), "sealing committee: zero address"
+    assert _seal_duration_seconds >= MIN_SEAL_DURATION_SECONDS, "seal duration: too short"
+    assert _seal_duration_seconds <= MAX_SEAL_DURATION_SECONDS, "seal duration: exceeds max"
+    assert len(_sealables) > 0, "sealables: empty list"
+    assert _expiry_timestamp > block.timestamp, "expiry timestamp: must be in the future"
+    assert _expiry_timestamp <= block.timestamp + MAX_EXPIRY_PERIOD_SECONDS, "expiry timestamp: exceeds max expiry period"
+    for sealable in _sealables:
+        assert sealable != empty(address), "sealables: includes zero address"
+    assert not self._has_duplicates(_sealables), "sealables: includes duplicates"
+
+    gate_seal_id: uint256 = self.gate_seals_count
+    self.gate_seals_count = gate_seal_id + 1
+    self.configs[gate_seal_id] = self._pack_config(_sealing_committee, _seal_duration_seconds, _expiry_timestamp)
+    self.sealables[gate_seal_id] = _sealables
+
+    log GateSealCreated(gate_seal_id)
+
+    return gate_seal_id
+
+
+@external
+@view
+def get_sealing_committee(_gate_seal_id: uint256) -> address:
+    return self._sealing_committee(self.configs[_gate_seal_id])
+
+
+@external
+@view
+def get_seal_duration_seconds(_gate_seal_id: uint256) -> uint256:
+    return self._seal_duration_seconds(self.configs[_gate_seal_id])
+
+
+@external
+@view
+def get_sealables(_gate_seal_id: uint256) -> DynArray[address, MAX_SEALABLES]:
+    return self.sealables[_gate_seal_id]
+
+
+@external
+@view
+def get_expiry_timestamp(_gate_seal_id: uint256) -> uint256:
+    return self._expiry_timestamp(self.configs[_gate_seal_id])
+
+
+@external
+@view
+def is_expired(_gate_seal_id: uint256) -> bool:
+    return block.timestamp >= self._expiry_timestamp(self.configs[_gate_seal_id])
+
+
+@external
+def seal(_gate_seal_id: uint256, _sealables: DynArray[address, MAX_SEALABLES]):
+    """
+    @notice Seal the contract(s) of the GateSeal.
+    @dev    Immediately expires the GateSeal and, thus, can only be called once per GateSeal.
+            Ids of GateSeals that were never created have no sealing committee and cannot be sealed.
+    @param _gate_seal_id id of the GateSeal
+    @param _sealables a list of sealables to seal; may include all or only a subset.
+    """
+    config: uint256 = self.configs[_gate_seal_id]
+    sealing_committee: address = self._sealing_committee(config)
+    seal_duration_seconds: uint256 = self._seal_duration_seconds(config)
+
+    assert msg.sender == sealing_committee, "sender: not SEALING_COMMITTEE"
+    assert block.timestamp < self._expiry_timestamp(config), "gate seal: expired"
+    assert len(_sealables) > 0, "sealables: empty subset"
+    assert not self._has_duplicates(_sealables), "sealables: includes duplicates"
+
+    # expire immediately
+    self.configs[_gate_seal_id] = self._pack_config(sealing_committee, seal_duration_seconds, block.timestamp)
+
+    gate_seal_sealables: DynArray[address, MAX_SEALABLES] = self.sealables[_gate_seal_id]
+    # see GateSeal.vy::seal() on how the failures are reported
+    failures: uint256 = 0
+    sealable_index: uint256 = 0
+
+    for sealable in _sealables:
+        assert sealable in gate_seal_sealables, "sealables: includes a non-sealable"
+
+        success: bool = False
+        response: Bytes[32] = b""
+
+        # see GateSeal.vy::seal() on why `max_outsize` is required
+        success, response = raw_call(
+            sealable,
+            _abi_encode(seal_duration_seconds, method_id=method_id("pauseFor(uint256)")),
+            max_outsize=32,
+            revert_on_failure=False
+        )
+
+        if not success:
+            failures += self._encode_failure(sealable_index, FAILURE_PAUSE_REVERTED)
+        elif not IPausableUntil(sealable).isPaused():
+            failures += self._encode_failure(sealable_index, FAILURE_NOT_PAUSED)
+        else:
+            log Sealed(_gate_seal_id, sealing_committee, seal_duration_seconds, sealable, block.timestamp)
+
+        sealable_index += 1
+
+    assert failures == 0, uint2str(failures)
+
+
+@internal
+@pure
+def _pack_config(_sealing_committee: address, _seal_duration_seconds: uint256, _expiry_timestamp: uint256) -> uint256:
+    return (
+        convert(_sealing_committee, uint256)
+        | shift(_seal_duration_seconds, SEAL_DURATION_SECONDS_SHIFT)
+        | shift(_expiry_timestamp, EXPIRY_TIMESTAMP_SHIFT)
+    )
+
+
+@internal
+@pure
+def _sealing_committee(_config: uint256) -> address:
+    return convert(_config & ADDRESS_MASK, address)
+
+
+@internal
+@pure
+def _seal_duration_seconds(_config: uint256) -> uint256:
+    return shift(_config, -SEAL_DURATION_SECONDS_SHIFT) & UINT48_MASK
+
+
+@internal
+@pure
+def _expiry_timestamp(_config: uint256) -> uint256:
+    return shift(_config, -EXPIRY_TIMESTAMP_SHIFT)
+
+
+@internal
+@pure
+def _has_duplicates(_sealables: DynArray[address, MAX_SEALABLES]) -> bool:
+    """
+    @notice checks the list for duplicates
+    @param  _sealables list of addresses to check
+    """
+    unique: DynArray[address, MAX_SEALABLES] = []
+
+    for sealable in _sealables:
+        if sealable in unique:
+            return True
+        unique.append(sealable)
+
+    return False
+
+
+@internal
+@pure
+def _encode_failure(_sealable_index: uint256, _reason: uint256) -> uint256:
+    """
+    @notice encodes a failed sealable for the error message
+    @dev    see GateSeal.vy::_encode_failure()
+    @param _sealable_index index of the failed sealable in the `seal()` argument
+    @param _reason the reason the sealable failed, one of the FAILURE_* constants
+    """
+    return 2 ** _sealable_index + _reason * 2 ** (MAX_SEALABLES + 2 * _sealable_index)
@@ -0,0 +1,49 @@
+# @version 0.3.7
+
+"""
+@title AccessControlledSealableMock
+@notice A sealable that only lets PAUSE_ROLE holders pause it
+@dev Mimics the OpenZeppelin AccessControl interface of the Lido sealables
+     closely enough to test the pause permission checks, with a single admin.
+"""
+
+PAUSE_ROLE: public(constant(bytes32)) = keccak256("PausableUntil.PauseRole")
+
+admin: address
+roles: HashMap[bytes32, HashMap[address, bool]]
+resumed_timestamp: uint256
+
+
+@external
+def __init__():
+    self.admin = msg.sender
+
+
+@external
+@view
+def hasRole(_role: bytes32, _account: address) -> bool:
+    return self.roles[_role][_account]
+
+
+@external
+def grantRole(_role: bytes32, _account: address):
+    assert msg.sender == self.admin, "not admin"
+    self.roles[_role][_account] = True
+
+
+@external
+def revokeRole(_role: bytes32, _account: address):
+    assert msg.sender == self.admin, "not admin"
+    self.roles[_role][_account] = False
+
+
+@external
+@view
+def isPaused() -> bool:
+    return block.timestamp < self.resumed_timestamp
+
+
+@external
+def pauseFor(_duration: uint256):
+    assert self.roles[PAUSE_ROLE][msg.sender], "no pause role"
+    self.resumed_timestamp = block.timestamp + _duration
@@ -4,6 +4,8 @@ module.exports = {
   networks: {
     hardhat: {
       hardfork: "london",
+      // local nodes of the multi-network orchestrator run on distinct chains, see utils/orchestrator.py
+      chainId: Number(process.env.HARDHAT_CHAIN_ID || 31337),
       // Base fee of 0 allows use of 0 gas price when testing
       initialBaseFeePerGas: 0,
       accounts: {
@@ -0,0 +1,76 @@
+import os
+import timeit
+from ape.logging import logger
+
+from utils.blueprint import (
+    DEPLOY_PREAMBLE_BYTE_LENGTH,
+    construct_blueprint_deploy_bytecode,
+    parse_eip5202_blueprint,
+    verify_blueprint_deploy_preamble,
+    verify_eip522_blueprint,
+)
+
+# roughly the size of the GateSeal initcode
+INITCODE_LENGTH = 4 * 1024
+ITERATIONS = 20_000
+
+
+# the previous hex round trip implementation, kept as the baseline
+def _hex_round_trip_construct(initcode_hex):
+    eip_5202_bytecode = bytes.fromhex("fe") + bytes.fromhex("71") + bytes.fromhex("00") + bytes.fromhex(initcode_hex[2:])
+    return (
+        bytes.fromhex("61")
+        + bytes.fromhex(len(eip_5202_bytecode).to_bytes(2, "big").hex())
+        + bytes.fromhex("3d81600a3d39f3")
+        + eip_5202_bytecode
+    )
+
+
+def _hex_round_trip_verify(deploy_bytecode):
+    assert deploy_bytecode[0] == int(bytes.fromhex("61").hex(), 16)
+    assert int(deploy_bytecode[1:3].hex(), 16) == int(
+        len(deploy_bytecode[DEPLOY_PREAMBLE_BYTE_LENGTH:]).to_bytes(2, "big").hex(), 16
+    )
+    assert deploy_bytecode[3:DEPLOY_PREAMBLE_BYTE_LENGTH].hex() == bytes.fromhex("3d81600a3d39f3").hex()
+    bytecode = deploy_bytecode[DEPLOY_PREAMBLE_BYTE_LENGTH:]
+    assert bytecode[0] == int(bytes.fromhex("fe").hex(), 16)
+    assert bytecode[1] == int(bytes.fromhex("71").hex(), 16)
+    assert bytecode[2] == int(bytes.fromhex("00").hex(), 16)
+
+
+def _report(name, baseline, codec):
+    logger.info(
+        f"{name}: {baseline / ITERATIONS * 1e6:.2f}us -> {codec / ITERATIONS * 1e6:.2f}us "
+        f"({baseline / codec:.1f}x)"
+    )
+
+
+def main():
+    initcode = os.urandom(INITCODE_LENGTH)
+    initcode_hex = "0x" + initcode.hex()
+    deploy_bytecode = construct_blueprint_deploy_bytecode(initcode_hex)
+    blueprint = deploy_bytecode[DEPLOY_PREAMBLE_BYTE_LENGTH:]
+
+    logger.info(f"Initcode: {INITCODE_LENGTH} bytes, {ITERATIONS} iterations")
+
+    _report(
+        "construct (hex)",
+        timeit.timeit(lambda: _hex_round_trip_construct(initcode_hex), number=ITERATIONS),
+        timeit.timeit(lambda: construct_blueprint_deploy_bytecode(initcode_hex), number=ITERATIONS),
+    )
+    _report(
+        "construct (bytes)",
+        timeit.timeit(lambda: _hex_round_trip_construct(initcode_hex), number=ITERATIONS),
+        timeit.timeit(lambda: construct_blueprint_deploy_bytecode(initcode), number=ITERATIONS),
+    )
+    _report(
+        "verify deploy bytecode",
+        timeit.timeit(lambda: _hex_round_trip_verify(deploy_bytecode), number=ITERATIONS),
+        timeit.timeit(lambda: verify_blueprint_deploy_preamble(deploy_bytecode), number=ITERATIONS),
+    )
+    logger.info(
+        f"parse blueprint: {timeit.timeit(lambda: parse_eip5202_blueprint(blueprint), number=ITERATIONS) / ITERATIONS * 1e6:.2f}us"
+    )
+    logger.info(
+        f"verify blueprint: {timeit.timeit(lambda: verify_eip522_blueprint(blueprint), number=ITERATIONS) / ITERATIONS * 1e6:.2f}us"
+    )
@@ -0,0 +1,54 @@
+import statistics
+import subprocess
+import sys
+import time
+
+# Cold start of the offline CLI, measured as the wall time of a fresh interpreter
+# running each subcommand. The `import ape` row is the baseline the CLI avoids.
+RUNS = 10
+TARGET_MILLISECONDS = 200
+
+SENDER = "0x6FB824b56210c67706AA39D4443bebB1d7eA1386"
+SEALABLES = "0x889edC2eDab5f40e902b864aD4d7AdE8E412F9B1,0x0De4Ea0184c2ad0BacA7183356Aea5B8d5Bf5c6e"
+
+COMMANDS = {
+    "python (empty)": [sys.executable, "-c", "pass"],
+    "import ape": [sys.executable, "-c", "from ape import networks; networks.ethereum"],
+    "validate-config": [
+        sys.executable, "-m", "utils.cli", "validate-config",
+        "--sealing-committee", SENDER,
+        "--seal-duration-seconds", "518400",
+        "--sealables", SEALABLES,
+        "--expiry-timestamp", str(int(time.time()) + 60 * 60 * 24 * 30),
+    ],
+    "blueprint build": [sys.executable, "-m", "utils.cli", "blueprint", "build", "--bytecode", "0x" + "60" * 4096],
+    "blueprint verify": [
+        sys.executable, "-m", "utils.cli", "blueprint", "verify",
+        "0x61100c3d81600a3d39f3fe7100" + "60" * 4105,
+    ],
+    "create-address": [sys.executable, "-m", "utils.cli", "create-address", "--sender", SENDER, "--nonce", "7"],
+    "calldata seal": [sys.executable, "-m", "utils.cli", "calldata", "seal", "--sealables", SEALABLES],
+}
+
+
+def measure(command) -> float:
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    print(f"median of {RUNS} runs, target {TARGET_MILLISECONDS}ms")
+    for name, command in COMMANDS.items():
+        milliseconds = measure(command)
+        status = "" if name.startswith(("python", "import")) else (
+            "ok" if milliseconds < TARGET_MILLISECONDS else "SLOW"
+        )
+        print(f"{name:>20}: {milliseconds:8.1f}ms {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+from ape import project, accounts, chain
+from ape.logging import logger
+
+from utils.blueprint import construct_blueprint_deploy_bytecode, deploy_blueprint
+from utils.constants import MAX_EXPIRY_PERIOD_SECONDS, MAX_SEALABLES
+
+SEAL_DURATION_SECONDS = 60 * 60 * 24 * 7
+GETTERS = [
+    "get_sealing_committee",
+    "get_seal_duration_seconds",
+    "get_sealables",
+    "get_expiry_timestamp",
+    "is_expired",
+]
+
+
+def measure(factory, container, deployer, sealing_committee, n) -> dict:
+    sealables = [project.SealableMock.deploy(False, False, sender=deployer) for _ in range(n)]
+    create_tx = factory.create_gate_seal(
+        sealing_committee,
+        SEAL_DURATION_SECONDS,
+        sealables,
+        chain.pending_timestamp + MAX_EXPIRY_PERIOD_SECONDS,
+        sender=deployer,
+    )
+    gate_seal = container.at(create_tx.events[0].gate_seal)
+    result = {"create": create_tx.gas_used}
+    for getter in GETTERS:
+        result[getter] = getattr(gate_seal, getter).estimate_gas_cost()
+    result["seal"] = gate_seal.seal(sealables, sender=sealing_committee).gas_used
+    return result
+
+
+def main():
+    deployer = accounts.test_accounts[0]
+    sealing_committee = accounts.test_accounts[1]
+
+    blueprint_address = deploy_blueprint(
+        deployer,
+        construct_blueprint_deploy_bytecode(project.GateSeal.contract_type.deployment_bytecode.bytecode),
+    )
+    blueprint_factory = project.GateSealFactory.deploy(blueprint_address, sender=deployer)
+    implementation = project.GateSealClone.deploy(sender=deployer)
+    clone_factory = project.GateSealCloneFactory.deploy(implementation, sender=deployer)
+    logger.info(f"One-off GateSealClone implementation deploy gas: {implementation.receipt.gas_used}")
+
+    for n in [1, MAX_SEALABLES]:
+        blueprint = measure(blueprint_factory, project.GateSeal, deployer, sealing_committee, n)
+        clone = measure(clone_factory, project.GateSealClone, deployer, sealing_committee, n)
+
+        logger.info(f"{n} sealable(s)")
+        logger.info(f"{'':>26} | {'blueprint':>10} | {'clone':>10} | {'difference':>10}")
+        for key in blueprint:
+            logger.info(f"{key:>26} | {blueprint[key]:>10} | {clone[key]:>10} | {clone[key] - blueprint[key]:>+10}")
+
+        # GateSeals are rotated at least once a year and sealed at most once per rotation;
+        # getters are only called on-chain by other contracts, if ever
+        creation_savings = blueprint["create"] - clone["create"]
+        seal_overhead = clone["seal"] - blueprint["seal"]
+        logger.info(
+            f"clone saves {creation_savings} gas per rotation and costs {seal_overhead} more gas per seal; "
+            f"{'clones are cheaper' if creation_savings > seal_overhead else 'blueprints are cheaper'} "
+            f"even if every GateSeal is used"
+        )
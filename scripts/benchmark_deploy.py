@@ -0,0 +1,95 @@
+import os
+import tempfile
+import time
+from ape import accounts, chain, networks, project
+from ape.logging import logger
+
+from utils.blueprint import construct_blueprint_deploy_bytecode, deploy_blueprint
+from utils.constants import MAX_EXPIRY_PERIOD_SECONDS, MAX_SEALABLES
+from utils.env import load_env_variable
+from utils.pipeline import (
+    Journal,
+    NonceManager,
+    ape_signer,
+    build_deployment_plan,
+    execute_plan,
+    get_plan_id,
+)
+from utils.sender import FeeBumpingSender, fee_policy_from_env
+
+DEFAULT_SEALS = 5
+
+
+def get_seals(n, deployer, sealing_committee):
+    sealables = [
+        project.SealableMock.deploy(False, False, sender=deployer).address
+        for _ in range(MAX_SEALABLES)
+    ]
+    return [
+        {
+            "sealing_committee": sealing_committee.address,
+            "seal_duration_seconds": 60 * 60 * 24 * 7,
+            "sealables": sealables,
+            "expiry_timestamp": chain.pending_timestamp + MAX_EXPIRY_PERIOD_SECONDS - 60 * 60,
+        }
+        for _ in range(n)
+    ]
+
+
+def deploy_sequentially(deployer, seals):
+    blueprint_address = deploy_blueprint(
+        deployer,
+        construct_blueprint_deploy_bytecode(
+            project.GateSeal.contract_type.deployment_bytecode.bytecode
+        ),
+    )
+    factory = project.GateSealFactory.deploy(blueprint_address, sender=deployer)
+    for seal in seals:
+        factory.create_gate_seal(
+            seal["sealing_committee"],
+            seal["seal_duration_seconds"],
+            seal["sealables"],
+            seal["expiry_timestamp"],
+            sender=deployer,
+        )
+
+
+def deploy_pipelined(deployer, seals):
+    provider = networks.active_provider
+    steps = build_deployment_plan(
+        deployer.address,
+        NonceManager(deployer.nonce),
+        project.GateSeal.contract_type.deployment_bytecode.bytecode,
+        project.GateSealFactory.contract_type.deployment_bytecode.bytecode,
+        seals,
+    )
+    with tempfile.TemporaryDirectory() as journal_directory:
+        journal = Journal(os.path.join(journal_directory, "journal.json"))
+        journal.begin(get_plan_id(steps), steps[0].nonce)
+        sender = FeeBumpingSender(
+            provider.make_request,
+            ape_signer(deployer, provider.network.ecosystem),
+            deployer.address,
+            provider.chain_id,
+            fee_policy_from_env(),
+            journal,
+        )
+        execute_plan(steps, sender)
+
+
+def main():
+    n = int(load_env_variable("SEALS", required=False) or DEFAULT_SEALS)
+    deployer = accounts.test_accounts[0]
+    seals = get_seals(n, deployer, accounts.test_accounts[1])
+
+    logger.info(f"Deploying blueprint, factory and {n} GateSeals")
+
+    start = time.perf_counter()
+    deploy_sequentially(deployer, seals)
+    sequential = time.perf_counter() - start
+    logger.info(f"sequential: {sequential:.2f}s")
+
+    start = time.perf_counter()
+    deploy_pipelined(deployer, seals)
+    pipelined = time.perf_counter() - start
+    logger.info(f"pipelined: {pipelined:.2f}s ({sequential / pipelined:.1f}x)")
@@ -0,0 +1,45 @@
+import os
+from ape import accounts, chain
+from ape.logging import logger
+
+from utils.blueprint import construct_blueprint_deploy_bytecode, deploy_blueprint
+from utils.build import get_artifact, get_contract_container
+from utils.constants import MAX_EXPIRY_PERIOD_SECONDS, MAX_SEALABLES
+
+# Measures the gas `create_gate_seal` costs with the GateSeal index of the current factory
+# against the audited factory without it, both creating from the same blueprint on the local node.
+
+GATE_SEALS = int(os.getenv("GATE_SEALS") or 5)
+
+
+def _create_gas(factory, deployer, sealing_committee, sealables) -> list[int]:
+    return [
+        factory.create_gate_seal(
+            sealing_committee,
+            60 * 60 * 24 * 7,
+            sealables,
+            chain.pending_timestamp + MAX_EXPIRY_PERIOD_SECONDS - 60 * 60,
+            sender=deployer,
+        ).gas_used
+        for _ in range(GATE_SEALS)
+    ]
+
+
+def main():
+    deployer, sealing_committee = accounts.test_accounts[0], accounts.test_accounts[1]
+    sealable_mock = get_contract_container("SealableMock")
+    sealables = [sealable_mock.deploy(False, False, sender=deployer).address for _ in range(MAX_SEALABLES)]
+    blueprint = deploy_blueprint(deployer, construct_blueprint_deploy_bytecode(get_artifact("GateSeal")["bytecode"]))
+
+    legacy = get_contract_container("GateSealFactory", legacy=True).deploy(blueprint, sender=deployer)
+    current = get_contract_container("GateSealFactory").deploy(blueprint, sender=deployer)
+
+    legacy_gas = _create_gas(legacy, deployer, sealing_committee, sealables)
+    current_gas = _create_gas(current, deployer, sealing_committee, sealables)
+
+    logger.info(f"{GATE_SEALS} GateSeals of {MAX_SEALABLES} sealables from each factory")
+    logger.info(
+        f"first create_gate_seal: {legacy_gas[0]} -> {current_gas[0]} gas (+{current_gas[0] - legacy_gas[0]})"
+    )
+    for index, (before, after) in enumerate(zip(legacy_gas[1:], current_gas[1:]), start=1):
+        logger.info(f"create_gate_seal #{index}: {before} -> {after} gas (+{after - before})")
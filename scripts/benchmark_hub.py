@@ -0,0 +1,62 @@
+from ape import project, accounts, chain
+from ape.logging import logger
+
+from utils.blueprint import construct_blueprint_deploy_bytecode, deploy_blueprint
+from utils.constants import MAX_EXPIRY_PERIOD_SECONDS, MAX_SEALABLES
+
+SEAL_DURATION_SECONDS = 60 * 60 * 24 * 7
+
+
+def measure_blueprint(deployer, sealing_committee, sealables) -> tuple[int, int]:
+    blueprint_address = deploy_blueprint(
+        deployer,
+        construct_blueprint_deploy_bytecode(project.GateSeal.contract_type.deployment_bytecode.bytecode),
+    )
+    factory = project.GateSealFactory.deploy(blueprint_address, sender=deployer)
+    create_tx = factory.create_gate_seal(
+        sealing_committee,
+        SEAL_DURATION_SECONDS,
+        sealables,
+        chain.pending_timestamp + MAX_EXPIRY_PERIOD_SECONDS,
+        sender=deployer,
+    )
+    gate_seal = project.GateSeal.at(create_tx.events[0].gate_seal)
+    seal_tx = gate_seal.seal(sealables, sender=sealing_committee)
+    return create_tx.gas_used, seal_tx.gas_used
+
+
+def measure_hub(hub, admin, sealing_committee, sealables) -> tuple[int, int]:
+    create_tx = hub.create_gate_seal(
+        sealing_committee,
+        SEAL_DURATION_SECONDS,
+        sealables,
+        chain.pending_timestamp + MAX_EXPIRY_PERIOD_SECONDS,
+        sender=admin,
+    )
+    seal_tx = hub.seal(create_tx.events[0].gate_seal_id, sealables, sender=sealing_committee)
+    return create_tx.gas_used, seal_tx.gas_used
+
+
+def main():
+    deployer = accounts.test_accounts[0]
+    sealing_committee = accounts.test_accounts[1]
+
+    hub = project.GateSealHub.deploy(deployer, sender=deployer)
+    logger.info(f"GateSealHub deploy gas: {hub.receipt.gas_used}")
+    # the first GateSeal pays for initializing the counter
+    measure_hub(hub, deployer, sealing_committee, [project.SealableMock.deploy(False, False, sender=deployer)])
+
+    logger.info(f"{'sealables':>10} | {'create (blueprint)':>18} | {'create (hub)':>12} | {'seal (blueprint)':>16} | {'seal (hub)':>10}")
+    for n in [1, 2, MAX_SEALABLES]:
+        blueprint_create, blueprint_seal = measure_blueprint(
+            deployer,
+            sealing_committee,
+            [project.SealableMock.deploy(False, False, sender=deployer) for _ in range(n)],
+        )
+        hub_create, hub_seal = measure_hub(
+            hub,
+            deployer,
+            sealing_committee,
+            [project.SealableMock.deploy(False, False, sender=deployer) for _ in range(n)],
+        )
+        logger.info(f"{n:>10} | {blueprint_create:>18} | {hub_create:>12} | {blueprint_seal:>16} | {hub_seal:>10}")
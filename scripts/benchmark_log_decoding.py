@@ -0,0 +1,123 @@
+import os
+import timeit
+from ape import networks, project
+from ape.logging import logger
+
+from utils.abi import decode_address, decode_uint256, encode_address, encode_uint256
+from utils.logs import (
+    SealedEvent,
+    decode_gate_seal_created_logs,
+    decode_sealed_logs,
+    get_gate_seal_created_topic,
+    get_sealed_topic,
+)
+
+# Compares decoding GateSealCreated and Sealed logs with utils/logs.py against the generic
+# path of ape, i.e. what `transaction.events` does, on synthetic `eth_getLogs` results.
+
+LOGS = int(os.getenv("LOGS") or 5_000)
+ROUNDS = 3
+
+
+# the previous per-log decoder of utils/watcher.py, kept as a baseline
+def _per_log_decode_sealed(logs):
+    topic = get_sealed_topic()
+    events = []
+    for log in logs:
+        if log["topics"][:1] != [topic]:
+            continue
+        data = bytes.fromhex(log["data"][2:])
+        events.append(
+            SealedEvent(
+                decode_address(data, 0),
+                decode_address(data, 32),
+                decode_uint256(data, 64),
+                decode_address(data, 96),
+                decode_uint256(data, 128),
+            )
+        )
+    return events
+
+
+def _random_address() -> str:
+    return "0x" + os.urandom(20).hex()
+
+
+def _log(index: int, address: str, topic: str, data: bytes) -> dict:
+    return {
+        "address": address,
+        "topics": [topic],
+        "data": "0x" + data.hex(),
+        "blockNumber": hex(index // 10),
+        "blockHash": "0x" + os.urandom(32).hex(),
+        "transactionHash": "0x" + os.urandom(32).hex(),
+        "transactionIndex": hex(index % 10),
+        "logIndex": hex(index % 10),
+        "removed": False,
+    }
+
+
+def _sealed_logs(n: int) -> list[dict]:
+    gate_seal, committee = _random_address(), _random_address()
+    return [
+        _log(
+            index,
+            gate_seal,
+            get_sealed_topic(),
+            encode_address(gate_seal)
+            + encode_address(committee)
+            + encode_uint256(7 * 24 * 60 * 60)
+            + encode_address(_random_address())
+            + encode_uint256(1_700_000_000 + index),
+        )
+        for index in range(n)
+    ]
+
+
+def _created_logs(n: int) -> list[dict]:
+    factory = _random_address()
+    return [
+        _log(index, factory, get_gate_seal_created_topic(), encode_address(_random_address()))
+        for index in range(n)
+    ]
+
+
+def _time(decode) -> float:
+    return min(timeit.repeat(decode, number=1, repeat=ROUNDS)) / LOGS
+
+
+def _report(name, baseline, decoder):
+    logger.info(f"{name}: {baseline * 1e6:.2f}us -> {decoder * 1e6:.2f}us per log ({baseline / decoder:.1f}x)")
+
+
+def main():
+    ecosystem = networks.ethereum
+    sealed_abi = project.GateSeal.contract_type.events["Sealed"]
+    created_abi = project.GateSealFactory.contract_type.events["GateSealCreated"]
+    sealed_logs, created_logs = _sealed_logs(LOGS), _created_logs(LOGS)
+
+    logger.info(f"{LOGS} logs of each event, best of {ROUNDS} rounds")
+
+    sealed = _time(lambda: decode_sealed_logs(sealed_logs))
+    _report(
+        "Sealed (ape)",
+        _time(lambda: [(log.sealable, log.sealed_at) for log in ecosystem.decode_logs(sealed_logs, sealed_abi)]),
+        sealed,
+    )
+    _report("Sealed (per log)", _time(lambda: _per_log_decode_sealed(sealed_logs)), sealed)
+    _report(
+        "GateSealCreated (ape)",
+        _time(lambda: [log.gate_seal for log in ecosystem.decode_logs(created_logs, created_abi)]),
+        _time(lambda: decode_gate_seal_created_logs(created_logs)),
+    )
+
+    columns = decode_sealed_logs(sealed_logs)
+    assert columns.events() == _per_log_decode_sealed(sealed_logs), "decoders disagree"
+    column_bytes = (
+        len(columns.gate_seals)
+        + len(columns.sealed_by)
+        + len(columns.sealables)
+        + columns.sealed_for.itemsize * len(columns.sealed_for)
+        + columns.sealed_at.itemsize * len(columns.sealed_at)
+    )
+    logger.info(f"Sealed columns: {column_bytes / LOGS:.0f} bytes per log")
@@ -1,14 +1,18 @@
 import sys
 import json
-from ape import project, accounts, chain, networks
+from ape import accounts, chain, networks
 from ape.logging import logger
 from eth_utils.address import to_checksum_address
+from utils.build import get_contract_container
 from utils.constants import MAX_EXPIRY_PERIOD_SECONDS
 from utils.env import load_env_variable
 from utils.helpers import construct_deployed_filename
+from utils.instrumentation import instrument_from_env, phase
 
 
 def main():
+    instrument_from_env()
+
     factory_address = load_env_variable("FACTORY")
 
     deployed_filename = construct_deployed_filename(factory_address, "factory", check=True)
@@ -16,9 +20,10 @@ def main():
     with open(deployed_filename, "r") as deployed_file:
         deployed_data = json.load(deployed_file)
 
-    factory = project.GateSealFactory.at(to_checksum_address(factory_address))
+    factory = get_contract_container("GateSealFactory").at(to_checksum_address(factory_address))
 
-    assert factory.get_blueprint() == deployed_data["blueprint"]
+    with phase("checks"):
+        assert factory.get_blueprint() == deployed_data["blueprint"]
     logger.success("Onchain blueprint matches JSON")
 
     logger.info("Simulating GateSeal flow...")
@@ -26,7 +31,7 @@ def main():
     deployer = accounts.test_accounts[0]
     unpausable = False
     should_revert = False
-    sealable = project.SealableMock.deploy(unpausable, should_revert, sender=deployer)
+    sealable = get_contract_container("SealableMock").deploy(unpausable, should_revert, sender=deployer)
     logger.info("Deployed SealableMock")
 
     sealing_committee = deployer
@@ -35,18 +40,19 @@ def main():
     expiry_timestamp = chain.pending_timestamp + MAX_EXPIRY_PERIOD_SECONDS
 
     logger.info("Creating GateSeal...")
-    tx = factory.create_gate_seal(
-        sealing_committee,
-        seal_duration_seconds,
-        sealables,
-        expiry_timestamp,
-        sender=deployer,
-    )
+    with phase("create gate seal"):
+        tx = factory.create_gate_seal(
+            sealing_committee,
+            seal_duration_seconds,
+            sealables,
+            expiry_timestamp,
+            sender=deployer,
+        )
     logger.info("GateSeal deployed!")
 
     gate_seal_address = tx.events[0].gate_seal
 
-    gate_seal = project.GateSeal.at(gate_seal_address)
+    gate_seal = get_contract_container("GateSeal").at(gate_seal_address)
 
     logger.info("Checking getters...")
     assert gate_seal.get_sealing_committee() == sealing_committee
@@ -61,7 +67,8 @@ def main():
     logger.info("Sealing...")
     assert not sealable.isPaused()
 
-    seal_tx = gate_seal.seal(sealables, sender=deployer)
+    with phase("seal"):
+        seal_tx = gate_seal.seal(sealables, sender=deployer)
     logger.success("Sealed")
 
     assert gate_seal.is_expired()
@@ -1,20 +1,24 @@
 import json
 import sys
-from ape import project, accounts, chain, networks
+from ape import accounts, chain, networks
 from ape.logging import logger
 from eth_utils.address import to_checksum_address
+from utils.build import get_contract_container
 from utils.env import load_env_variable
 from utils.helpers import construct_deployed_filename
+from utils.instrumentation import instrument_from_env, phase
 
 
 def main():
+    instrument_from_env()
+
     gate_seal_address = load_env_variable("GATE_SEAL")
 
     if not gate_seal_address:
         logger.error("GATE_SEAL not found")
         sys.exit()
 
-    gate_seal = project.GateSeal.at(to_checksum_address(gate_seal_address))
+    gate_seal = get_contract_container("GateSeal").at(to_checksum_address(gate_seal_address))
 
     deployed_filename = construct_deployed_filename(gate_seal_address, "gateseal", check=True)
 
@@ -22,17 +26,18 @@ def main():
         deployed_data = json.load(deployed_file)
 
 
-    assert gate_seal.get_sealing_committee() == deployed_data["params"]["sealing_committee"]
-    logger.success("sealing_committee matches!")
+    with phase("checks"):
+        assert gate_seal.get_sealing_committee() == deployed_data["params"]["sealing_committee"]
+        logger.success("sealing_committee matches!")
 
-    assert gate_seal.get_seal_duration_seconds() == deployed_data["params"]["seal_duration_seconds"]
-    logger.success("seal_duration_seconds matches!")
+        assert gate_seal.get_seal_duration_seconds() == deployed_data["params"]["seal_duration_seconds"]
+        logger.success("seal_duration_seconds matches!")
 
-    assert gate_seal.get_sealables() == deployed_data["params"]["sealables"]
-    logger.success("sealables matches!")
+        assert gate_seal.get_sealables() == deployed_data["params"]["sealables"]
+        logger.success("sealables matches!")
 
-    assert gate_seal.get_expiry_timestamp() == deployed_data["params"]["expiry_timestamp"]
-    logger.success("expiry_timestamp matches!")
+        assert gate_seal.get_expiry_timestamp() == deployed_data["params"]["expiry_timestamp"]
+        logger.success("expiry_timestamp matches!")
 
     # simulating GateSeal flow
 
@@ -41,7 +46,8 @@ def main():
         sealables = gate_seal.get_sealables()
 
         expiry_timestamp = chain.pending_timestamp
-        gate_seal.seal(sealables)
+        with phase("seal"):
+            gate_seal.seal(sealables)
         logger.success("Sealed")
 
         assert gate_seal.is_expired()
@@ -49,14 +55,14 @@ def main():
 
         logger.success(f"Expired")
         for sealable in sealables:
-            assert project.SealableMock.at(sealable).isPaused()
+            assert get_contract_container("SealableMock").at(sealable).isPaused()
 
         logger.success("Sealables paused")
         networks.active_provider.set_timestamp(expiry_timestamp + gate_seal.get_seal_duration_seconds())
         chain.mine()
 
         for sealable in sealables:
-            assert not project.SealableMock.at(sealable).isPaused()
+            assert not get_contract_container("SealableMock").at(sealable).isPaused()
 
         logger.success(f"Sealables unpaused in {gate_seal.get_seal_duration_seconds()}")
 
@@ -0,0 +1,81 @@
+import asyncio
+import sys
+import time
+from ape import networks
+from ape.logging import logger
+
+from utils.async_rpc import AsyncRpc
+from utils.env import load_env_variable
+from utils.helpers import get_deployed_network, load_deployed_entries
+from utils.instrumentation import instrument_from_env, phase
+from utils.permissions import (
+    check_permissions,
+    find_drift,
+    get_active_gate_seals,
+    get_expiry_failures,
+    get_gate_seal_pairs,
+    get_permissions_state_filename,
+    load_permissions_state,
+    load_probes,
+    save_permissions_state,
+)
+
+# Checks that every active GateSeal in `deployed/<network>/gateseal` may still pause its sealables,
+# see utils/permissions.py. PROBES optionally points to the probe config, INTERVAL_SECONDS keeps
+# re-checking on a schedule instead of exiting after a single check.
+
+
+async def _check(uri: str, entries: list[dict], default_probe, probes) -> tuple:
+    async with AsyncRpc(uri) as rpc:
+        latest = await rpc.request("eth_getBlockByNumber", ["latest", False])
+        block, now = latest["number"], int(latest["timestamp"], 16)
+        active, errors = await get_active_gate_seals(rpc, [entry["gate_seal"] for entry in entries], now, block)
+        pairs = get_gate_seal_pairs([entry for entry in entries if entry["gate_seal"] in active])
+        checks = await check_permissions(rpc, pairs, default_probe, probes, block)
+        # a GateSeal whose expiry is unknown is reported rather than taken for expired
+        return block, active, get_expiry_failures(entries, errors) + checks
+
+
+def run_check(uri: str, network: str, default_probe, probes) -> bool:
+    entries = load_deployed_entries(network, "gateseal")
+    with phase("check"):
+        block, active, checks = asyncio.run(_check(uri, entries, default_probe, probes))
+
+    state_filename = get_permissions_state_filename(network)
+    drift = find_drift(checks, load_permissions_state(state_filename))
+    save_permissions_state(state_filename, checks)
+
+    for line in drift:
+        logger.warning(line)
+    permitted = all(check.permitted for check in checks)
+    summary = (
+        f"{sum(bool(check.permitted) for check in checks)}/{len(checks)} pairs of "
+        f"{len(active)} active GateSeals permitted at block {int(block, 16)}"
+    )
+    if permitted:
+        logger.success(summary)
+    else:
+        logger.error(summary)
+    return permitted
+
+
+def main():
+    instrument_from_env()
+
+    network = get_deployed_network(check=True)
+    default_probe, probes = load_probes(load_env_variable("PROBES", required=False))
+    interval = load_env_variable("INTERVAL_SECONDS", required=False)
+    uri = networks.active_provider.http_uri
+
+    if not interval:
+        if not run_check(uri, network, default_probe, probes):
+            sys.exit(1)
+        return
+
+    while True:
+        try:
+            run_check(uri, network, default_probe, probes)
+        except Exception as error:
+            # a flaky endpoint must not stop the schedule
+            logger.error(f"Check failed: {error}")
+        time.sleep(int(interval))
@@ -0,0 +1,68 @@
+import json
+import os
+from ape import project, accounts, chain
+from ape.logging import logger
+
+from utils.blueprint import construct_blueprint_deploy_bytecode, send_blueprint_deploy_transaction
+from utils.build import detect_vyper_version, get_artifact, get_contract_container, get_optimization_modes
+from utils.constants import MAX_EXPIRY_PERIOD_SECONDS, MAX_SEALABLES
+from utils.env import load_env_variable
+
+
+def measure(mode, deployer, sealing_committee) -> dict:
+    gate_seal_artifact = get_artifact("GateSeal", mode)
+    factory_artifact = get_artifact("GateSealFactory", mode)
+    factory_container = get_contract_container("GateSealFactory", mode)
+    gate_seal_container = get_contract_container("GateSeal", mode)
+
+    blueprint_receipt = send_blueprint_deploy_transaction(
+        deployer, construct_blueprint_deploy_bytecode(gate_seal_artifact["bytecode"])
+    )
+    factory = factory_container.deploy(blueprint_receipt.contract_address, sender=deployer)
+
+    sealables = [
+        project.SealableMock.deploy(False, False, sender=deployer) for _ in range(MAX_SEALABLES)
+    ]
+    create_tx = factory.create_gate_seal(
+        sealing_committee,
+        60 * 60 * 24 * 7,
+        sealables,
+        chain.pending_timestamp + MAX_EXPIRY_PERIOD_SECONDS,
+        sender=deployer,
+    )
+    gate_seal = gate_seal_container.at(create_tx.events[0].gate_seal)
+    seal_tx = gate_seal.seal(sealables, sender=sealing_committee)
+
+    return {
+        "mode": mode,
+        "gate_seal_runtime_size": len(gate_seal_artifact["runtime_bytecode"]) // 2 - 1,
+        "gate_seal_initcode_size": len(gate_seal_artifact["bytecode"]) // 2 - 1,
+        "factory_runtime_size": len(factory_artifact["runtime_bytecode"]) // 2 - 1,
+        "blueprint_deploy_gas": blueprint_receipt.gas_used,
+        "create_gate_seal_gas": create_tx.gas_used,
+        "seal_gas": seal_tx.gas_used,
+    }
+
+
+def main():
+    report_filename = load_env_variable("REPORT_FILE", required=False)
+
+    with open("contracts/GateSeal.vy", "r") as source_file:
+        version = detect_vyper_version(source_file.read())
+    modes = get_optimization_modes(version)
+    logger.info(f"Comparing vyper {version} optimization modes: {', '.join(modes)}")
+
+    deployer = accounts.test_accounts[0]
+    sealing_committee = accounts.test_accounts[1]
+    report = [measure(mode, deployer, sealing_committee) for mode in modes]
+
+    columns = list(report[0].keys())
+    logger.info(" | ".join(f"{column:>24}" for column in columns))
+    for row in report:
+        logger.info(" | ".join(f"{row[column]:>24}" for column in columns))
+
+    if report_filename:
+        os.makedirs(os.path.dirname(report_filename) or ".", exist_ok=True)
+        with open(report_filename, "w") as report_file:
+            json.dump({"vyper": version, "modes": report}, report_file, indent=4)
+        logger.success(f"Report: {report_filename}")
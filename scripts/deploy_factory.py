@@ -1,7 +1,7 @@
 import sys
 import os
 import json
-from ape import networks, project
+from ape import networks
 from ape.logging import logger
 
 from utils.blueprint import (
@@ -10,42 +10,55 @@ from utils.blueprint import (
     verify_blueprint_deploy_preamble,
     verify_eip522_blueprint,
 )
+from utils.build import get_artifact, get_contract_container
 from utils.config import get_deployer, is_live_network
 from utils.env import load_env_variable
 from utils.helpers import construct_deployed_filename
+from utils.instrumentation import instrument_from_env, phase
+from utils.sender import GWEI, fee_policy_from_env, initial_fees
 
 
 def main():
+    instrument_from_env()
+
     logger.info("Loading deployer...")
     deployer = get_deployer()
     logger.success(f"Deployer: {deployer}")
 
     is_live = is_live_network()
+    # MAX_PRIORITY_FEE_GWEI and MAX_FEE_CAP_GWEI, see utils/sender.py
+    fee_policy = fee_policy_from_env()
 
     """
         DEPLOY BLUEPRINT
     """
-    gate_seal_bytecode = project.GateSeal.contract_type.deployment_bytecode.bytecode
+    gate_seal_bytecode = get_artifact("GateSeal")["bytecode"]
     blueprint_deploy_bytecode = construct_blueprint_deploy_bytecode(gate_seal_bytecode)
     verify_blueprint_deploy_preamble(blueprint_deploy_bytecode)
-    blueprint_address = deploy_blueprint(
-        deployer, blueprint_deploy_bytecode, prompt=True
-    )
+    with phase("deploy blueprint"):
+        max_fee, max_priority_fee = initial_fees(fee_policy, networks.active_provider.base_fee)
+        blueprint_address = deploy_blueprint(
+            deployer,
+            blueprint_deploy_bytecode,
+            prompt=True,
+            max_fee=max_fee,
+            max_priority_fee=max_priority_fee,
+        )
 
-    verify_eip522_blueprint(networks.active_provider.get_code(blueprint_address))
+        verify_eip522_blueprint(networks.active_provider.get_code(blueprint_address))
     logger.success(f"Blueprint deployed: {blueprint_address}")
 
     """
         DEPLOY FACTORY
     """
-    max_priority_fee = "50 gwei"
+    max_fee, max_priority_fee = initial_fees(fee_policy, networks.active_provider.base_fee)
     # etherscan_token = load_env_variable("ETHERSCAN_TOKEN", required=is_live)
     # publish = bool(etherscan_token)
 
     logger.info("Factory deploy transaction")
     logger.info(f"Blueprint: {blueprint_address}")
     logger.info(f"Deployer: {deployer}")
-    logger.info(f"Max priority fee: {max_priority_fee}")
+    logger.info(f"Max fee: {max_fee / GWEI} gwei, max priority fee: {max_priority_fee / GWEI} gwei")
     # logger.info(f"Publish: {publish}")
 
     logger.info("Proceed?")
@@ -54,14 +67,16 @@ def main():
         logger.error("Script stopped.")
         sys.exit()
 
-    factory = project.GateSealFactory.deploy(
-        blueprint_address,
-        sender=deployer,
-        max_priority_fee=max_priority_fee,
-        publish=False,
-    )
+    with phase("deploy factory"):
+        factory = get_contract_container("GateSealFactory").deploy(
+            blueprint_address,
+            sender=deployer,
+            max_fee=max_fee,
+            max_priority_fee=max_priority_fee,
+            publish=False,
+        )
 
-    assert factory.get_blueprint() == blueprint_address
+        assert factory.get_blueprint() == blueprint_address
 
     deployed_filename = construct_deployed_filename(factory.address, "factory")
     os.makedirs(os.path.dirname(deployed_filename), exist_ok=True)
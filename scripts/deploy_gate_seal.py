@@ -1,16 +1,23 @@
 import json
 import os
-from ape import project
+import sys
+from ape import chain, networks
 from ape.logging import logger
 from eth_utils.address import to_checksum_address
 
 
+from utils.build import get_contract_container
 from utils.config import get_deployer
 from utils.env import load_env_variable
 from utils.helpers import construct_deployed_filename
+from utils.instrumentation import instrument_from_env, phase
+from utils.sender import fee_policy_from_env, initial_fees
+from utils.validation import validate_gate_seal_config
 
 
 def main():
+    instrument_from_env()
+
     deployer = get_deployer()
     logger.success(f"Deployer: {deployer}")
 
@@ -20,16 +27,29 @@ def main():
     sealables = load_env_variable("SEALABLES").split(",")
     expiry_timestamp = int(load_env_variable("EXPIRY_TIMESTAMP"))
     
-    factory = project.GateSealFactory.at(to_checksum_address(factory_address))
-
-    transaction = factory.create_gate_seal(
-        sealing_committee,
-        seal_duration_seconds,
-        sealables,
-        expiry_timestamp,
-        sender=deployer,
-        max_priority_fee="5 gwei"
+    # catch what the GateSeal constructor would revert on before paying for the transaction
+    errors = validate_gate_seal_config(
+        sealing_committee, seal_duration_seconds, sealables, expiry_timestamp, chain.pending_timestamp
     )
+    if errors:
+        for error in errors:
+            logger.error(error)
+        sys.exit(1)
+
+    factory = get_contract_container("GateSealFactory").at(to_checksum_address(factory_address))
+
+    max_fee, max_priority_fee = initial_fees(fee_policy_from_env(), networks.active_provider.base_fee)
+
+    with phase("create gate seal"):
+        transaction = factory.create_gate_seal(
+            sealing_committee,
+            seal_duration_seconds,
+            sealables,
+            expiry_timestamp,
+            sender=deployer,
+            max_fee=max_fee,
+            max_priority_fee=max_priority_fee,
+        )
 
     gate_seal_address = transaction.events[0].gate_seal
     logger.success(f"GateSeal deployed to {gate_seal_address}")
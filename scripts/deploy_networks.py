@@ -0,0 +1,95 @@
+import contextlib
+import sys
+import tempfile
+from ape import accounts, networks
+from ape.logging import logger
+
+from utils.build import get_artifact
+from utils.config import is_live_chain
+from utils.env import load_env_variable
+from utils.helpers import write_deployed_entries
+from utils.instrumentation import instrument_from_env, phase
+from utils.orchestrator import (
+    deploy_networks,
+    get_local_targets,
+    get_targets,
+    load_manifest,
+    prepare_networks,
+    start_local_nodes,
+)
+from utils.pipeline import JOURNAL_DIRECTORY, ape_signer
+from utils.sender import GWEI, fee_policy_from_env
+
+# Deploys the blueprint, the factory and the GateSeals of every network in MANIFEST at once,
+# see utils/orchestrator.py for the manifest. With LOCAL_NODES=true, every network is deployed
+# to a hardhat node of its own instead and the deployed files go to `deployed/<network>-local`.
+
+
+def main():
+    instrument_from_env()
+
+    manifest = load_manifest(load_env_variable("MANIFEST"))
+    local = load_env_variable("LOCAL_NODES", required=False) == "true"
+    # MAX_PRIORITY_FEE_GWEI and MAX_FEE_CAP_GWEI, see utils/sender.py
+    fee_policy = fee_policy_from_env()
+
+    with contextlib.ExitStack() as stack:
+        if local:
+            with phase("start nodes"):
+                uris = stack.enter_context(start_local_nodes(len(manifest["networks"])))
+            targets = get_local_targets(manifest, uris)
+            # the nodes start from genesis, so there is nothing to resume
+            journal_directory = stack.enter_context(tempfile.TemporaryDirectory())
+        else:
+            targets = get_targets(manifest)
+            journal_directory = JOURNAL_DIRECTORY
+
+        is_live = any(is_live_chain(target.chain_id) for target in targets)
+        deployer = accounts.load(load_env_variable("DEPLOYER")) if is_live else accounts.test_accounts[0]
+        logger.success(f"Deployer: {deployer}")
+
+        with phase("prepare"):
+            plans = prepare_networks(
+                targets,
+                deployer.address,
+                get_artifact("GateSeal")["bytecode"],
+                get_artifact("GateSealFactory")["bytecode"],
+                fee_policy,
+                journal_directory,
+            )
+
+        for plan in plans:
+            if plan.resumed:
+                logger.warning(f"{plan.target.name}: resuming deployment from {plan.journal.filename}")
+            for step in plan.steps:
+                logger.info(f"{plan.target.name}: {step.name}: nonce {step.nonce}, deploys {step.contract_address}")
+            logger.info(
+                f"{plan.target.name}: max fee {plan.max_fee / GWEI} gwei, "
+                f"max priority fee {plan.max_priority_fee / GWEI} gwei"
+            )
+
+        if is_live:
+            logger.info("Proceed?")
+            proceed = input("> ")
+            if proceed.lower() not in ["y", "yes"]:
+                logger.error("Script stopped.")
+                sys.exit()
+
+        with phase("deploy"):
+            entries, errors = deploy_networks(
+                plans, ape_signer(deployer, networks.ethereum), deployer.address
+            )
+
+        if errors:
+            for name, error in errors.items():
+                logger.error(f"{name}: {error}")
+            logger.error("Nothing written, run again to resume from the journals")
+            sys.exit(1)
+
+        write_deployed_entries(entries)
+        for filename in sorted(entries):
+            logger.success(f"Deployed file: {filename}")
+        for plan in plans:
+            plan.journal.archive()
+
+    logger.success(f"Deployed to {len(plans)} networks")
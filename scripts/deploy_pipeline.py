@@ -0,0 +1,124 @@
+import json
+import sys
+from ape import chain, networks
+from ape.logging import logger
+from eth_utils.address import to_checksum_address
+
+from utils.blueprint import verify_eip522_blueprint
+from utils.build import get_artifact
+from utils.config import get_deployer, is_live_network
+from utils.env import load_env_variable
+from utils.helpers import construct_deployed_filename, write_deployed_entries
+from utils.instrumentation import instrument_from_env, phase
+from utils.pipeline import (
+    Journal,
+    NonceManager,
+    ape_signer,
+    build_deployment_plan,
+    execute_plan,
+    get_created_gate_seal,
+    get_journal_filename,
+    get_plan_id,
+    get_step_receipts,
+)
+from utils.rpc import Rpc
+from utils.sender import GWEI, FeeBumpingSender, fee_policy_from_env, initial_fees
+from utils.validation import validate_manifest
+
+
+def main():
+    instrument_from_env()
+
+    logger.info("Loading deployer...")
+    deployer = get_deployer()
+    logger.success(f"Deployer: {deployer}")
+
+    # {"seals": [{"sealing_committee": ..., "seal_duration_seconds": ..., "sealables": [...], "expiry_timestamp": ...}]}
+    manifest_filename = load_env_variable("MANIFEST")
+    with open(manifest_filename, "r") as manifest_file:
+        seals = json.load(manifest_file)["seals"]
+
+    errors = validate_manifest(seals, chain.pending_timestamp)
+    if errors:
+        for index, seal_errors in errors.items():
+            for error in seal_errors:
+                logger.error(f"seals[{index}]: {error}")
+        sys.exit(1)
+
+    # MAX_PRIORITY_FEE_GWEI, MAX_FEE_CAP_GWEI and FEE_BUMP_PERCENT, see utils/sender.py
+    fee_policy = fee_policy_from_env()
+
+    provider = networks.active_provider
+    journal = Journal(get_journal_filename(provider.chain_id, deployer.address))
+    if journal.start_nonce is not None:
+        logger.warning(f"Resuming deployment from {journal.filename}")
+
+    # a resumed run lays out the plan from the nonce of the interrupted run
+    start_nonce = journal.start_nonce if journal.start_nonce is not None else deployer.nonce
+    steps = build_deployment_plan(
+        deployer.address,
+        NonceManager(start_nonce),
+        get_artifact("GateSeal")["bytecode"],
+        get_artifact("GateSealFactory")["bytecode"],
+        seals,
+    )
+    journal.begin(get_plan_id(steps), start_nonce)
+
+    max_fee, max_priority_fee = initial_fees(fee_policy, provider.base_fee)
+
+    for step in steps:
+        logger.info(f"{step.name}: nonce {step.nonce}, deploys {step.contract_address}")
+    logger.info(f"Max fee: {max_fee / GWEI} gwei, max priority fee: {max_priority_fee / GWEI} gwei")
+
+    if is_live_network():
+        logger.info("Proceed?")
+        proceed = input("> ")
+        if proceed.lower() not in ["y", "yes"]:
+            logger.error("Script stopped.")
+            sys.exit()
+
+    with phase("execute plan"):
+        sender = FeeBumpingSender(
+            provider.make_request,
+            ape_signer(deployer, provider.network.ecosystem),
+            deployer.address,
+            provider.chain_id,
+            fee_policy,
+            journal,
+        )
+        execute_plan(steps, sender)
+
+    # steps mined before a crash are not in the receipts of `execute_plan`
+    receipts = get_step_receipts(Rpc(provider.http_uri), steps, journal)
+
+    blueprint, factory, *gate_seals = steps
+    with phase("checks"):
+        verify_eip522_blueprint(provider.get_code(blueprint.contract_address))
+    logger.success(f"Blueprint deployed: {blueprint.contract_address}")
+
+    entries = {
+        construct_deployed_filename(factory.contract_address, "factory"): {
+            "factory": factory.contract_address,
+            "blueprint": blueprint.contract_address,
+            "tx_hash": receipts[factory.name]["transactionHash"],
+            "deployer": deployer.address,
+        }
+    }
+
+    for step, seal in zip(gate_seals, seals):
+        gate_seal_address = to_checksum_address(get_created_gate_seal(receipts[step.name]))
+        assert gate_seal_address == step.contract_address, f"{step.name}: unexpected address"
+        entries[construct_deployed_filename(gate_seal_address, "gateseal")] = {
+            "factory": factory.contract_address,
+            "gate_seal": gate_seal_address,
+            "tx_hash": receipts[step.name]["transactionHash"],
+            "deployer": deployer.address,
+            "params": seal,
+        }
+
+    write_deployed_entries(entries)
+    for filename in sorted(entries):
+        logger.success(f"Deployed file: {filename}")
+
+    journal.archive()
+    logger.success(f"Deployed {len(gate_seals)} GateSeals")
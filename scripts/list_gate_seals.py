@@ -0,0 +1,47 @@
+import asyncio
+from ape import networks
+from ape.logging import logger
+from eth_utils.address import to_checksum_address
+
+from utils.async_rpc import AsyncRpc, get_factory_gate_seals, get_gate_seal_states
+from utils.env import load_env_variable
+from utils.helpers import get_deployed_network, load_deployed_entries
+from utils.instrumentation import instrument_from_env, phase
+
+# Lists every GateSeal created by FACTORY with its on-chain parameters, read from the factory
+# index with concurrent batched calls instead of scanning GateSealCreated logs. Factories
+# deployed before the index fall back to the logs, scanned from the block the factory was
+# deployed in if its deployed file is around, from genesis otherwise.
+
+
+async def _read(uri: str, factory: str, tx_hash: str | None) -> list:
+    async with AsyncRpc(uri) as rpc:
+        from_block = 0
+        if tx_hash:
+            receipt = await rpc.request("eth_getTransactionReceipt", [tx_hash])
+            from_block = int(receipt["blockNumber"], 16)
+        return await get_gate_seal_states(rpc, await get_factory_gate_seals(rpc, factory, from_block=from_block))
+
+
+def _get_deploy_tx_hash(factory: str) -> str | None:
+    for entry in load_deployed_entries(get_deployed_network(check=True), "factory"):
+        if to_checksum_address(entry["factory"]) == factory:
+            return entry["tx_hash"]
+    return None
+
+
+def main():
+    instrument_from_env()
+
+    factory = to_checksum_address(load_env_variable("FACTORY"))
+
+    with phase("read"):
+        states = asyncio.run(_read(networks.active_provider.http_uri, factory, _get_deploy_tx_hash(factory)))
+
+    for state in states:
+        logger.info(
+            f"{to_checksum_address(state.address)}: committee {to_checksum_address(state.sealing_committee)}, "
+            f"{state.seal_duration_seconds}s, {len(state.sealables)} sealables, "
+            f"expires {state.expiry_timestamp}{' (expired)' if state.is_expired else ''}"
+        )
+    logger.success(f"{len(states)} GateSeals created by {factory}")
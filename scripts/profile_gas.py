@@ -0,0 +1,129 @@
+import os
+from ape import accounts, chain, networks, project
+from ape.logging import logger
+
+from utils.blueprint import construct_blueprint_deploy_bytecode, deploy_blueprint
+from utils.constants import MAX_EXPIRY_PERIOD_SECONDS, MAX_SEALABLES
+from utils.env import load_env_variable
+from utils.profiler import (
+    build_code_map,
+    fetch_struct_logs,
+    fold_stacks,
+    format_folded_stacks,
+    format_function_table,
+    format_line_table,
+    get_intrinsic_gas,
+    is_shanghai_block,
+    profile_struct_logs,
+    render_flamegraph_svg,
+    summarize_by_function,
+    summarize_by_line,
+)
+
+# Profiles the gas of transactions by source line and function of the contracts in the project.
+# Set TX_HASH to a comma-separated list of transactions to profile on the active network,
+# otherwise the script deploys a factory and profiles `create_gate_seal()` and `seal()`.
+
+PROFILE_DIRECTORY = ".cache/profiles"
+PROFILED_CONTRACTS = [
+    "GateSeal",
+    "GateSealFactory",
+    "GateSealHub",
+    "GateSealClone",
+    "GateSealCloneFactory",
+    "SealableMock",
+]
+SEAL_DURATION_SECONDS = 60 * 60 * 24 * 7
+LINE_TABLE_LIMIT = 25
+
+
+def get_code_maps() -> list:
+    code_maps = []
+    for name in PROFILED_CONTRACTS:
+        contract_type = getattr(project, name).contract_type
+        source = (project.contracts_folder / contract_type.source_id).read_text()
+        runtime_code = contract_type.runtime_bytecode.bytecode.removeprefix("0x")
+        code_maps.append((runtime_code, build_code_map(name, contract_type.pcmap.parse(), source)))
+    return code_maps
+
+
+def code_map_resolver(code_maps):
+    def resolve(address):
+        code = networks.active_provider.get_code(address).hex().removeprefix("0x")
+        # immutables are appended to the runtime code of the contract type
+        return next((code_map for runtime, code_map in code_maps if runtime and code.startswith(runtime)), None)
+
+    return resolve
+
+
+def profile_transaction(transaction_hash, code_maps):
+    provider = networks.active_provider
+    receipt = provider.get_receipt(transaction_hash)
+    transaction = receipt.transaction
+    is_create = transaction.receiver is None
+
+    struct_logs = fetch_struct_logs(provider.make_request, transaction_hash)
+    steps = profile_struct_logs(
+        struct_logs,
+        transaction.receiver,
+        receipt.contract_address,
+        code_map_resolver(code_maps),
+    )
+
+    block = provider.make_request("eth_getBlockByNumber", [hex(receipt.block_number), False])
+    intrinsic_gas = get_intrinsic_gas(bytes(transaction.data), is_create, is_shanghai_block(block))
+    execution_gas = sum(step.gas for step in steps)
+    refund = intrinsic_gas + execution_gas - receipt.gas_used
+    logger.info(
+        f"{transaction_hash}: {receipt.gas_used} gas used = "
+        f"{intrinsic_gas} intrinsic + {execution_gas} execution - {refund} refund"
+    )
+
+    maps_by_name = {code_map.name: code_map for _, code_map in code_maps}
+    logger.info("Gas by function:\n" + format_function_table(summarize_by_function(steps)))
+    logger.info(
+        "Gas by line:\n" + format_line_table(summarize_by_line(steps), maps_by_name, LINE_TABLE_LIMIT)
+    )
+
+    folded = fold_stacks(steps, intrinsic_gas)
+    os.makedirs(PROFILE_DIRECTORY, exist_ok=True)
+    filename = os.path.join(PROFILE_DIRECTORY, transaction_hash)
+    with open(f"{filename}.folded", "w") as folded_file:
+        folded_file.write(format_folded_stacks(folded))
+    with open(f"{filename}.svg", "w") as svg_file:
+        svg_file.write(render_flamegraph_svg(folded, transaction_hash))
+    logger.success(f"Flamegraph: {filename}.svg, folded stacks: {filename}.folded")
+
+
+def sample_transactions() -> list[str]:
+    deployer, sealing_committee = accounts.test_accounts[0], accounts.test_accounts[1]
+    sealables = [project.SealableMock.deploy(False, False, sender=deployer) for _ in range(MAX_SEALABLES)]
+
+    blueprint_address = deploy_blueprint(
+        deployer,
+        construct_blueprint_deploy_bytecode(project.GateSeal.contract_type.deployment_bytecode.bytecode),
+    )
+    factory = project.GateSealFactory.deploy(blueprint_address, sender=deployer)
+    create_tx = factory.create_gate_seal(
+        sealing_committee,
+        SEAL_DURATION_SECONDS,
+        sealables,
+        chain.pending_timestamp + MAX_EXPIRY_PERIOD_SECONDS,
+        sender=deployer,
+    )
+    gate_seal = project.GateSeal.at(create_tx.events[0].gate_seal)
+    seal_tx = gate_seal.seal(sealables, sender=sealing_committee)
+    return [create_tx.txn_hash, seal_tx.txn_hash]
+
+
+def main():
+    transaction_hashes = load_env_variable("TX_HASH", required=False)
+    if transaction_hashes:
+        transaction_hashes = transaction_hashes.split(",")
+    else:
+        logger.info("Profiling create_gate_seal() and seal() of a fresh factory...")
+        transaction_hashes = sample_transactions()
+
+    code_maps = get_code_maps()
+    for transaction_hash in transaction_hashes:
+        profile_transaction(transaction_hash, code_maps)
@@ -0,0 +1,248 @@
+import json
+import random
+from ape import accounts, networks, project
+from ape.logging import logger
+
+from utils.abi import encode_address, encode_create_gate_seal, encode_seal, encode_uint256, keccak
+from utils.address import compute_create_address
+from utils.blueprint import construct_blueprint_deploy_bytecode
+from utils.config import is_live_network
+from utils.constants import SECONDS_PER_DAY
+from utils.env import load_env_variable
+from utils.instrumentation import instrument_from_env, phase
+from utils.pipeline import NonceManager, ape_signer, create_gate_seal_gas_limit, get_fees
+from utils.rpc import Rpc
+from utils.scenario import (
+    BACKGROUND_DEPLOYMENT,
+    BACKGROUND_TRANSFER,
+    SEAL,
+    SentTransaction,
+    format_summary,
+    load_scenario,
+    plan_failing_sealables,
+    plan_gate_seal_sealables,
+    seal_gas_limit,
+    summarize_scenario,
+)
+
+# Runs a stress scenario from `scenarios/` on the local node, see utils/scenario.py.
+# SCENARIO is the scenario file, REPORT_FILE optionally receives the JSON report.
+
+GWEI = 10**9
+# setup transactions are not measured, so they are mined in as few blocks as possible
+SETUP_BLOCK_GAS_LIMIT = 500_000_000
+SETUP_MAX_BLOCKS = 100
+SEAL_DURATION_SECONDS = 7 * SECONDS_PER_DAY
+EXPIRY_PERIOD_SECONDS = 30 * SECONDS_PER_DAY
+TRANSFER_GAS_LIMIT = 21_000
+
+
+class Sender:
+    """
+    Signs EIP-1559 transactions of a test account with locally tracked nonces.
+    """
+
+    def __init__(self, rpc, account, chain_id, base_fee_cap):
+        self.account = account
+        self.sign = ape_signer(account, networks.active_provider.network.ecosystem)
+        self.chain_id = chain_id
+        self.base_fee_cap = base_fee_cap
+        self.nonces = NonceManager(int(rpc("eth_getTransactionCount", [account.address, "pending"]), 16))
+
+    def transaction(self, to, data, gas_limit, priority_fee, value=0) -> tuple[int, str]:
+        nonce = self.nonces.take()
+        transaction = {
+            "type": 2,
+            "chainId": self.chain_id,
+            "nonce": nonce,
+            "gas": gas_limit,
+            "maxFeePerGas": self.base_fee_cap + priority_fee,
+            "maxPriorityFeePerGas": priority_fee,
+            "value": value,
+            "data": "0x" + data.hex(),
+        }
+        if to:
+            transaction["to"] = to
+        return nonce, "0x" + self.sign(transaction).hex()
+
+
+def _initcode(contract) -> bytes:
+    return bytes.fromhex(contract.contract_type.deployment_bytecode.bytecode.removeprefix("0x"))
+
+
+def _transaction_hash(raw_transaction: str) -> str:
+    return "0x" + keccak(bytes.fromhex(raw_transaction[2:])).hex()
+
+
+def _estimate(rpc, sender, data) -> int:
+    return int(rpc("eth_estimateGas", [{"from": sender, "data": "0x" + data.hex()}]), 16) * 12 // 10
+
+
+def send_and_mine(rpc, raw_transactions: list[str], max_blocks: int) -> tuple[dict, list]:
+    """
+    Broadcasts the transactions in a single batch, then mines blocks one by one until all of them
+    are included or `max_blocks` are mined. Returns the receipts by hash and the mined blocks.
+    """
+    rpc.batch([("eth_sendRawTransaction", [raw_transaction]) for raw_transaction in raw_transactions])
+
+    pending = [_transaction_hash(raw_transaction) for raw_transaction in raw_transactions]
+    receipts = {transaction_hash: None for transaction_hash in pending}
+    blocks = []
+    while pending and len(blocks) < max_blocks:
+        rpc("evm_mine", [])
+        blocks.append(rpc("eth_getBlockByNumber", ["latest", False]))
+        for transaction_hash, receipt in zip(
+            pending, rpc.batch([("eth_getTransactionReceipt", [hash]) for hash in pending])
+        ):
+            receipts[transaction_hash] = receipt
+        pending = [transaction_hash for transaction_hash in pending if receipts[transaction_hash] is None]
+
+    return receipts, blocks
+
+
+def setup(rpc, scenario, deployer: Sender, committees: list) -> list[tuple[str, list[str], bool]]:
+    """
+    Deploys the blueprint, factories, sealable mocks and GateSeals.
+    Returns the address, sealables and whether a sealable is expected to fail for every GateSeal.
+    """
+    rpc("evm_setBlockGasLimit", [hex(SETUP_BLOCK_GAS_LIMIT)])
+    address = deployer.account.address
+    raw_transactions = []
+
+    blueprint_code = construct_blueprint_deploy_bytecode(_initcode(project.GateSeal))
+    blueprint_gas_limit = _estimate(rpc, address, blueprint_code)
+    nonce, raw_transaction = deployer.transaction(None, blueprint_code, blueprint_gas_limit, 0)
+    blueprint = compute_create_address(address, nonce)
+    raw_transactions.append(raw_transaction)
+
+    factory_code = _initcode(project.GateSealFactory) + encode_address(blueprint)
+    factory_gas_limit = _estimate(rpc, address, factory_code)
+    factories = []
+    for _ in range(scenario.factories):
+        nonce, raw_transaction = deployer.transaction(None, factory_code, factory_gas_limit, 0)
+        factories.append(compute_create_address(address, nonce))
+        raw_transactions.append(raw_transaction)
+
+    # failing mocks alternate between reverting and silently not pausing
+    failing = plan_failing_sealables(scenario)
+    mock_gas_limit = _estimate(rpc, address, _initcode(project.SealableMock) + encode_uint256(0) * 2)
+    pool = []
+    for index in range(scenario.sealable_pool):
+        unpausable = index in failing and index % 2 == 0
+        reverts = index in failing and index % 2 == 1
+        mock_code = _initcode(project.SealableMock) + encode_uint256(unpausable) + encode_uint256(reverts)
+        nonce, raw_transaction = deployer.transaction(None, mock_code, mock_gas_limit, 0)
+        pool.append(compute_create_address(address, nonce))
+        raw_transactions.append(raw_transaction)
+
+    latest_timestamp = int(rpc("eth_getBlockByNumber", ["latest", False])["timestamp"], 16)
+    expiry_timestamp = latest_timestamp + EXPIRY_PERIOD_SECONDS
+    gate_seals = []
+    for index, sealable_indexes in enumerate(plan_gate_seal_sealables(scenario)):
+        factory = factories[index % scenario.factories]
+        sealables = [pool[sealable_index] for sealable_index in sealable_indexes]
+        data = encode_create_gate_seal(
+            committees[index % len(committees)].account.address,
+            SEAL_DURATION_SECONDS,
+            sealables,
+            expiry_timestamp,
+        )
+        _, raw_transaction = deployer.transaction(factory, data, create_gate_seal_gas_limit(sealables), 0)
+        raw_transactions.append(raw_transaction)
+        # factories create GateSeals with their own nonces starting at 1
+        gate_seal = compute_create_address(factory, index // scenario.factories + 1)
+        gate_seals.append((gate_seal, sealables, any(i in failing for i in sealable_indexes)))
+
+    receipts, _ = send_and_mine(rpc, raw_transactions, SETUP_MAX_BLOCKS)
+    assert all(
+        receipt is not None and int(receipt["status"], 16) == 1 for receipt in receipts.values()
+    ), "scenario setup failed"
+    logger.success(
+        f"Deployed {scenario.factories} factories, {len(pool)} sealables and {len(gate_seals)} GateSeals"
+    )
+    return gate_seals
+
+
+def fire(rpc, scenario, gate_seals, committees: list, background: Sender) -> tuple[list, dict, list]:
+    """
+    Signs every seal and background transaction up front so that they hit the mempool together.
+    """
+    sent = []
+    seal_priority_fee = scenario.seal_priority_fee_gwei * GWEI
+    background_priority_fee = scenario.background_priority_fee_gwei * GWEI
+
+    for index, (gate_seal, sealables, expected_to_fail) in enumerate(gate_seals):
+        _, raw_transaction = committees[index % len(committees)].transaction(
+            gate_seal, encode_seal(sealables), seal_gas_limit(len(sealables)), seal_priority_fee
+        )
+        sent.append((SEAL, raw_transaction, expected_to_fail))
+
+    for _ in range(scenario.background_transfers):
+        _, raw_transaction = background.transaction(
+            committees[0].account.address, b"", TRANSFER_GAS_LIMIT, background_priority_fee, value=1
+        )
+        sent.append((BACKGROUND_TRANSFER, raw_transaction, False))
+
+    mock_code = _initcode(project.SealableMock) + encode_uint256(0) * 2
+    mock_gas_limit = _estimate(rpc, background.account.address, mock_code)
+    for _ in range(scenario.background_deployments):
+        _, raw_transaction = background.transaction(None, mock_code, mock_gas_limit, background_priority_fee)
+        sent.append((BACKGROUND_DEPLOYMENT, raw_transaction, False))
+
+    rpc("evm_setBlockGasLimit", [hex(scenario.block_gas_limit)])
+    sent_at_block = int(rpc("eth_blockNumber", []), 16)
+
+    # nodes order the mempool by fee and nonce, the broadcast order only mimics independent senders
+    random.Random(scenario.seed).shuffle(sent)
+    receipts, blocks = send_and_mine(
+        rpc, [raw_transaction for _, raw_transaction, _ in sent], scenario.max_blocks
+    )
+
+    transactions = [
+        SentTransaction(kind, _transaction_hash(raw_transaction), sent_at_block, expected_to_fail)
+        for kind, raw_transaction, expected_to_fail in sent
+    ]
+    return transactions, receipts, blocks
+
+
+def main():
+    instrument_from_env()
+
+    assert not is_live_network(), "scenarios only run on a local node"
+    scenario = load_scenario(load_env_variable("SCENARIO"))
+    report_filename = load_env_variable("REPORT_FILE", required=False)
+    logger.info(f"Running scenario {scenario.name}: {scenario.gate_seals} GateSeals")
+
+    provider = networks.active_provider
+    rpc = Rpc(provider.http_uri)
+    # the fee cap is fixed up front, so seals racing full blocks may be priced out
+    # the same way they would be with a real wallet
+    base_fee_cap, _ = get_fees(rpc, 0)
+
+    test_accounts = accounts.test_accounts
+    assert len(test_accounts) >= scenario.committees + 2, "not enough test accounts for the committees"
+    deployer = Sender(rpc, test_accounts[0], provider.chain_id, base_fee_cap)
+    committees = [
+        Sender(rpc, test_accounts[1 + index], provider.chain_id, base_fee_cap)
+        for index in range(scenario.committees)
+    ]
+    background = Sender(rpc, test_accounts[1 + scenario.committees], provider.chain_id, base_fee_cap)
+
+    initial_block_gas_limit = rpc("eth_getBlockByNumber", ["latest", False])["gasLimit"]
+    rpc("evm_setAutomine", [False])
+    try:
+        with phase("setup"):
+            gate_seals = setup(rpc, scenario, deployer, committees)
+        with phase("stress"):
+            transactions, receipts, blocks = fire(rpc, scenario, gate_seals, committees, background)
+    finally:
+        rpc("evm_setBlockGasLimit", [initial_block_gas_limit])
+        rpc("evm_setAutomine", [True])
+
+    summary = summarize_scenario(scenario, transactions, receipts, blocks)
+    logger.info(f"Scenario {scenario.name}:\n" + format_summary(summary))
+
+    if report_filename:
+        with open(report_filename, "w") as report_file:
+            json.dump(summary, report_file, indent=4)
+        logger.success(f"Report: {report_filename}")
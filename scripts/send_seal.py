@@ -0,0 +1,84 @@
+import sys
+from ape import accounts, networks, project
+from ape.logging import logger
+from eth_utils.address import to_checksum_address
+
+from utils.abi import encode_seal, keccak
+from utils.config import is_live_network
+from utils.env import load_env_variable
+from utils.instrumentation import instrument_from_env, phase
+from utils.pipeline import GAS_LIMIT_MARGIN_PERCENT, Journal, ape_signer
+from utils.rpc import Rpc
+from utils.sender import (
+    GWEI,
+    FeeBumpingSender,
+    fee_policy_from_env,
+    get_sender_journal_filename,
+)
+from utils.watcher import SealWatcher, format_report
+
+# Sends `seal()` of GATE_SEAL from the SEALER account and bumps its fees until it is included,
+# see utils/sender.py for the fee settings. SEALABLES defaults to every sealable of the GateSeal.
+# A restarted script resumes the very same transaction from the journal in `.cache/senders`,
+# a seal of the same sealables that failed or lost its nonce is sent again.
+#
+# The transaction is sent from SEALER itself, so this is a tool for test networks and for
+# committees that are an EOA. A multisig committee submits `seal()` through the multisig,
+# see scripts/watch_seal.py to follow it.
+
+
+def get_seal_name(gate_seal: str, sealables: list[str]) -> str:
+    # a seal of another subset of the sealables is another transaction
+    subset = keccak(",".join(sorted(sealable.lower() for sealable in sealables)).encode()).hex()[:8]
+    return f"seal-{gate_seal.lower()}-{subset}"
+
+
+def main():
+    instrument_from_env()
+
+    gate_seal = project.GateSeal.at(to_checksum_address(load_env_variable("GATE_SEAL")))
+    sealables = load_env_variable("SEALABLES", required=False)
+    sealables = sealables.split(",") if sealables else gate_seal.get_sealables()
+
+    if is_live_network():
+        sealer = accounts.load(load_env_variable("SEALER"))
+    else:
+        sealer = accounts.test_accounts[gate_seal.get_sealing_committee()]
+
+    policy = fee_policy_from_env()
+    logger.info(
+        f"Max priority fee: {policy.max_priority_fee / GWEI} gwei, fee cap: {policy.max_fee_cap / GWEI} gwei, "
+        f"bump: {policy.bump_percent}%"
+    )
+
+    provider = networks.active_provider
+    rpc = Rpc(provider.http_uri)
+    data = encode_seal(sealables)
+    estimate = int(
+        rpc("eth_estimateGas", [{"from": sealer.address, "to": gate_seal.address, "data": "0x" + data.hex()}]), 16
+    )
+
+    sender = FeeBumpingSender(
+        rpc,
+        ape_signer(sealer, provider.network.ecosystem),
+        sealer.address,
+        provider.chain_id,
+        policy,
+        Journal(get_sender_journal_filename(provider.chain_id, sealer.address)),
+    )
+    name = get_seal_name(gate_seal.address, sealables)
+
+    with phase("send"):
+        sender.send(name, gate_seal.address, data, estimate * (100 + GAS_LIMIT_MARGIN_PERCENT) // 100)
+        entry = sender.wait(name)
+    logger.info(f"{name}: {entry['status']} after {len(entry['attempts'])} attempt(s)")
+    if "transaction_hash" not in entry:
+        logger.error("The nonce was taken by another transaction")
+        sys.exit(1)
+
+    with phase("confirm"):
+        report = SealWatcher(rpc, gate_seal.address, entry["transaction_hash"], sealables).watch()
+    logger.info(format_report(report))
+    if not report.succeeded or not report.all_paused:
+        sys.exit(1)
+    logger.success("Every sealable is paused")
@@ -0,0 +1,132 @@
+import asyncio
+import sys
+from typing import NamedTuple
+from ape import networks
+from ape.logging import logger
+from eth_utils import keccak
+from eth_utils.address import to_checksum_address
+
+from utils.blueprint import verify_eip522_blueprint
+from utils.build import get_artifact
+from utils.bytecode import find_gate_seal_param_mismatches, get_code_layout, matches_runtime_code
+from utils.helpers import get_deployed_network, load_deployed_entries
+from utils.instrumentation import instrument_from_env, phase
+from utils.async_rpc import AsyncRpc, get_codes, get_gate_seal_states
+
+
+def _bytecode(hex_bytecode: str) -> bytes:
+    return bytes.fromhex(hex_bytecode[2:])
+
+
+class Build(NamedTuple):
+    label: str
+    initcode: bytes
+    runtime: bytes
+    layout: list
+
+
+def _builds(name: str) -> list[Build]:
+    """
+    Returns the current build and the legacy build the contracts already on chain were deployed from.
+    """
+    builds = []
+    for label, legacy in (("current", False), ("legacy", True)):
+        artifact = get_artifact(name, legacy=legacy)
+        builds.append(
+            Build(
+                label,
+                _bytecode(artifact["bytecode"]),
+                _bytecode(artifact["runtime_bytecode"]),
+                get_code_layout(artifact),
+            )
+        )
+    return builds
+
+
+def _match_builds(code: bytes, builds: list[Build]) -> tuple[bool, dict, str | None]:
+    for build in builds:
+        matches, immutables = matches_runtime_code(code, build.runtime, build.layout)
+        if matches:
+            return True, immutables, build.label
+    return False, {}, None
+
+
+def _match_blueprint(code: bytes, builds: list[Build]) -> tuple[bool, dict, str | None]:
+    try:
+        initcode = verify_eip522_blueprint(code).initcode
+    except AssertionError:
+        return False, {}, None
+    for build in builds:
+        if initcode == build.initcode:
+            return True, {}, build.label
+    return False, {}, None
+
+
+async def _fetch(uri: str, addresses: list[str], gate_seals: list[str]) -> tuple[list[bytes], list]:
+    async with AsyncRpc(uri) as rpc:
+        return await asyncio.gather(get_codes(rpc, addresses), get_gate_seal_states(rpc, gate_seals))
+
+
+def main():
+    instrument_from_env()
+
+    network = get_deployed_network(check=True)
+    factories = load_deployed_entries(network, "factory")
+    gate_seals = load_deployed_entries(network, "gateseal")
+    logger.info(f"Verifying {len(factories)} factories and {len(gate_seals)} GateSeals on {network}")
+
+    gate_seal_builds = _builds("GateSeal")
+    factory_builds = _builds("GateSealFactory")
+
+    # (address, kind, registry entry) for every contract that has to be checked
+    targets = [(entry["factory"], "factory", entry) for entry in factories]
+    targets += [(entry["blueprint"], "blueprint", entry) for entry in factories]
+    targets += [(entry["gate_seal"], "gateseal", entry) for entry in gate_seals]
+
+    with phase("fetch code"):
+        addresses = [address for address, _, _ in targets]
+        codes, states = asyncio.run(
+            _fetch(networks.active_provider.http_uri, addresses, [entry["gate_seal"] for entry in gate_seals])
+        )
+    states = {state.address: state for state in states}
+
+    # GateSeals created from the same blueprint with the same parameters share the code,
+    # so every distinct code is compared only once
+    cache = {}
+    failures = 0
+
+    for (address, kind, entry), code in zip(targets, codes):
+        code_hash = keccak(code)
+        if (kind, code_hash) not in cache:
+            if kind == "blueprint":
+                cache[(kind, code_hash)] = _match_blueprint(code, gate_seal_builds)
+            elif kind == "factory":
+                cache[(kind, code_hash)] = _match_builds(code, factory_builds)
+            else:
+                cache[(kind, code_hash)] = _match_builds(code, gate_seal_builds)
+
+        matches, immutables, build = cache[(kind, code_hash)]
+        if not matches:
+            failures += 1
+            logger.error(f"{kind} {address} matches neither the current nor the legacy build")
+            continue
+        logger.success(f"{kind} {address} matches the {build} build {immutables}")
+
+        # the code is right, what is left to check is the configuration
+        mismatches = []
+        if kind == "factory":
+            if to_checksum_address(immutables["BLUEPRINT"]) != to_checksum_address(entry["blueprint"]):
+                mismatches.append("blueprint")
+        elif kind == "gateseal":
+            mismatches = find_gate_seal_param_mismatches(entry["params"], immutables, states[address])
+
+        if mismatches:
+            failures += 1
+            for mismatch in mismatches:
+                logger.error(f"{kind} {address}: {mismatch} differs from the deployed file")
+
+    if failures:
+        logger.error(f"{failures} of {len(targets)} contracts failed verification")
+        sys.exit(1)
+
+    logger.success(f"All {len(targets)} contracts match the local builds and the deployed files")
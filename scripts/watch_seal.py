@@ -0,0 +1,37 @@
+import sys
+from ape import networks
+from ape.logging import logger
+from eth_utils.address import to_checksum_address
+
+from utils.env import load_env_variable
+from utils.instrumentation import instrument_from_env, phase
+from utils.rpc import Rpc
+from utils.watcher import SealWatcher, format_report
+
+# Waits for GATE_SEAL to be sealed and reports the status of every sealable in the block of
+# inclusion. The seal is spotted by the Sealed logs of the GateSeal, whatever transaction made
+# the call, e.g. the execTransaction of the committee multisig. TX_HASH narrows the watch down
+# to a known transaction, which is also the only way to follow a multisig seal that reverts.
+# SEALABLES (comma-separated) defaults to every sealable of the GateSeal.
+
+
+def main():
+    instrument_from_env()
+
+    gate_seal = to_checksum_address(load_env_variable("GATE_SEAL"))
+    transaction_hash = load_env_variable("TX_HASH", required=False)
+    sealables = load_env_variable("SEALABLES", required=False)
+    sealables = sealables.split(",") if sealables else None
+
+    watcher = SealWatcher(Rpc(networks.active_provider.http_uri), gate_seal, transaction_hash, sealables)
+    logger.info(f"Watching {gate_seal} for a seal of {len(watcher.sealables)} sealables")
+
+    with phase("watch"):
+        report = watcher.watch()
+
+    logger.info(format_report(report))
+    if not report.succeeded or not report.all_paused:
+        logger.error("Not every sealable is paused!")
+        sys.exit(1)
+
+    logger.success("Every sealable is paused")
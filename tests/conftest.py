@@ -4,6 +4,9 @@ from ape.logging import logger
 from utils.blueprint import deploy_blueprint, construct_blueprint_deploy_bytecode
 from utils.constants import MAX_EXPIRY_PERIOD_SECONDS, MAX_SEALABLES, MIN_SEALABLES
 
+# `--perf` and `--perf-report <file>.json`, see tests/perf_plugin.py
+from tests.perf_plugin import pytest_addoption, pytest_configure  # noqa: F401
+
 """
 
     ACCOUNTS
@@ -73,6 +76,62 @@ def gate_seal(
     return project.GateSeal.at(gate_seal_address)
 
 
+@pytest.fixture(scope="function")
+def gate_seal_clone_implementation(project, deployer):
+    return project.GateSealClone.deploy(sender=deployer)
+
+
+@pytest.fixture(scope="function")
+def gate_seal_clone_factory(project, deployer, gate_seal_clone_implementation):
+    return project.GateSealCloneFactory.deploy(gate_seal_clone_implementation, sender=deployer)
+
+
+@pytest.fixture(scope="function")
+def gate_seal_clone(
+    project,
+    deployer,
+    gate_seal_clone_factory,
+    sealing_committee,
+    seal_duration_seconds,
+    sealables,
+    expiry_timestamp,
+):
+    transaction = gate_seal_clone_factory.create_gate_seal(
+        sealing_committee,
+        seal_duration_seconds,
+        sealables,
+        expiry_timestamp,
+        sender=deployer,
+    )
+
+    return project.GateSealClone.at(transaction.events[0].gate_seal)
+
+
+@pytest.fixture(scope="function")
+def gate_seal_hub(project, deployer, dao_agent):
+    return project.GateSealHub.deploy(dao_agent, sender=deployer)
+
+
+@pytest.fixture(scope="function")
+def gate_seal_id(
+    gate_seal_hub,
+    dao_agent,
+    sealing_committee,
+    seal_duration_seconds,
+    sealables,
+    expiry_timestamp,
+):
+    transaction = gate_seal_hub.create_gate_seal(
+        sealing_committee,
+        seal_duration_seconds,
+        sealables,
+        expiry_timestamp,
+        sender=dao_agent,
+    )
+
+    return transaction.events[0].gate_seal_id
+
+
 @pytest.fixture(scope="function")
 def sealables(generate_sealables):
     return generate_sealables(randint(MIN_SEALABLES, MAX_SEALABLES))
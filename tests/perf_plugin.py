@@ -0,0 +1,206 @@
+import json
+import time
+from typing import NamedTuple
+
+import pytest
+
+# Per-test performance report, enabled with `--perf` or `--perf-report <file>.json`:
+#
+#     ape test --perf-report perf.json
+#
+# Every test is measured separately for its fixture setup, body and teardown: wall time,
+# transactions mined, contracts deployed, gas used and RPC calls. Every fixture is also
+# measured on its own, excluding the fixtures it depends on, which shows e.g. how many
+# deployments `gate_seal` causes. The slowest tests and the heaviest fixtures are printed
+# at the end of the run; the JSON report is sorted so that reports of two commits diff cleanly.
+
+PHASES = ("setup", "call", "teardown")
+DEFAULT_SLOWEST = 10
+
+
+class Metrics(NamedTuple):
+    wall_ms: float = 0
+    transactions: int = 0
+    deployments: int = 0
+    gas_used: int = 0
+    rpc_calls: int = 0
+
+    def __add__(self, other: "Metrics") -> "Metrics":
+        return Metrics(*(a + b for a, b in zip(self, other)))
+
+    def to_dict(self) -> dict:
+        return {**self._asdict(), "wall_ms": round(self.wall_ms, 3)}
+
+
+def summarize_blocks(blocks: list) -> tuple[int, int, int]:
+    """
+    Returns the transactions, contract creations and gas used of blocks with full transactions.
+    """
+    transactions = [transaction for block in blocks for transaction in block["transactions"]]
+    # nodes report the `to` of a contract creation as null or empty
+    deployments = sum(1 for transaction in transactions if not transaction.get("to"))
+    return len(transactions), deployments, sum(block["gasUsed"] for block in blocks)
+
+
+def build_report(tests: dict[str, dict], fixtures: dict[str, dict]) -> dict:
+    total = Metrics()
+    for phases in tests.values():
+        for phase in PHASES:
+            total += phases.get(phase, Metrics())
+    return {
+        "total": total.to_dict(),
+        "tests": {
+            nodeid: {
+                phase: phases[phase].to_dict() if phase in phases else None for phase in PHASES
+            }
+            | {"outcome": phases.get("outcome")}
+            for nodeid, phases in sorted(tests.items())
+        },
+        "fixtures": {
+            name: {"executions": stats["executions"], **stats["metrics"].to_dict()}
+            for name, stats in sorted(fixtures.items())
+        },
+    }
+
+
+def slowest_tests(tests: dict[str, dict], n: int) -> list[tuple[str, dict]]:
+    def wall(item):
+        return sum(item[1][phase].wall_ms for phase in PHASES if phase in item[1])
+
+    return sorted(tests.items(), key=wall, reverse=True)[:n]
+
+
+def format_slowest(tests: dict[str, dict], fixtures: dict[str, dict], n: int) -> list[str]:
+    output = [
+        f"{'setup ms':>10} {'call ms':>10} {'txs':>5} {'deploys':>8} {'gas':>12} {'rpc':>6}  test"
+    ]
+    for nodeid, phases in slowest_tests(tests, n):
+        total = sum((phases[phase] for phase in PHASES if phase in phases), Metrics())
+        setup, call = phases.get("setup", Metrics()), phases.get("call", Metrics())
+        output.append(
+            f"{setup.wall_ms:>10.1f} {call.wall_ms:>10.1f} {total.transactions:>5} {total.deployments:>8} "
+            f"{total.gas_used:>12} {total.rpc_calls:>6}  {nodeid}"
+        )
+
+    output.append(f"{'runs':>10} {'ms':>10} {'txs':>5} {'deploys':>8} {'gas':>12} {'rpc':>6}  fixture")
+    heaviest = sorted(fixtures.items(), key=lambda item: item[1]["metrics"].wall_ms, reverse=True)[:n]
+    for name, stats in heaviest:
+        metrics = stats["metrics"]
+        output.append(
+            f"{stats['executions']:>10} {metrics.wall_ms:>10.1f} {metrics.transactions:>5} "
+            f"{metrics.deployments:>8} {metrics.gas_used:>12} {metrics.rpc_calls:>6}  {name}"
+        )
+    return output
+
+
+class PerfPlugin:
+    def __init__(self, report_filename: str | None, slowest: int):
+        self.report_filename = report_filename
+        self.slowest = slowest
+        self.recorder = None
+        # nodeid -> {phase: Metrics, "outcome": str}
+        self.tests = {}
+        # fixture name -> {"executions": int, "metrics": Metrics}
+        self.fixtures = {}
+        # RPC calls of the measurements themselves, which an enclosing phase must not count
+        self.measurement_calls = 0
+
+    def _web3(self):
+        from ape import networks
+
+        return networks.active_provider.web3
+
+    def _calls(self) -> int:
+        return len(self.recorder.calls) - self.measurement_calls
+
+    def _start(self) -> tuple[float, int, int]:
+        if self.recorder is None:
+            from ape import networks
+
+            from utils.instrumentation import instrument_provider
+
+            self.recorder = instrument_provider(networks.active_provider, report_at_exit=False)
+        calls = len(self.recorder.calls)
+        height = self._web3().eth.block_number
+        self.measurement_calls += len(self.recorder.calls) - calls
+        return time.perf_counter(), height, self._calls()
+
+    def _stop(self, start: tuple[float, int, int]) -> Metrics:
+        started_at, height, calls = start
+        wall_ms = (time.perf_counter() - started_at) * 1000
+        rpc_calls = self._calls() - calls
+
+        measured_from = len(self.recorder.calls)
+        web3 = self._web3()
+        # blocks reverted by the isolation snapshots leave nothing to count
+        blocks = [
+            web3.eth.get_block(number, full_transactions=True)
+            for number in range(height + 1, web3.eth.block_number + 1)
+        ]
+        self.measurement_calls += len(self.recorder.calls) - measured_from
+        return Metrics(wall_ms, *summarize_blocks(blocks), rpc_calls)
+
+    def _record_phase(self, item, phase: str, start):
+        self.tests.setdefault(item.nodeid, {})[phase] = self._stop(start)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        start = self._start()
+        yield
+        self._record_phase(item, "setup", start)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        start = self._start()
+        yield
+        self._record_phase(item, "call", start)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item):
+        start = self._start()
+        yield
+        self._record_phase(item, "teardown", start)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        # the fixtures this one depends on are already set up at this point
+        start = self._start()
+        yield
+        stats = self.fixtures.setdefault(fixturedef.argname, {"executions": 0, "metrics": Metrics()})
+        stats["executions"] += 1
+        stats["metrics"] += self._stop(start)
+
+    def pytest_runtest_logreport(self, report):
+        if report.when == "call" or (report.when == "setup" and report.outcome != "passed"):
+            self.tests.setdefault(report.nodeid, {})["outcome"] = report.outcome
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.tests:
+            return
+        terminalreporter.write_sep("=", f"slowest {self.slowest} tests and fixtures")
+        for line in format_slowest(self.tests, self.fixtures, self.slowest):
+            terminalreporter.write_line(line)
+
+        if self.report_filename:
+            with open(self.report_filename, "w") as report_file:
+                json.dump(build_report(self.tests, self.fixtures), report_file, indent=4)
+            terminalreporter.write_line(f"performance report: {self.report_filename}")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf")
+    group.addoption(
+        "--perf", action="store_true", help="measure time, transactions, gas and RPC calls per test"
+    )
+    group.addoption(
+        "--perf-report", metavar="FILE", help="write the measurements to a JSON file, implies --perf"
+    )
+    group.addoption(
+        "--perf-slowest", type=int, default=DEFAULT_SLOWEST, help="number of slowest tests to print"
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("perf") or config.getoption("perf_report"):
+        plugin = PerfPlugin(config.getoption("perf_report"), config.getoption("perf_slowest"))
+        config.pluginmanager.register(plugin, "gate-seal-perf")
@@ -0,0 +1,227 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from utils.abi import encode_address
+from utils.async_rpc import (
+    AsyncRpc,
+    RetryableError,
+    get_factory_gate_seals,
+    get_gate_seal_states,
+)
+from utils.logs import get_gate_seal_created_topic
+from utils.rpc import RpcError
+
+
+class FakeNode:
+    """
+    Answers JSON-RPC batches with `hex(id)`, fails the first `failures` HTTP requests with 503
+    and records the largest number of requests it was serving at once.
+    """
+
+    def __init__(self, failures: int = 0, delay: float = 0, response=None):
+        self.failures = failures
+        self.delay = delay
+        # answers every request with `response` instead, if set
+        self.response = response
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle(self, request):
+        self.requests += 1
+        if self.failures:
+            self.failures -= 1
+            return web.Response(status=503)
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+
+        if self.response is not None:
+            return web.Response(text=json.dumps(self.response), content_type="application/json")
+        response = []
+        for item in await request.json():
+            if item["method"] == "eth_fail":
+                response.append({"jsonrpc": "2.0", "id": item["id"], "error": {"message": "failed"}})
+            else:
+                response.append({"jsonrpc": "2.0", "id": item["id"], "result": item["params"][0]})
+        # batch responses may come back in any order
+        return web.Response(text=json.dumps(response[::-1]), content_type="application/json")
+
+
+def run(node: FakeNode, client):
+    async def serve():
+        app = web.Application()
+        app.router.add_post("/", node.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            return await client(f"http://127.0.0.1:{port}/")
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(serve())
+
+
+def test_batches_in_call_order():
+    node = FakeNode()
+
+    async def client(uri):
+        async with AsyncRpc(uri, batch_size=10) as rpc:
+            return await rpc.batch([("eth_echo", [index]) for index in range(95)])
+
+    assert run(node, client) == list(range(95))
+    assert node.requests == 10
+
+
+def test_concurrency_limit():
+    node = FakeNode(delay=0.05)
+
+    async def client(uri):
+        async with AsyncRpc(uri, batch_size=1, max_concurrency=3) as rpc:
+            return await rpc.batch([("eth_echo", [index]) for index in range(12)])
+
+    assert run(node, client) == list(range(12))
+    assert node.max_in_flight == 3
+
+
+def test_retries_with_backoff():
+    node = FakeNode(failures=2)
+
+    async def client(uri):
+        async with AsyncRpc(uri, backoff_seconds=0.01) as rpc:
+            return await rpc.request("eth_echo", ["0x1"])
+
+    assert run(node, client) == "0x1"
+    assert node.requests == 3
+
+
+def test_gives_up_after_retries():
+    node = FakeNode(failures=10)
+
+    async def client(uri):
+        async with AsyncRpc(uri, retries=2, backoff_seconds=0.01) as rpc:
+            return await rpc.request("eth_echo", ["0x1"])
+
+    with pytest.raises(RetryableError):
+        run(node, client)
+    assert node.requests == 3
+
+
+def test_call_errors():
+    async def client(uri):
+        async with AsyncRpc(uri) as rpc:
+            results = await rpc.batch([("eth_echo", ["0x1"]), ("eth_fail", [])], raise_errors=False)
+            with pytest.raises(RpcError, match="eth_fail failed"):
+                await rpc.batch([("eth_fail", [])])
+            return results
+
+    results = run(FakeNode(), client)
+    assert results[0] == "0x1"
+    assert isinstance(results[1], RpcError)
+
+
+def test_non_batch_response():
+    async def client(uri):
+        async with AsyncRpc(uri) as rpc:
+            return await rpc.request("eth_echo", ["0x1"])
+
+    error = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch too large"}}
+    with pytest.raises(RpcError, match="batch too large"):
+        run(FakeNode(response=error), client)
+    with pytest.raises(RpcError, match="not a batch response"):
+        run(FakeNode(response="rate limited"), client)
+
+
+"""
+
+    CONTRACT READS
+
+"""
+
+
+class LegacyFactoryRpc:
+    """
+    A factory without the index that created a GateSeal every 1,000 blocks up to block 9,999.
+    """
+
+    def __init__(self, factory: str):
+        self.factory = factory
+        self.calls_log = []
+
+    async def request(self, method, params):
+        return (await self.batch([(method, params)]))[0]
+
+    async def batch(self, calls, raise_errors=True):
+        self.calls_log.append([method for method, _ in calls])
+        results = []
+        for method, params in calls:
+            if method == "eth_call":
+                raise RpcError(method, {"message": "execution reverted"})
+            if method == "eth_getBlockByNumber":
+                results.append({"number": hex(9_999)})
+                continue
+            filter = params[0]
+            assert filter["address"] == self.factory
+            assert filter["topics"] == [get_gate_seal_created_topic()]
+            results.append(
+                [
+                    {
+                        "address": self.factory,
+                        "topics": [get_gate_seal_created_topic()],
+                        "data": "0x" + encode_address(f"0x{block:040x}").hex(),
+                    }
+                    for block in range(int(filter["fromBlock"], 16), int(filter["toBlock"], 16) + 1)
+                    if block % 1_000 == 0
+                ]
+            )
+        return results
+
+
+def test_reads_legacy_factory_gate_seals_from_logs():
+    factory = f"0x{0xFAC:040x}"
+    rpc = LegacyFactoryRpc(factory)
+
+    gate_seals = asyncio.run(get_factory_gate_seals(rpc, factory, from_block=3_000))
+
+    assert gate_seals == [f"0x{block:040x}" for block in range(3_000, 10_000, 1_000)]
+    # every block range of the scan goes out in a single batch
+    assert rpc.calls_log[-1] == ["eth_getLogs"] * 4
+
+
+def test_reads_factory_gate_seals(
+    networks,
+    gate_seal_factory,
+    deployer,
+    sealing_committee,
+    seal_duration_seconds,
+    sealables,
+    expiry_timestamp,
+):
+    created = [
+        gate_seal_factory.create_gate_seal(
+            sealing_committee, seal_duration_seconds, sealables, expiry_timestamp, sender=deployer
+        ).events[0].gate_seal
+        for _ in range(5)
+    ]
+
+    async def read():
+        async with AsyncRpc(networks.active_provider.http_uri) as rpc:
+            gate_seals = await get_factory_gate_seals(rpc, gate_seal_factory.address, page_size=2)
+            return gate_seals, await get_gate_seal_states(rpc, gate_seals)
+
+    gate_seals, states = asyncio.run(read())
+    assert [gate_seal.lower() for gate_seal in gate_seals] == [gate_seal.lower() for gate_seal in created]
+    for state in states:
+        assert state.sealing_committee.lower() == sealing_committee.address.lower()
+        assert state.seal_duration_seconds == seal_duration_seconds
+        assert state.sealables == [sealable.address.lower() for sealable in sealables]
+        assert state.expiry_timestamp == expiry_timestamp
+        assert not state.is_expired
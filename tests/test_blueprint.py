@@ -0,0 +1,78 @@
+import pytest
+
+from utils.blueprint import (
+    DEPLOY_PREAMBLE_BYTE_LENGTH,
+    build_eip5202_blueprint,
+    construct_blueprint_deploy_bytecode,
+    parse_eip5202_blueprint,
+    verify_blueprint_deploy_preamble,
+    verify_eip522_blueprint,
+)
+
+INITCODE = bytes.fromhex("6003600c60003960036000f3600000")
+
+
+def test_blueprint_without_preamble_data():
+    blueprint = build_eip5202_blueprint(INITCODE)
+    assert blueprint == bytes.fromhex("fe7100") + INITCODE
+
+    parsed = parse_eip5202_blueprint(blueprint)
+    assert parsed.version == 0
+    assert parsed.preamble_data is None
+    assert parsed.code_offset == 3
+    assert parsed.initcode == INITCODE
+
+
+@pytest.mark.parametrize(
+    "preamble_data, n_length_bytes",
+    [(b"", 1), (b"\x01" * 0xFF, 1), (b"\x02" * 0x100, 2), (b"\x03" * 0xFFFF, 2)],
+)
+def test_blueprint_with_preamble_data(preamble_data, n_length_bytes):
+    blueprint = build_eip5202_blueprint(INITCODE, version=5, preamble_data=preamble_data)
+    assert blueprint[2] == (5 << 2) | n_length_bytes
+
+    parsed = parse_eip5202_blueprint(blueprint)
+    assert parsed.version == 5
+    assert parsed.preamble_data == preamble_data
+    assert parsed.code_offset == 3 + n_length_bytes + len(preamble_data)
+    assert parsed.initcode == INITCODE
+
+
+def test_blueprint_reserved_length_encoding():
+    with pytest.raises(AssertionError, match="reserved bits"):
+        parse_eip5202_blueprint(bytes.fromhex("fe7103") + INITCODE)
+
+
+def test_blueprint_truncated_preamble_data():
+    with pytest.raises(AssertionError, match="truncated preamble data"):
+        parse_eip5202_blueprint(bytes.fromhex("fe710110") + INITCODE)
+
+
+def test_blueprint_invalid_identifier():
+    with pytest.raises(AssertionError):
+        verify_eip522_blueprint(bytes.fromhex("fe7000") + INITCODE)
+
+
+def test_deploy_bytecode_roundtrip():
+    deploy_bytecode = construct_blueprint_deploy_bytecode("0x" + INITCODE.hex())
+    assert deploy_bytecode[:DEPLOY_PREAMBLE_BYTE_LENGTH] == bytes.fromhex(
+        f"61{len(INITCODE) + 3:04x}3d81600a3d39f3"
+    )
+
+    parsed = verify_blueprint_deploy_preamble(deploy_bytecode)
+    assert parsed.initcode == INITCODE
+
+
+def test_deploy_bytecode_with_preamble_data():
+    deploy_bytecode = construct_blueprint_deploy_bytecode(
+        INITCODE, preamble_data=b"gate seal"
+    )
+    parsed = verify_blueprint_deploy_preamble(deploy_bytecode)
+    assert parsed.preamble_data == b"gate seal"
+    assert parsed.initcode == INITCODE
+
+
+def test_deploy_bytecode_length_mismatch():
+    deploy_bytecode = construct_blueprint_deploy_bytecode(INITCODE)
+    with pytest.raises(AssertionError):
+        verify_blueprint_deploy_preamble(deploy_bytecode + b"\x00")
@@ -0,0 +1,47 @@
+import pytest
+
+from utils.build import (
+    detect_vyper_version,
+    get_artifact_key,
+    get_optimization_modes,
+    get_optimize_setting,
+    get_source_path,
+)
+
+
+def test_detect_vyper_version():
+    assert detect_vyper_version("# @version 0.3.7\n") == "0.3.7"
+    assert detect_vyper_version("#pragma version ^0.4.1\n") == "0.4.1"
+
+
+def test_legacy_compiler_optimization_modes():
+    assert get_optimization_modes("0.3.7") == ["gas", "none"]
+    assert get_optimize_setting("0.3.7", "gas") is True
+    assert get_optimize_setting("0.3.7", "none") is False
+    with pytest.raises(AssertionError):
+        get_optimize_setting("0.3.7", "codesize")
+
+
+def test_optimization_modes():
+    assert get_optimization_modes("0.4.1") == ["gas", "codesize", "none"]
+    assert get_optimize_setting("0.4.1", "codesize") == "codesize"
+
+
+def test_artifact_key_depends_on_every_input():
+    key = get_artifact_key("source", "0.3.7", "gas")
+    assert key == get_artifact_key("source", "0.3.7", "gas")
+    assert key != get_artifact_key("source ", "0.3.7", "gas")
+    assert key != get_artifact_key("source", "0.3.8", "gas")
+    assert key != get_artifact_key("source", "0.3.7", "none")
+
+
+def test_legacy_sources_are_vendored():
+    assert get_source_path("GateSealFactory") == "contracts/GateSealFactory.vy"
+    assert get_source_path("GateSealFactory", legacy=True) == "contracts/legacy/GateSealFactory.vy"
+    assert get_source_path("GateSeal", legacy=True) == "contracts/legacy/GateSeal.vy"
+
+    with open(get_source_path("GateSealFactory", legacy=True)) as source_file:
+        legacy = source_file.read()
+    assert detect_vyper_version(legacy) == "0.3.7"
+    # the audited factory has no GateSeal index
+    assert "get_gate_seals" not in legacy
@@ -0,0 +1,88 @@
+from utils.async_rpc import GateSealState
+from utils.build import get_artifact
+from utils.bytecode import find_gate_seal_param_mismatches, get_code_layout, matches_runtime_code
+
+
+def _runtime_bytecode(container):
+    return bytes.fromhex(container.contract_type.runtime_bytecode.bytecode[2:])
+
+
+def test_gate_seal_code_matches_local_build(
+    project, gate_seal, sealing_committee, seal_duration_seconds
+):
+    code = project.provider.get_code(gate_seal.address)
+
+    matches, immutables = matches_runtime_code(
+        code,
+        _runtime_bytecode(project.GateSeal),
+        get_code_layout(get_artifact("GateSeal")),
+    )
+
+    assert matches, "deployed code does not match the local build"
+    assert immutables["SEALING_COMMITTEE"] == sealing_committee.address.lower()
+    assert immutables["SEAL_DURATION_SECONDS"] == seal_duration_seconds
+
+
+def test_factory_code_matches_local_build(project, gate_seal_factory, blueprint_address):
+    code = project.provider.get_code(gate_seal_factory.address)
+
+    matches, immutables = matches_runtime_code(
+        code,
+        _runtime_bytecode(project.GateSealFactory),
+        get_code_layout(get_artifact("GateSealFactory")),
+    )
+
+    assert matches, "deployed code does not match the local build"
+    assert immutables["BLUEPRINT"] == blueprint_address.lower()
+
+
+def test_foreign_code_does_not_match(project, gate_seal_factory):
+    code = project.provider.get_code(gate_seal_factory.address)
+
+    matches, _ = matches_runtime_code(
+        code,
+        _runtime_bytecode(project.GateSeal),
+        get_code_layout(get_artifact("GateSeal")),
+    )
+
+    assert not matches, "factory code must not match the GateSeal build"
+
+
+def test_code_layout_from_artifact():
+    artifact = {
+        "contract_name": "GateSeal",
+        "layout": {
+            "storage_layout": {},
+            "code_layout": {
+                "SEAL_DURATION_SECONDS": {"type": "uint256", "offset": 32, "length": 32},
+                "SEALING_COMMITTEE": {"type": "address", "offset": 0, "length": 32},
+            },
+        },
+    }
+    assert [immutable.name for immutable in get_code_layout(artifact)] == [
+        "SEALING_COMMITTEE",
+        "SEAL_DURATION_SECONDS",
+    ]
+
+
+def test_gate_seal_params_are_verified():
+    committee, sealables = "0x" + "ab" * 20, ["0x" + "01" * 20, "0x" + "02" * 20]
+    params = {
+        "sealing_committee": committee.upper().replace("0X", "0x"),
+        "seal_duration_seconds": 604800,
+        "sealables": sealables,
+        "expiry_timestamp": 1_800_000_000,
+    }
+    immutables = {"SEALING_COMMITTEE": committee, "SEAL_DURATION_SECONDS": 604800}
+
+    def state(sealables=sealables, expiry_timestamp=1_800_000_000, is_expired=False):
+        return GateSealState("0x" + "cd" * 20, committee, 604800, sealables, expiry_timestamp, is_expired)
+
+    assert find_gate_seal_param_mismatches(params, immutables, state()) == []
+    # a sealed GateSeal expires at the timestamp of the seal
+    sealed = state(expiry_timestamp=1_700_000_000, is_expired=True)
+    assert find_gate_seal_param_mismatches(params, immutables, sealed) == []
+
+    assert len(find_gate_seal_param_mismatches(params, immutables, state(sealables=sealables[:1]))) == 1
+    assert len(find_gate_seal_param_mismatches(params, immutables, state(expiry_timestamp=1_900_000_000))) == 1
+    assert len(find_gate_seal_param_mismatches(params, {**immutables, "SEAL_DURATION_SECONDS": 1}, state())) == 1
@@ -0,0 +1,93 @@
+import json
+
+from utils.cli import main
+
+SENDER = "0x6FB824b56210c67706AA39D4443bebB1d7eA1386"
+SEALABLE = "0x889edC2eDab5f40e902b864aD4d7AdE8E412F9B1"
+NOW = 1700000000
+
+
+def test_validate_config(capsys):
+    code = main(
+        [
+            "validate-config",
+            "--sealing-committee", SENDER,
+            "--seal-duration-seconds", "518400",
+            "--sealables", SEALABLE,
+            "--expiry-timestamp", str(NOW + 1),
+            "--now", str(NOW),
+        ]
+    )
+    assert code == 0
+    assert "config is valid" in capsys.readouterr().out
+
+
+def test_validate_config_reports_errors(capsys):
+    code = main(
+        [
+            "validate-config",
+            "--sealing-committee", SENDER,
+            "--seal-duration-seconds", "1",
+            "--sealables", f"{SEALABLE},{SEALABLE}",
+            "--expiry-timestamp", str(NOW),
+            "--now", str(NOW),
+        ]
+    )
+    errors = capsys.readouterr().err
+    assert code == 1
+    assert "seal duration: too short" in errors
+    assert "expiry timestamp: must be in the future" in errors
+    assert "sealables: includes duplicates" in errors
+
+
+def test_validate_manifest(capsys, tmp_path):
+    config = {
+        "sealing_committee": SENDER,
+        "seal_duration_seconds": 518400,
+        "sealables": [SEALABLE],
+        "expiry_timestamp": NOW + 1,
+    }
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({"seals": [config, {**config, "sealables": []}]}))
+
+    assert main(["validate-manifest", str(manifest), "--now", str(NOW)]) == 1
+    assert "seals[1]: sealables: empty list" in capsys.readouterr().err
+
+    manifest.write_text(json.dumps({"seals": [config]}))
+    assert main(["validate-manifest", str(manifest), "--now", str(NOW)]) == 0
+    assert "1 configs are valid" in capsys.readouterr().out
+
+
+def test_blueprint_build_and_verify(capsys):
+    assert main(["blueprint", "build", "--bytecode", "0x600060006000"]) == 0
+    deploy_bytecode = capsys.readouterr().out.strip()
+    assert deploy_bytecode == "0x6100093d81600a3d39f3fe7100600060006000"
+
+    assert main(["blueprint", "verify", deploy_bytecode]) == 0
+    assert "initcode: 6 bytes" in capsys.readouterr().out
+
+
+def test_blueprint_verify_rejects_non_blueprint(capsys):
+    assert main(["blueprint", "verify", "0x600060006000"]) == 1
+
+
+def test_create_address(capsys):
+    from eth_utils import keccak, to_checksum_address
+    import rlp
+
+    assert main(["create-address", "--sender", SENDER, "--nonce", "200", "--count", "2"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    for nonce, line in zip([200, 201], lines):
+        expected = to_checksum_address(keccak(rlp.encode([bytes.fromhex(SENDER[2:]), nonce]))[12:])
+        assert line == f"{nonce}: {expected}"
+
+
+def test_calldata_matches_eth_abi(capsys):
+    from eth_abi import encode
+    from eth_utils import function_signature_to_4byte_selector
+
+    assert main(["calldata", "seal", "--sealables", f"{SENDER},{SEALABLE}"]) == 0
+    expected = function_signature_to_4byte_selector("seal(address[])") + encode(
+        ["address[]"], [[SENDER, SEALABLE]]
+    )
+    assert capsys.readouterr().out.strip() == "0x" + expected.hex()
@@ -1,6 +1,6 @@
 from ape.exceptions import VirtualMachineError
 from utils.blueprint import verify_eip522_blueprint
-from utils.constants import ZERO_ADDRESS, BLUEPRINT_ZERO_ADDRESS
+from utils.constants import ZERO_ADDRESS, BLUEPRINT_ZERO_ADDRESS, MAX_GATE_SEALS_PAGE_SIZE
 
 
 def test_factory_blueprint_cannot_be_zero_address(project, deployer):
@@ -29,3 +29,36 @@ def test_blueprint_address_matches(blueprint_address, gate_seal_factory):
 def test_compliance_with_eip_5202(project, blueprint_address):
     blueprint = project.provider.get_code(blueprint_address)
     verify_eip522_blueprint(blueprint)
+
+
+def test_gate_seals_index_is_empty(gate_seal_factory):
+    assert gate_seal_factory.get_gate_seals_count() == 0
+    assert gate_seal_factory.get_gate_seals(0, MAX_GATE_SEALS_PAGE_SIZE) == []
+
+
+def test_gate_seals_index(
+    gate_seal_factory,
+    deployer,
+    sealing_committee,
+    seal_duration_seconds,
+    sealables,
+    expiry_timestamp,
+):
+    created = []
+    for _ in range(5):
+        transaction = gate_seal_factory.create_gate_seal(
+            sealing_committee,
+            seal_duration_seconds,
+            sealables,
+            expiry_timestamp,
+            sender=deployer,
+        )
+        created.append(transaction.events[0].gate_seal)
+
+    assert gate_seal_factory.get_gate_seals_count() == len(created)
+    assert gate_seal_factory.get_gate_seals(0, MAX_GATE_SEALS_PAGE_SIZE) == created
+    assert gate_seal_factory.get_gate_seals(1, 2) == created[1:3]
+    assert gate_seal_factory.get_gate_seals(3, 10) == created[3:]
+    assert gate_seal_factory.get_gate_seals(0, 0) == []
+    assert gate_seal_factory.get_gate_seals(len(created), 1) == []
+    assert gate_seal_factory.get_gate_seals(2**256 - 1, 2**256 - 1) == []
@@ -10,6 +10,11 @@ from utils.constants import (
     MIN_SEAL_DURATION_SECONDS,
     ZERO_ADDRESS,
 )
+from utils.seal_errors import (
+    FAILURE_NOT_PAUSED,
+    FAILURE_PAUSE_REVERTED,
+    encode_seal_failures,
+)
 
 
 def test_committee_cannot_be_zero_address(
@@ -385,7 +390,8 @@ def test_single_failed_sealable_error_message(
         sender=deployer,
     )
 
-    with reverts(f"{failing_index}"):
+    reason = FAILURE_NOT_PAUSED if unpausable else FAILURE_PAUSE_REVERTED
+    with reverts(str(encode_seal_failures({failing_index: reason}))):
         gate_seal.seal(
             sealables,
             sender=sealing_committee,
@@ -417,9 +423,7 @@ def test_several_failed_sealables_error_message(
         sender=deployer,
     )
 
-    failed.sort()
-    failed.reverse()
-    with reverts("".join([str(n) for n in failed])):
+    with reverts(str(encode_seal_failures({index: FAILURE_NOT_PAUSED for index in failed}))):
         gate_seal.seal(
             sealables,
             sender=sealing_committee,
@@ -441,11 +445,12 @@ def test_raw_call_success_should_be_false_when_sealable_reverts_on_pause(project
 
         To test that `success` returns actual value instead of returning bool of memory[0],
         we need to pause the contract before the sealing,
-        so that the condition `success and is_paused()` is false (i.e `False and True`), see GateSeal.vy::seal()
+        so that the sealable is paused but `success` is False and the failure is reported as `pauseFor` reverted
+        rather than not paused, see GateSeal.vy::seal()
 
         For that, we use `__force_pause_for` on SealableMock to ignore any checks and forcefully pause the contract.
         After calling this function, the SealableMock is paused but the call to `pauseFor` will still revert,
-        thus the returned `success` should be False, the condition fails and the call reverts altogether.
+        thus the returned `success` should be False and the call reverts altogether.
 
         Without `max_outsize=32`, the transaction would not revert.
     """
@@ -472,5 +477,5 @@ def test_raw_call_success_should_be_false_when_sealable_reverts_on_pause(project
     assert sealables[0].isPaused(), "should be paused now"
 
     # seal() should revert because `raw_call` to sealable returns `success=False`, even though isPaused() is True.
-    with reverts("0"):
+    with reverts(str(encode_seal_failures({0: FAILURE_PAUSE_REVERTED}))):
         gate_seal.seal(sealables, sender=sealing_committee)
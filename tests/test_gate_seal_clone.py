@@ -0,0 +1,101 @@
+from ape import reverts
+from ape.exceptions import VirtualMachineError
+
+from utils.constants import (
+    IMPLEMENTATION_ZERO_ADDRESS,
+    MIN_SEAL_DURATION_SECONDS,
+    ZERO_ADDRESS,
+)
+
+
+def test_factory_implementation_cannot_be_zero_address(project, deployer):
+    try:
+        project.GateSealCloneFactory.deploy(ZERO_ADDRESS, sender=deployer)
+        assert False, "Should have reverted"
+    except VirtualMachineError as e:
+        assert IMPLEMENTATION_ZERO_ADDRESS in str(e)
+
+
+def test_implementation_address_matches(gate_seal_clone_factory, gate_seal_clone_implementation):
+    assert gate_seal_clone_factory.get_implementation() == gate_seal_clone_implementation
+
+
+def test_clone_is_minimal_proxy(project, gate_seal_clone, gate_seal_clone_implementation):
+    code = project.provider.get_code(gate_seal_clone.address)
+    assert len(code) == 45, "EIP-1167 runtime code is 45 bytes"
+    assert bytes.fromhex(gate_seal_clone_implementation.address[2:]) in code
+
+
+def test_implementation_is_locked(
+    gate_seal_clone_implementation, stranger, seal_duration_seconds, sealables, expiry_timestamp
+):
+    assert gate_seal_clone_implementation.is_expired()
+    with reverts("gate seal: already initialized"):
+        gate_seal_clone_implementation.initialize(
+            stranger, seal_duration_seconds, sealables, expiry_timestamp, sender=stranger
+        )
+
+
+def test_clone_cannot_be_reinitialized(
+    gate_seal_clone, stranger, seal_duration_seconds, sealables, expiry_timestamp
+):
+    with reverts("gate seal: already initialized"):
+        gate_seal_clone.initialize(
+            stranger, seal_duration_seconds, sealables, expiry_timestamp, sender=stranger
+        )
+
+
+def test_initialize_checks(
+    gate_seal_clone_factory, deployer, sealing_committee, sealables, expiry_timestamp
+):
+    with reverts("seal duration: too short"):
+        gate_seal_clone_factory.create_gate_seal(
+            sealing_committee,
+            MIN_SEAL_DURATION_SECONDS - 1,
+            sealables,
+            expiry_timestamp,
+            sender=deployer,
+        )
+
+
+def test_config_matches(
+    gate_seal_clone, sealing_committee, seal_duration_seconds, sealables, expiry_timestamp
+):
+    assert gate_seal_clone.get_sealing_committee() == sealing_committee
+    assert gate_seal_clone.get_seal_duration_seconds() == seal_duration_seconds
+    assert gate_seal_clone.get_sealables() == sealables
+    assert gate_seal_clone.get_expiry_timestamp() == expiry_timestamp
+    assert not gate_seal_clone.is_expired()
+
+
+def test_seal_all(
+    chain, project, gate_seal_clone, sealing_committee, seal_duration_seconds, sealables
+):
+    expected_timestamp = chain.pending_timestamp
+    tx = gate_seal_clone.seal(sealables, sender=sealing_committee)
+
+    for i, event in enumerate(tx.events):
+        assert event.event_name == "Sealed"
+        assert event.gate_seal == gate_seal_clone.address
+        assert event.sealed_by == sealing_committee
+        assert event.sealed_for == seal_duration_seconds
+        assert event.sealable == sealables[i]
+        assert event.sealed_at == expected_timestamp
+
+    assert gate_seal_clone.get_expiry_timestamp() == expected_timestamp
+    assert gate_seal_clone.is_expired()
+
+    for sealable in sealables:
+        assert project.SealableMock.at(sealable).isPaused(), "sealable must be sealed"
+
+
+def test_seal_only_once(gate_seal_clone, sealing_committee, sealables):
+    gate_seal_clone.seal(sealables, sender=sealing_committee)
+
+    with reverts("gate seal: expired"):
+        gate_seal_clone.seal(sealables, sender=sealing_committee)
+
+
+def test_seal_as_stranger(gate_seal_clone, stranger, sealables):
+    with reverts("sender: not SEALING_COMMITTEE"):
+        gate_seal_clone.seal(sealables, sender=stranger)
@@ -0,0 +1,182 @@
+from ape import reverts
+import pytest
+
+from utils.constants import (
+    MAX_SEAL_DURATION_SECONDS,
+    MAX_SEALABLES,
+    MIN_SEAL_DURATION_SECONDS,
+    ZERO_ADDRESS,
+)
+from utils.seal_errors import FAILURE_NOT_PAUSED, encode_seal_failures
+
+
+def test_admin_cannot_be_zero_address(project, deployer):
+    with reverts("admin: zero address"):
+        project.GateSealHub.deploy(ZERO_ADDRESS, sender=deployer)
+
+
+def test_only_admin_creates_gate_seals(
+    gate_seal_hub, stranger, sealing_committee, seal_duration_seconds, sealables, expiry_timestamp
+):
+    with reverts("sender: not ADMIN"):
+        gate_seal_hub.create_gate_seal(
+            sealing_committee,
+            seal_duration_seconds,
+            sealables,
+            expiry_timestamp,
+            sender=stranger,
+        )
+
+
+@pytest.mark.parametrize(
+    "seal_duration_seconds, message",
+    [
+        (MIN_SEAL_DURATION_SECONDS - 1, "seal duration: too short"),
+        (MAX_SEAL_DURATION_SECONDS + 1, "seal duration: exceeds max"),
+    ],
+)
+def test_seal_duration_bounds(
+    gate_seal_hub, dao_agent, sealing_committee, sealables, expiry_timestamp, seal_duration_seconds, message
+):
+    with reverts(message):
+        gate_seal_hub.create_gate_seal(
+            sealing_committee,
+            seal_duration_seconds,
+            sealables,
+            expiry_timestamp,
+            sender=dao_agent,
+        )
+
+
+def test_expiry_timestamp_cannot_exceed_max(
+    gate_seal_hub, dao_agent, sealing_committee, seal_duration_seconds, sealables, expiry_timestamp
+):
+    with reverts("expiry timestamp: exceeds max expiry period"):
+        gate_seal_hub.create_gate_seal(
+            sealing_committee,
+            seal_duration_seconds,
+            sealables,
+            expiry_timestamp + 1,
+            sender=dao_agent,
+        )
+
+
+def test_sealables_cannot_include_duplicates(
+    gate_seal_hub, dao_agent, sealing_committee, seal_duration_seconds, sealables, expiry_timestamp
+):
+    with reverts("sealables: includes duplicates"):
+        gate_seal_hub.create_gate_seal(
+            sealing_committee,
+            seal_duration_seconds,
+            [sealables[0], sealables[0]],
+            expiry_timestamp,
+            sender=dao_agent,
+        )
+
+
+def test_config_matches(
+    gate_seal_hub, gate_seal_id, sealing_committee, seal_duration_seconds, sealables, expiry_timestamp
+):
+    assert gate_seal_hub.get_gate_seals_count() == gate_seal_id + 1
+    assert gate_seal_hub.get_sealing_committee(gate_seal_id) == sealing_committee
+    assert gate_seal_hub.get_seal_duration_seconds(gate_seal_id) == seal_duration_seconds
+    assert gate_seal_hub.get_sealables(gate_seal_id) == sealables
+    assert gate_seal_hub.get_expiry_timestamp(gate_seal_id) == expiry_timestamp
+    assert not gate_seal_hub.is_expired(gate_seal_id)
+
+
+def test_gate_seals_are_independent(
+    gate_seal_hub, gate_seal_id, dao_agent, stranger, seal_duration_seconds, sealables, expiry_timestamp
+):
+    other_id = gate_seal_hub.create_gate_seal(
+        stranger,
+        MAX_SEAL_DURATION_SECONDS,
+        sealables[:1],
+        expiry_timestamp - 1,
+        sender=dao_agent,
+    ).events[0].gate_seal_id
+
+    assert other_id == gate_seal_id + 1
+    assert gate_seal_hub.get_sealing_committee(other_id) == stranger
+    assert gate_seal_hub.get_seal_duration_seconds(other_id) == MAX_SEAL_DURATION_SECONDS
+    assert gate_seal_hub.get_seal_duration_seconds(gate_seal_id) == seal_duration_seconds
+
+
+def test_seal_all(
+    chain, project, gate_seal_hub, gate_seal_id, sealing_committee, seal_duration_seconds, sealables
+):
+    expected_timestamp = chain.pending_timestamp
+    tx = gate_seal_hub.seal(gate_seal_id, sealables, sender=sealing_committee)
+
+    for i, event in enumerate(tx.events):
+        assert event.event_name == "Sealed"
+        assert event.gate_seal_id == gate_seal_id
+        assert event.sealed_by == sealing_committee
+        assert event.sealed_for == seal_duration_seconds
+        assert event.sealable == sealables[i]
+        assert event.sealed_at == expected_timestamp
+
+    assert gate_seal_hub.get_expiry_timestamp(gate_seal_id) == expected_timestamp
+    assert gate_seal_hub.is_expired(gate_seal_id)
+    assert gate_seal_hub.get_sealing_committee(gate_seal_id) == sealing_committee
+    assert gate_seal_hub.get_seal_duration_seconds(gate_seal_id) == seal_duration_seconds
+
+    for sealable in sealables:
+        assert project.SealableMock.at(sealable).isPaused(), "sealable must be sealed"
+
+
+def test_seal_only_once(gate_seal_hub, gate_seal_id, sealing_committee, sealables):
+    gate_seal_hub.seal(gate_seal_id, sealables, sender=sealing_committee)
+
+    with reverts("gate seal: expired"):
+        gate_seal_hub.seal(gate_seal_id, sealables, sender=sealing_committee)
+
+
+def test_seal_as_stranger(gate_seal_hub, gate_seal_id, stranger, sealables):
+    with reverts("sender: not SEALING_COMMITTEE"):
+        gate_seal_hub.seal(gate_seal_id, sealables, sender=stranger)
+
+
+def test_seal_unknown_gate_seal(gate_seal_hub, gate_seal_id, sealing_committee, sealables):
+    with reverts("sender: not SEALING_COMMITTEE"):
+        gate_seal_hub.seal(gate_seal_id + 1, sealables, sender=sealing_committee)
+
+
+def test_seal_nonintersecting_subset(accounts, gate_seal_hub, gate_seal_id, sealing_committee):
+    with reverts("sealables: includes a non-sealable"):
+        gate_seal_hub.seal(gate_seal_id, [accounts[0]], sender=sealing_committee)
+
+
+def test_natural_expiry(networks, gate_seal_hub, gate_seal_id, expiry_timestamp):
+    networks.active_provider.set_timestamp(expiry_timestamp - 1)
+    networks.active_provider.mine()
+    assert not gate_seal_hub.is_expired(gate_seal_id), "expired prematurely"
+
+    networks.active_provider.set_timestamp(expiry_timestamp)
+    networks.active_provider.mine()
+    assert gate_seal_hub.is_expired(gate_seal_id), "must already be expired"
+
+
+@pytest.mark.parametrize("failing_index", [0, MAX_SEALABLES - 1])
+def test_failed_sealable_error_message(
+    gate_seal_hub,
+    dao_agent,
+    sealing_committee,
+    seal_duration_seconds,
+    expiry_timestamp,
+    failing_index,
+    generate_sealables,
+):
+    sealables = generate_sealables(MAX_SEALABLES)
+    sealables[failing_index] = generate_sealables(1, True)[0]
+
+    gate_seal_id = gate_seal_hub.create_gate_seal(
+        sealing_committee,
+        seal_duration_seconds,
+        sealables,
+        expiry_timestamp,
+        sender=dao_agent,
+    ).events[0].gate_seal_id
+
+    with reverts(str(encode_seal_failures({failing_index: FAILURE_NOT_PAUSED}))):
+        gate_seal_hub.seal(gate_seal_id, sealables, sender=sealing_committee)
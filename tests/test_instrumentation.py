@@ -0,0 +1,86 @@
+import pytest
+from web3 import EthereumTesterProvider, Web3
+
+from utils.instrumentation import (
+    RpcRecorder,
+    format_summary,
+    latency_histogram,
+)
+
+
+def make_request(method, params):
+    if method == "eth_fail":
+        return {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "failed"}}
+    if method == "eth_raise":
+        raise ConnectionError("connection refused")
+    return {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+
+
+def test_records_calls_by_phase():
+    recorder = RpcRecorder()
+    instrumented = recorder.wrap(make_request)
+
+    instrumented("eth_chainId", [])
+    with recorder.phase("deploy blueprint"):
+        instrumented("eth_getCode", ["0x" + "00" * 20, "latest"])
+        with recorder.phase("checks"):
+            instrumented("eth_fail", [])
+        instrumented("eth_getCode", ["0x" + "00" * 20, "latest"])
+
+    assert [(call.phase, call.method, call.failed) for call in recorder.calls] == [
+        ("-", "eth_chainId", False),
+        ("deploy blueprint", "eth_getCode", False),
+        ("checks", "eth_fail", True),
+        ("deploy blueprint", "eth_getCode", False),
+    ]
+    assert recorder.calls[1].request_bytes == len('["0x0000000000000000000000000000000000000000", "latest"]')
+
+    summary = recorder.summary()
+    assert summary["total"]["calls"] == 4
+    assert summary["total"]["failed"] == 1
+    assert summary["methods"]["eth_getCode"]["calls"] == 2
+    assert summary["phases"]["deploy blueprint"]["calls"] == 2
+    assert "wall_ms" in summary["phases"]["checks"]
+    assert sum(summary["histogram"].values()) == 4
+    assert "eth_getCode" in format_summary(summary)
+
+
+def test_records_raised_errors():
+    recorder = RpcRecorder()
+    with pytest.raises(ConnectionError):
+        recorder.wrap(make_request)("eth_raise", [])
+    assert recorder.calls[0].failed
+    assert recorder.calls[0].response_bytes == 0
+
+
+def test_phase_without_calls():
+    recorder = RpcRecorder()
+    with recorder.phase("simulate"):
+        pass
+    summary = recorder.summary()
+    assert summary["total"] == {"calls": 0}
+    assert summary["phases"]["simulate"]["calls"] == 0
+    assert "simulate" in format_summary(summary)
+
+
+def test_latency_histogram():
+    histogram = latency_histogram([0.5, 1, 1.5, 7000])
+    assert histogram["<=1ms"] == 2
+    assert histogram["<=2ms"] == 1
+    assert histogram[">5000ms"] == 1
+
+
+def test_records_web3_calls():
+    web3 = Web3(EthereumTesterProvider())
+    # builds and caches the middleware chain before the provider is instrumented
+    account = web3.eth.accounts[0]
+
+    recorder = RpcRecorder()
+    recorder.instrument(web3.provider)
+    recorder.instrument(web3.provider)
+
+    web3.eth.get_balance(account)
+    web3.eth.get_block("latest")
+    web3.provider.make_request("eth_chainId", [])
+
+    assert [call.method for call in recorder.calls] == ["eth_getBalance", "eth_getBlockByNumber", "eth_chainId"]
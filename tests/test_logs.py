@@ -0,0 +1,65 @@
+import pytest
+
+from utils.abi import encode_address, encode_uint256
+from utils.logs import (
+    SealedEvent,
+    decode_gate_seal_created_logs,
+    decode_sealed_logs,
+    get_gate_seal_created_topic,
+    get_sealed_topic,
+)
+
+FACTORY = "0x" + "fa" * 20
+GATE_SEAL = "0x" + "ab" * 20
+COMMITTEE = "0x" + "cd" * 20
+SEALABLES = [f"0x{index:040x}" for index in range(1, 4)]
+
+
+def _log(address: str, topic: str, data: bytes) -> dict:
+    return {"address": address, "topics": [topic], "data": "0x" + data.hex()}
+
+
+def _sealed_log(sealable: str, sealed_for: int = 604800, sealed_at: int = 1700000000) -> dict:
+    data = encode_address(GATE_SEAL) + encode_address(COMMITTEE) + encode_uint256(sealed_for)
+    data += encode_address(sealable) + encode_uint256(sealed_at)
+    return _log(GATE_SEAL, get_sealed_topic(), data)
+
+
+def test_decode_sealed_logs():
+    paused = _log(SEALABLES[0], "0x" + "00" * 32, encode_uint256(1))
+    logs = [_sealed_log(sealable, sealed_at=1700000000 + index) for index, sealable in enumerate(SEALABLES)]
+    sealed = decode_sealed_logs([paused] + logs)
+
+    assert len(sealed) == 3
+    assert sealed.sealables == b"".join(bytes.fromhex(sealable[2:]) for sealable in SEALABLES)
+    assert list(sealed.sealed_at) == [1700000000, 1700000001, 1700000002]
+    assert list(sealed.sealed_for) == [604800] * 3
+    assert sealed.event(1) == SealedEvent(GATE_SEAL, COMMITTEE, 604800, SEALABLES[1], 1700000001)
+    assert [event.sealable for event in sealed.events()] == SEALABLES
+
+
+def test_decode_gate_seal_created_logs():
+    logs = [
+        _log(FACTORY, get_gate_seal_created_topic(), encode_address(gate_seal))
+        for gate_seal in (GATE_SEAL, COMMITTEE)
+    ]
+    created = decode_gate_seal_created_logs(logs + [_sealed_log(SEALABLES[0])])
+    assert len(created) == 2
+    assert created.factories == bytes.fromhex(FACTORY[2:]) * 2
+    assert [created.gate_seal(0), created.gate_seal(1)] == [GATE_SEAL, COMMITTEE]
+
+
+def test_decode_no_logs():
+    assert len(decode_sealed_logs([])) == 0
+    assert decode_sealed_logs([]).events() == []
+    assert len(decode_gate_seal_created_logs([])) == 0
+
+
+def test_rejects_malformed_logs():
+    with pytest.raises(AssertionError, match="64 bits"):
+        decode_sealed_logs([_sealed_log(SEALABLES[0], sealed_for=2**64)])
+
+    truncated = _sealed_log(SEALABLES[0])
+    truncated["data"] = truncated["data"][:-64]
+    with pytest.raises(AssertionError, match="data length"):
+        decode_sealed_logs([truncated])
@@ -0,0 +1,109 @@
+import json
+import os
+
+import pytest
+
+from utils.constants import SECONDS_PER_DAY
+from utils.helpers import write_deployed_entries
+from utils.orchestrator import (
+    LOCAL_BASE_CHAIN_ID,
+    deploy_networks,
+    get_local_targets,
+    get_targets,
+    prepare_networks,
+    start_local_nodes,
+)
+from utils.pipeline import ape_signer
+from utils.rpc import Rpc
+from utils.sender import FeePolicy
+
+MANIFEST = {
+    "networks": {
+        "holesky": {"rpc": "HOLESKY_RPC_URL", "chain_id": 17000, "seals": []},
+        "mainnet": {"rpc": "MAINNET_RPC_URL", "chain_id": 1, "seals": []},
+    }
+}
+
+
+def test_targets_read_rpc_from_environment():
+    targets = get_targets(MANIFEST, {"HOLESKY_RPC_URL": "http://holesky", "MAINNET_RPC_URL": "http://mainnet"})
+    assert [(target.name, target.uri, target.chain_id) for target in targets] == [
+        ("holesky", "http://holesky", 17000),
+        ("mainnet", "http://mainnet", 1),
+    ]
+
+    with pytest.raises(AssertionError, match="MAINNET_RPC_URL"):
+        get_targets(MANIFEST, {"HOLESKY_RPC_URL": "http://holesky"})
+
+    local = get_local_targets(MANIFEST, ["http://127.0.0.1:1", "http://127.0.0.1:2"])
+    assert [(target.name, target.chain_id) for target in local] == [
+        ("holesky-local", LOCAL_BASE_CHAIN_ID),
+        ("mainnet-local", LOCAL_BASE_CHAIN_ID + 1),
+    ]
+
+
+def test_deployed_entries_are_written_all_or_nothing(tmp_path):
+    # a file in place of a network directory makes the second entry fail
+    (tmp_path / "mainnet").write_text("")
+    entries = {
+        str(tmp_path / "holesky" / "gateseal" / "0x01.json"): {"gate_seal": "0x01"},
+        str(tmp_path / "mainnet" / "gateseal" / "0x02.json"): {"gate_seal": "0x02"},
+    }
+    with pytest.raises(OSError):
+        write_deployed_entries(entries)
+    assert os.listdir(tmp_path / "holesky" / "gateseal") == []
+
+    del entries[str(tmp_path / "mainnet" / "gateseal" / "0x02.json")]
+    write_deployed_entries(entries)
+    with open(tmp_path / "holesky" / "gateseal" / "0x01.json") as deployed_file:
+        assert json.load(deployed_file) == {"gate_seal": "0x01"}
+
+
+"""
+
+    LOCAL NODES
+
+"""
+
+
+def test_deploys_to_local_nodes(project, deployer, sealing_committee, sealables, seal_duration_seconds, tmp_path):
+    with start_local_nodes(2) as uris:
+        seals = [
+            {
+                "sealing_committee": sealing_committee.address,
+                "seal_duration_seconds": seal_duration_seconds,
+                "sealables": [sealable.address for sealable in sealables],
+                "expiry_timestamp": int(Rpc(uri)("eth_getBlockByNumber", ["latest", False])["timestamp"], 16)
+                + 30 * SECONDS_PER_DAY,
+            }
+            for uri in uris
+        ]
+        manifest = {
+            "networks": {
+                name: {"rpc": "", "chain_id": 0, "seals": [seal]}
+                for name, seal in zip(["holesky", "mainnet"], seals)
+            }
+        }
+        targets = get_local_targets(manifest, uris)
+        plans = prepare_networks(
+            targets,
+            deployer.address,
+            project.GateSeal.contract_type.deployment_bytecode.bytecode,
+            project.GateSealFactory.contract_type.deployment_bytecode.bytecode,
+            FeePolicy(10**9, 100 * 10**9, 25),
+            str(tmp_path),
+        )
+        entries, errors = deploy_networks(
+            plans, ape_signer(deployer, project.provider.network.ecosystem), deployer.address
+        )
+
+        assert errors == {}
+        for target, plan in zip(targets, plans):
+            network_entries = [entry for filename, entry in entries.items() if f"/{target.name}/" in filename]
+            assert len(network_entries) == 2
+            gate_seal = plan.steps[2].contract_address
+            assert any(entry.get("gate_seal") == gate_seal for entry in network_entries)
+            # every node has its own chain, nonces and contracts
+            assert Rpc(target.uri)("eth_chainId", []) == hex(target.chain_id)
+            assert Rpc(target.uri)("eth_getCode", [gate_seal, "latest"]) != "0x"
+            assert plan.journal.get(plan.steps[2].name)["status"] == "mined"
@@ -0,0 +1,108 @@
+import json
+import os
+
+from tests.perf_plugin import Metrics, build_report, format_slowest, slowest_tests, summarize_blocks
+
+pytest_plugins = ["pytester"]
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_summarize_blocks():
+    blocks = [
+        {"gasUsed": 21000, "transactions": [{"to": "0x01"}]},
+        {"gasUsed": 500000, "transactions": [{"to": None}, {"to": "0x02"}]},
+        {"gasUsed": 100000, "transactions": [{"to": ""}]},
+    ]
+    assert summarize_blocks(blocks) == (4, 2, 621000)
+    assert summarize_blocks([]) == (0, 0, 0)
+
+
+def test_metrics_add_up():
+    assert Metrics(1.5, 1, 1, 100, 3) + Metrics(2, 2, 0, 50, 1) == Metrics(3.5, 3, 1, 150, 4)
+
+
+TESTS = {
+    "tests/test_b.py::test_fast": {
+        "setup": Metrics(1, 0, 0, 0, 1),
+        "call": Metrics(2, 1, 0, 50, 2),
+        "outcome": "passed",
+    },
+    "tests/test_a.py::test_slow": {
+        "setup": Metrics(100, 3, 3, 900, 20),
+        "call": Metrics(50, 1, 0, 60, 5),
+        "teardown": Metrics(1, 0, 0, 0, 1),
+        "outcome": "failed",
+    },
+}
+FIXTURES = {"gate_seal": {"executions": 2, "metrics": Metrics(80.12345, 2, 2, 800, 10)}}
+
+
+def test_slowest_tests():
+    assert [nodeid for nodeid, _ in slowest_tests(TESTS, 1)] == ["tests/test_a.py::test_slow"]
+    lines = format_slowest(TESTS, FIXTURES, 10)
+    assert lines[1].endswith("tests/test_a.py::test_slow")
+    assert lines[-1].endswith("gate_seal")
+
+
+def test_report_is_sorted_and_totalled():
+    report = build_report(TESTS, FIXTURES)
+    assert list(report["tests"]) == ["tests/test_a.py::test_slow", "tests/test_b.py::test_fast"]
+    assert report["total"] == Metrics(154, 5, 3, 1010, 29).to_dict()
+    assert report["tests"]["tests/test_b.py::test_fast"]["teardown"] is None
+    assert report["tests"]["tests/test_a.py::test_slow"]["outcome"] == "failed"
+    assert report["fixtures"]["gate_seal"] == {
+        "executions": 2,
+        "wall_ms": 80.123,
+        "transactions": 2,
+        "deployments": 2,
+        "gas_used": 800,
+        "rpc_calls": 10,
+    }
+
+
+"""
+
+    LOCAL CHAIN
+
+"""
+
+# returns 42 from every call, deployed without a compiler
+ANSWER_INITCODE = "0x600a600c600039600a6000f3602a60005260206000f3"
+
+
+def test_measures_a_session_on_the_local_chain(pytester, monkeypatch):
+    monkeypatch.setenv("PYTHONPATH", REPOSITORY)
+    pytester.makepyfile(
+        test_chain=f"""
+        import pytest
+        from ape.contracts import ContractContainer
+        from ethpm_types import ContractType
+
+        @pytest.fixture
+        def answer(accounts):
+            container = ContractContainer(
+                ContractType(contractName="Answer", abi=[], deploymentBytecode={{"bytecode": "{ANSWER_INITCODE}"}})
+            )
+            return container.deploy(sender=accounts[0])
+
+        def test_transfer(accounts, answer, chain):
+            accounts[0].transfer(accounts[1], 1)
+            assert chain.provider.get_code(answer.address)
+        """
+    )
+    result = pytester.runpytest_subprocess(
+        "-p", "tests.perf_plugin", "--perf-report", "perf.json", "--network", "ethereum:local:test"
+    )
+    result.assert_outcomes(passed=1)
+
+    with open(pytester.path / "perf.json") as report_file:
+        report = json.load(report_file)
+    test = report["tests"]["test_chain.py::test_transfer"]
+    assert test["setup"]["deployments"] == 1
+    assert test["setup"]["rpc_calls"] > 0
+    assert test["call"]["transactions"] == 1
+    assert test["call"]["deployments"] == 0
+    assert test["call"]["rpc_calls"] > 0
+    assert report["fixtures"]["answer"]["deployments"] == 1
+    assert report["fixtures"]["answer"]["rpc_calls"] > 0
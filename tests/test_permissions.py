@@ -0,0 +1,192 @@
+import asyncio
+
+import pytest
+from ape import reverts
+
+from utils.abi import encode_address, encode_uint256, function_selector, keccak
+from utils.permissions import (
+    Probe,
+    check_permissions,
+    find_drift,
+    get_active_gate_seals,
+    get_expiry_failures,
+    get_gate_seal_pairs,
+    parse_probes,
+)
+from utils.async_rpc import AsyncRpc
+from utils.rpc import RpcError
+from utils.seal_errors import FAILURE_PAUSE_REVERTED, encode_seal_failures
+
+PAUSE_ROLE = keccak(b"PausableUntil.PauseRole")
+GATE_SEALS = [f"0x{index:040x}" for index in range(1, 4)]
+SEALABLES = [f"0x{index:040x}" for index in range(0x100, 0x103)]
+
+
+class FakeRpc:
+    """
+    Answers the eth_calls of the checker from `roles[(sealable, gate_seal)]` and `owners[sealable]`.
+    """
+
+    def __init__(self, roles: dict, owners: dict, calls_log: list):
+        self.roles = roles
+        self.owners = owners
+        self.calls_log = calls_log
+
+    async def batch(self, calls, raise_errors=True):
+        roles, owners, calls_log = self.roles, self.owners, self.calls_log
+        calls_log.append(len(calls))
+        results = []
+        for _, (call, _) in calls:
+            to, data = call["to"], bytes.fromhex(call["data"][2:])
+            if data[:4] == function_selector("PAUSE_ROLE()"):
+                results.append("0x" + PAUSE_ROLE.hex())
+            elif data[:4] == function_selector("owner()") and to in owners:
+                results.append("0x" + encode_address(owners[to]).hex())
+            elif data[:4] == function_selector("hasRole(bytes32,address)"):
+                gate_seal = "0x" + data[-20:].hex()
+                results.append("0x" + encode_uint256(roles.get((to, gate_seal), False)).hex())
+            else:
+                results.append(RpcError("eth_call", {"message": "execution reverted"}))
+        return results
+
+
+def check(rpc, pairs, *args):
+    return asyncio.run(check_permissions(rpc, pairs, *args))
+
+
+def test_checks_every_pair_in_two_batches():
+    pairs = [(gate_seal, sealable) for gate_seal in GATE_SEALS for sealable in SEALABLES]
+    roles = {(sealable, gate_seal): True for gate_seal, sealable in pairs}
+    roles[(SEALABLES[1], GATE_SEALS[2])] = False
+    calls_log = []
+
+    checks = check(FakeRpc(roles, {}, calls_log), pairs)
+    # one role getter per distinct sealable, one hasRole per pair
+    assert calls_log == [len(SEALABLES), len(pairs)]
+    assert [(check.gate_seal, check.sealable) for check in checks if not check.permitted] == [
+        (GATE_SEALS[2], SEALABLES[1])
+    ]
+
+
+def test_configured_probes():
+    default_probe, probes = parse_probes(
+        {
+            "sealables": {
+                SEALABLES[0]: {"kind": "owner"},
+                SEALABLES[1]: {"role": "0x" + PAUSE_ROLE.hex()},
+                SEALABLES[2]: {"role_getter": "PAUSER_ROLE()"},
+            }
+        }
+    )
+    assert default_probe == Probe()
+    pairs = [(GATE_SEALS[0], sealable) for sealable in SEALABLES]
+    rpc = FakeRpc({(SEALABLES[1], GATE_SEALS[0]): True}, {SEALABLES[0]: GATE_SEALS[0]}, [])
+
+    checks = check(rpc, pairs, default_probe, probes)
+    assert [(check.probe, check.permitted) for check in checks] == [
+        ("owner", True),
+        ("has_role", True),
+        ("has_role", None),
+    ]
+    assert "execution reverted" in checks[2].error
+
+
+def test_parse_probes_rejects_unknown():
+    with pytest.raises(AssertionError, match="unknown probe kind"):
+        parse_probes({"default": {"kind": "pauser"}})
+    with pytest.raises(AssertionError, match="unknown probe keys"):
+        parse_probes({"default": {"rol": "0x00"}})
+
+
+def test_find_drift():
+    pairs = [(GATE_SEALS[0], sealable) for sealable in SEALABLES]
+    roles = {(SEALABLES[0], GATE_SEALS[0]): True, (SEALABLES[2], GATE_SEALS[0]): True}
+    checks = check(FakeRpc(roles, {}, []), pairs)
+    previous = {checks[1].key: True, checks[2].key: False}
+
+    assert find_drift(checks, previous) == [
+        f"{GATE_SEALS[0]} -> {SEALABLES[1]}: not permitted by has_role, was permitted on the previous check",
+        f"{GATE_SEALS[0]} -> {SEALABLES[2]}: permitted again",
+    ]
+
+
+def test_gate_seal_pairs():
+    entries = [
+        {"gate_seal": GATE_SEALS[0], "params": {"sealables": SEALABLES[:2]}},
+        {"gate_seal": GATE_SEALS[1], "params": {"sealables": SEALABLES[2:]}},
+    ]
+    assert get_gate_seal_pairs(entries) == [
+        (GATE_SEALS[0], SEALABLES[0]),
+        (GATE_SEALS[0], SEALABLES[1]),
+        (GATE_SEALS[1], SEALABLES[2]),
+    ]
+
+
+
+class ExpiryRpc:
+    """
+    Answers `get_expiry_timestamp()` of every GateSeal with `results[gate_seal]`.
+    """
+
+    def __init__(self, results: dict):
+        self.results = results
+
+    async def batch(self, calls, raise_errors=True):
+        assert not raise_errors
+        return [self.results[call["to"]] for _, (call, _) in calls]
+
+
+def test_unreadable_expiry_is_drift():
+    rpc = ExpiryRpc(
+        {
+            GATE_SEALS[0]: "0x" + encode_uint256(2000).hex(),
+            GATE_SEALS[1]: "0x" + encode_uint256(1000).hex(),
+            # no code at the address, the call succeeds with no data
+            GATE_SEALS[2]: "0x",
+        }
+    )
+    active, errors = asyncio.run(get_active_gate_seals(rpc, GATE_SEALS, 1000))
+    assert active == [GATE_SEALS[0]]
+    assert errors == {GATE_SEALS[2]: "eth_call failed: no return data"}
+
+    entries = [{"gate_seal": gate_seal, "params": {"sealables": SEALABLES[:2]}} for gate_seal in GATE_SEALS]
+    assert find_drift(get_expiry_failures(entries, errors), {}) == [
+        f"{GATE_SEALS[2]} -> {sealable}: expiry probe failed, eth_call failed: no return data"
+        for sealable in SEALABLES[:2]
+    ]
+
+
+"""
+
+    LOCAL NODE
+
+"""
+
+
+def test_detects_revoked_role(
+    networks, project, deployer, sealing_committee, seal_duration_seconds, expiry_timestamp
+):
+    sealables = [project.AccessControlledSealableMock.deploy(sender=deployer) for _ in range(3)]
+    sealables.append(project.SealableMock.deploy(False, False, sender=deployer))
+    gate_seal = project.GateSeal.deploy(
+        sealing_committee, seal_duration_seconds, sealables, expiry_timestamp, sender=deployer
+    )
+    role = sealables[0].PAUSE_ROLE()
+    for sealable in sealables[:3]:
+        sealable.grantRole(role, gate_seal, sender=deployer)
+
+    async def check_on_node(pairs):
+        async with AsyncRpc(networks.active_provider.http_uri) as rpc:
+            return await check_permissions(rpc, pairs)
+
+    pairs = [(gate_seal.address, sealable.address) for sealable in sealables]
+    checks = asyncio.run(check_on_node(pairs))
+    assert [check.permitted for check in checks] == [True, True, True, None]
+
+    sealables[1].revokeRole(role, gate_seal, sender=deployer)
+    checks = asyncio.run(check_on_node(pairs[:3]))
+    assert [check.permitted for check in checks] == [True, False, True]
+
+    # the check predicts the failure seal() would run into
+    with reverts(str(encode_seal_failures({1: FAILURE_PAUSE_REVERTED}))):
+        gate_seal.seal(sealables[:3], sender=sealing_committee)
@@ -0,0 +1,156 @@
+import json
+
+import pytest
+
+from utils.abi import keccak
+from utils.address import compute_create_address
+from utils.pipeline import (
+    Journal,
+    NonceManager,
+    Step,
+    ape_signer,
+    build_deployment_plan,
+    execute_plan,
+    get_created_gate_seal,
+    get_plan_id,
+    get_step_receipts,
+)
+from utils.sender import GWEI, FeeBumpingSender, FeePolicy
+
+POLICY = FeePolicy(2 * GWEI, 100 * GWEI)
+
+
+def _execute(provider, deployer, steps, journal):
+    sender = FeeBumpingSender(
+        provider.make_request,
+        ape_signer(deployer, provider.network.ecosystem),
+        deployer.address,
+        provider.chain_id,
+        POLICY,
+        journal,
+    )
+    return execute_plan(steps, sender)
+
+
+def _plan(project, deployer, seals):
+    return build_deployment_plan(
+        deployer.address,
+        NonceManager(deployer.nonce),
+        project.GateSeal.contract_type.deployment_bytecode.bytecode,
+        project.GateSealFactory.contract_type.deployment_bytecode.bytecode,
+        seals,
+    )
+
+
+def _seals(n, sealing_committee, sealables, expiry_timestamp, seal_duration_seconds):
+    return [
+        {
+            "sealing_committee": sealing_committee.address,
+            "seal_duration_seconds": seal_duration_seconds,
+            "sealables": [sealable.address for sealable in sealables],
+            "expiry_timestamp": expiry_timestamp,
+        }
+        for _ in range(n)
+    ]
+
+
+def test_pipeline_deploys_predicted_addresses(
+    project, deployer, sealing_committee, sealables, expiry_timestamp, seal_duration_seconds, tmp_path
+):
+    steps = _plan(
+        project,
+        deployer,
+        _seals(3, sealing_committee, sealables, expiry_timestamp - 60, seal_duration_seconds),
+    )
+    journal = Journal(str(tmp_path / "journal.json"))
+    journal.begin(get_plan_id(steps), steps[0].nonce)
+
+    receipts = _execute(project.provider, deployer, steps, journal)
+
+    blueprint, factory, *gate_seals = steps
+    assert project.GateSealFactory.at(factory.contract_address).get_blueprint() == blueprint.contract_address
+    for index, step in enumerate(gate_seals):
+        assert step.contract_address == compute_create_address(factory.contract_address, index + 1)
+        assert get_created_gate_seal(receipts[step.name]) == step.contract_address.lower()
+        gate_seal = project.GateSeal.at(step.contract_address)
+        assert gate_seal.get_sealing_committee() == sealing_committee
+
+    with open(tmp_path / "journal.json") as journal_file:
+        assert all(step["status"] == "mined" for step in json.load(journal_file)["steps"].values())
+
+
+def test_pipeline_resumes_from_journal(
+    project, deployer, sealing_committee, sealables, expiry_timestamp, seal_duration_seconds, tmp_path
+):
+    steps = _plan(
+        project,
+        deployer,
+        _seals(2, sealing_committee, sealables, expiry_timestamp - 60, seal_duration_seconds),
+    )
+    filename = str(tmp_path / "journal.json")
+    journal = Journal(filename)
+    journal.begin(get_plan_id(steps), steps[0].nonce)
+
+    # simulate a crash after the blueprint and the factory were mined
+    _execute(project.provider, deployer, steps[:2], journal)
+    nonce_after_crash = deployer.nonce
+
+    resumed = Journal(filename)
+    assert resumed.start_nonce == steps[0].nonce
+    receipts = _execute(project.provider, deployer, steps, resumed)
+
+    assert set(receipts) == {step.name for step in steps[2:]}, "mined steps must not be re-sent"
+    assert deployer.nonce == nonce_after_crash + 2
+
+
+class FakeNode:
+    """
+    Rejects every transaction with "nonce too low", knows the receipts of `mined` hashes.
+    """
+
+    def __init__(self, mined: set):
+        self.mined = mined
+
+    def __call__(self, method: str, params: list):
+        if method == "eth_sendRawTransaction":
+            raise ValueError("nonce too low")
+        if method == "eth_getBlockByNumber":
+            return {"number": "0x1", "baseFeePerGas": "0x0"}
+        if method == "eth_getTransactionCount":
+            # nonce 0 is used
+            return "0x1"
+        assert method == "eth_getTransactionReceipt"
+        if params[0] not in self.mined:
+            return None
+        return {"status": "0x1", "blockNumber": "0x1", "transactionHash": params[0], "logs": []}
+
+    def batch(self, calls: list[tuple[str, list]]) -> list:
+        return [self(method, params) for method, params in calls]
+
+
+def _fake_plan(tmp_path):
+    steps = [Step("blueprint", 0, None, b"\x00", "0x" + "01" * 20, 100_000)]
+    journal = Journal(str(tmp_path / "journal.json"))
+    journal.begin(get_plan_id(steps), 0)
+    return steps, journal
+
+
+def _fake_execute(steps, journal, node):
+    sender = FeeBumpingSender(node, lambda transaction: b"\x01", "0x" + "aa" * 20, 1, POLICY, journal)
+    return execute_plan(steps, sender, timeout=1)
+
+
+def test_nonce_too_low_is_fine_if_the_transaction_was_mined(tmp_path):
+    steps, journal = _fake_plan(tmp_path)
+    transaction_hash = "0x" + keccak(b"\x01").hex()
+
+    receipts = _fake_execute(steps, journal, FakeNode({transaction_hash}))
+    assert receipts["blueprint"]["transactionHash"] == transaction_hash
+    # the receipts of mined steps are fetched again from the journal
+    assert get_step_receipts(FakeNode({transaction_hash}), steps, journal) == receipts
+
+
+def test_nonce_used_by_another_transaction_fails(tmp_path):
+    steps, journal = _fake_plan(tmp_path)
+    with pytest.raises(RuntimeError, match="nonce 0 was used by another transaction"):
+        _fake_execute(steps, journal, FakeNode(set()))
@@ -0,0 +1,106 @@
+from utils.profiler import (
+    CodeMap,
+    fold_stacks,
+    format_folded_stacks,
+    get_function_lines,
+    get_intrinsic_gas,
+    get_step_costs,
+    is_shanghai_block,
+    profile_struct_logs,
+    render_flamegraph_svg,
+    summarize_by_function,
+    summarize_by_line,
+)
+
+FACTORY = "0x" + "aa" * 20
+GATE_SEAL = "0x" + "bb" * 20
+CREATED = "0x" + "cc" * 20
+
+SOURCE = """# @version 0.3.7
+
+SEALING_COMMITTEE: immutable(address)
+
+
+@external
+def seal(_sealables: DynArray[address, 8]):
+    assert msg.sender == SEALING_COMMITTEE
+    self._expire_immediately()
+
+
+@internal
+def _expire_immediately():
+    self.expiry_timestamp = block.timestamp
+"""
+
+# the factory creates a contract and then calls a GateSeal
+STRUCT_LOGS = [
+    {"depth": 1, "pc": 0, "op": "PUSH1", "gas": 1000, "gasCost": 3, "stack": []},
+    {"depth": 1, "pc": 2, "op": "CREATE", "gas": 997, "gasCost": 32000, "stack": ["0", "0", "0"]},
+    {"depth": 2, "pc": 0, "op": "PUSH1", "gas": 900, "gasCost": 3, "stack": []},
+    {"depth": 2, "pc": 2, "op": "RETURN", "gas": 897, "gasCost": 0, "stack": ["0", "0"]},
+    {"depth": 1, "pc": 3, "op": "POP", "gas": 600, "gasCost": 2, "stack": ["0" * 24 + CREATED[2:]]},
+    {"depth": 1, "pc": 4, "op": "CALL", "gas": 598, "gasCost": 100, "stack": ["0", GATE_SEAL[2:], "ff"]},
+    {"depth": 2, "pc": 0, "op": "SSTORE", "gas": 500, "gasCost": 100, "stack": []},
+    {"depth": 2, "pc": 1, "op": "STOP", "gas": 400, "gasCost": 0, "stack": []},
+    {"depth": 1, "pc": 5, "op": "STOP", "gas": 448, "gasCost": 0, "stack": []},
+]
+
+
+def resolve(address):
+    if address == FACTORY:
+        return CodeMap("GateSealFactory", {4: 7}, {7: "create_gate_seal"}, [])
+    if address in (GATE_SEAL, CREATED):
+        return CodeMap("GateSeal", {0: 14}, get_function_lines(SOURCE), SOURCE.splitlines())
+    return None
+
+
+def test_function_lines():
+    functions = get_function_lines(SOURCE)
+    assert functions[3] == "<module>"
+    assert functions[8] == "seal"
+    assert functions[11] == "seal"
+    assert functions[12] == "_expire_immediately"
+    assert functions[14] == "_expire_immediately"
+
+
+def test_step_costs_count_gas_once():
+    costs = get_step_costs(STRUCT_LOGS)
+    assert costs == [3, 394, 3, 0, 2, 50, 100, 0, 0]
+    assert sum(costs) == STRUCT_LOGS[0]["gas"] - STRUCT_LOGS[-1]["gas"]
+
+
+def test_profile_attributes_frames():
+    steps = profile_struct_logs(STRUCT_LOGS, FACTORY, None, resolve)
+
+    assert summarize_by_function(steps) == {
+        ("GateSealFactory", "<unmapped>"): 3 + 394 + 2 + 0,
+        ("GateSeal", "__init__"): 3,
+        ("GateSealFactory", "create_gate_seal"): 50,
+        ("GateSeal", "_expire_immediately"): 100,
+        ("GateSeal", "<unmapped>"): 0,
+    }
+    assert summarize_by_line(steps)[("GateSeal", 14)] == 100
+
+    folded = fold_stacks(steps, intrinsic_gas=21000)
+    assert folded["<intrinsic>"] == 21000
+    assert folded["GateSealFactory.create_gate_seal;GateSeal._expire_immediately"] == 100
+    assert folded["GateSealFactory.<unmapped>;GateSeal.__init__"] == 3
+    assert "GateSeal.<unmapped>" not in format_folded_stacks(folded)
+
+
+def test_flamegraph_svg():
+    svg = render_flamegraph_svg({"a;b": 10, "a;c": 30, "d": 0}, "seal")
+    assert svg.startswith("<svg") and svg.endswith("</svg>")
+    assert "a: 40 gas" in svg
+    assert "d:" not in svg
+
+
+def test_intrinsic_gas():
+    initcode = bytes([0, 1]) * 32
+    assert get_intrinsic_gas(initcode, False) == 21000 + 32 * 4 + 32 * 16
+    # two words of initcode are charged from Shanghai on only
+    assert get_intrinsic_gas(initcode, True) == 21000 + 32 * 4 + 32 * 16 + 32000 + 2 * 2
+    assert get_intrinsic_gas(initcode, True, shanghai=False) == 21000 + 32 * 4 + 32 * 16 + 32000
+
+    assert is_shanghai_block({"number": "0x1", "withdrawalsRoot": "0x" + "56" * 32})
+    assert not is_shanghai_block({"number": "0x1"})
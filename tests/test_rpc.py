@@ -0,0 +1,67 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils.rpc import Rpc, RpcError
+
+
+class FakeNode(BaseHTTPRequestHandler):
+    """
+    Answers JSON-RPC batches with the first param of every call, or with `response` if set,
+    and records the client port of every request.
+    """
+
+    protocol_version = "HTTP/1.1"
+    response = None
+    client_ports = []
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.client_ports.append(self.client_address[1])
+        response = self.response
+        if response is None:
+            response = [{"jsonrpc": "2.0", "id": item["id"], "result": item["params"][0]} for item in payload]
+        body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def node():
+    handler = type("Handler", (FakeNode,), {"client_ports": []})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield handler, f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_keeps_one_session(node):
+    handler, uri = node
+    rpc = Rpc(uri)
+    assert rpc("eth_echo", ["0x1"]) == "0x1"
+    assert rpc.batch([("eth_echo", ["0x2"]), ("eth_echo", ["0x3"])]) == ["0x2", "0x3"]
+    assert rpc("eth_echo", ["0x4"]) == "0x4"
+    # every request went over the same connection
+    assert len(handler.client_ports) == 3
+    assert len(set(handler.client_ports)) == 1
+
+
+def test_non_batch_response(node):
+    handler, uri = node
+    handler.response = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch too large"}}
+    with pytest.raises(RpcError, match="batch too large"):
+        Rpc(uri)("eth_echo", ["0x1"])
+
+    handler.response = "rate limited"
+    with pytest.raises(RpcError, match="not a batch response"):
+        Rpc(uri)("eth_echo", ["0x1"])
@@ -0,0 +1,87 @@
+import glob
+import os
+
+import pytest
+
+from utils.scenario import (
+    SCENARIOS_DIRECTORY,
+    SEAL,
+    SentTransaction,
+    format_summary,
+    load_scenario,
+    parse_scenario,
+    plan_failing_sealables,
+    plan_gate_seal_sealables,
+    summarize_scenario,
+)
+
+
+@pytest.mark.parametrize("filename", sorted(glob.glob(os.path.join(SCENARIOS_DIRECTORY, "*.json"))))
+def test_bundled_scenarios_are_valid(filename):
+    scenario = load_scenario(filename)
+    assert scenario.gate_seals > 0
+
+
+def test_defaults():
+    scenario = parse_scenario({"name": "defaults", "factories": 2, "sealables_per_gate_seal": 3})
+    assert scenario.gate_seals == 2
+    assert scenario.sealable_pool == 6
+    assert scenario.block_gas_limit == 30_000_000
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"factories": 1},
+        {"name": "unknown key", "gatseals": 1},
+        {"name": "too many sealables", "sealables_per_gate_seal": 9},
+        {"name": "small pool", "sealables_per_gate_seal": 8, "sealable_pool": 4},
+        {"name": "too many failing", "sealable_pool": 8, "failing_sealables": 9},
+    ],
+)
+def test_invalid_scenarios(data):
+    with pytest.raises(AssertionError):
+        parse_scenario(data)
+
+
+def test_plan_shares_the_pool():
+    scenario = parse_scenario(
+        {"name": "shared", "gate_seals_per_factory": 3, "sealables_per_gate_seal": 3, "sealable_pool": 4}
+    )
+    assert plan_gate_seal_sealables(scenario) == [[0, 1, 2], [3, 0, 1], [2, 3, 0]]
+
+
+def test_failing_sealables_are_deterministic():
+    scenario = parse_scenario({"name": "failing", "sealable_pool": 16, "failing_sealables": 3, "seed": 7})
+    failing = plan_failing_sealables(scenario)
+    assert len(failing) == 3
+    assert failing == plan_failing_sealables(scenario)
+
+
+def test_summary():
+    scenario = parse_scenario({"name": "summary"})
+    sent = [
+        SentTransaction(SEAL, "0x01", 10),
+        SentTransaction(SEAL, "0x02", 10, expected_to_fail=True),
+        SentTransaction(SEAL, "0x03", 10),
+        SentTransaction("transfer", "0x04", 10),
+    ]
+    receipts = {
+        "0x01": {"blockNumber": "0xb", "status": "0x1"},
+        "0x02": {"blockNumber": "0xc", "status": "0x1"},
+        "0x03": None,
+        "0x04": {"blockNumber": "0xb", "status": "0x0"},
+    }
+    blocks = [{"number": "0xb", "transactions": ["0x01", "0x04"], "gasUsed": "0x7a120", "gasLimit": "0xf4240"}]
+
+    summary = summarize_scenario(scenario, sent, receipts, blocks)
+    seals = summary["transactions"][SEAL]
+    assert seals["sent"] == 3
+    assert seals["included"] == 2
+    assert seals["not_included"] == 1
+    assert seals["failed"] == 0
+    assert seals["unexpected_outcomes"] == 1
+    assert seals["latency_blocks"] == {"min": 1, "p50": 1, "p95": 2, "max": 2}
+    assert summary["transactions"]["transfer"]["failure_rate"] == 1
+    assert summary["blocks"][0]["utilization"] == 0.5
+    assert "seal" in format_summary(summary)
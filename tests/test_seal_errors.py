@@ -0,0 +1,67 @@
+import pytest
+
+from utils.constants import MAX_SEALABLES
+from utils.seal_errors import (
+    FAILURE_NOT_PAUSED,
+    FAILURE_PAUSE_REVERTED,
+    SealFailure,
+    decode_legacy_failed_indexes,
+    decode_seal_failures,
+    encode_seal_failures,
+)
+
+
+def _error_revert_data(message: str) -> bytes:
+    encoded = message.encode()
+    padding = b"\x00" * (-len(encoded) % 32)
+    return (
+        bytes.fromhex("08c379a0")
+        + (32).to_bytes(32, "big")
+        + len(encoded).to_bytes(32, "big")
+        + encoded
+        + padding
+    )
+
+
+def test_encode_matches_contract_example():
+    assert encode_seal_failures({0: FAILURE_PAUSE_REVERTED, 3: FAILURE_NOT_PAUSED}) == 33033
+
+
+def test_decode_message():
+    assert decode_seal_failures("33033") == [
+        SealFailure(0, FAILURE_PAUSE_REVERTED),
+        SealFailure(3, FAILURE_NOT_PAUSED),
+    ]
+
+
+def test_decode_attaches_sealables():
+    sealables = [f"0x{index:040x}" for index in range(MAX_SEALABLES)]
+    failures = decode_seal_failures(
+        encode_seal_failures({MAX_SEALABLES - 1: FAILURE_NOT_PAUSED}), sealables
+    )
+    assert failures == [SealFailure(MAX_SEALABLES - 1, FAILURE_NOT_PAUSED, sealables[-1])]
+    assert failures[0].description == "not paused after pauseFor"
+
+
+@pytest.mark.parametrize("as_hex", [True, False])
+def test_decode_revert_data(as_hex):
+    revert_data = _error_revert_data("257")
+    assert decode_seal_failures("0x" + revert_data.hex() if as_hex else revert_data) == [
+        SealFailure(0, FAILURE_PAUSE_REVERTED)
+    ]
+
+
+def test_roundtrip_all_failed():
+    failures = {index: FAILURE_PAUSE_REVERTED + index % 2 for index in range(MAX_SEALABLES)}
+    decoded = decode_seal_failures(str(encode_seal_failures(failures)))
+    assert {failure.index: failure.reason for failure in decoded} == failures
+
+
+@pytest.mark.parametrize("message", ["sender: not SEALING_COMMITTEE", str(2**24), "1"])
+def test_decode_rejects_other_errors(message):
+    with pytest.raises(AssertionError):
+        decode_seal_failures(message)
+
+
+def test_decode_legacy_failed_indexes():
+    assert decode_legacy_failed_indexes("6320") == [0, 2, 3, 6]
@@ -0,0 +1,204 @@
+from decimal import Decimal
+
+import pytest
+
+from utils.pipeline import Journal, ape_signer
+from utils.rpc import Rpc
+from utils.sender import (
+    FAILED,
+    GWEI,
+    MINED,
+    PENDING,
+    REPLACED,
+    FeeBumpingSender,
+    FeePolicy,
+    bump_fees,
+    fee_policy_from_env,
+    initial_fees,
+)
+
+POLICY = FeePolicy(2 * GWEI, 100 * GWEI, Decimal(25))
+
+
+def test_initial_fees_are_capped():
+    assert initial_fees(POLICY, 10 * GWEI) == (22 * GWEI, 2 * GWEI)
+    assert initial_fees(POLICY, 60 * GWEI) == (100 * GWEI, 2 * GWEI)
+    assert initial_fees(FeePolicy(5 * GWEI, 3 * GWEI), 0) == (3 * GWEI, 3 * GWEI)
+
+
+def test_bump_fees():
+    # both fees grow by the bump
+    assert bump_fees(POLICY, 20 * GWEI, 2 * GWEI, 5 * GWEI) == (25 * GWEI, 2500000000)
+    # the max fee follows a base fee that rose faster than the bump
+    assert bump_fees(POLICY, 20 * GWEI, 2 * GWEI, 30 * GWEI) == (62500000000, 2500000000)
+    # rounded up to clear the replacement threshold
+    assert bump_fees(POLICY, 3, 1, 0) == (4, 2)
+
+
+def test_bump_fees_under_the_cap():
+    assert bump_fees(POLICY, 85 * GWEI, 2 * GWEI, 0) == (100 * GWEI, 2500000000)
+    # less than the 10% a node requires for a replacement is left under the cap
+    assert bump_fees(POLICY, 95 * GWEI, 2 * GWEI, 0) is None
+
+
+def test_fee_policy_from_env():
+    assert fee_policy_from_env({}) == FeePolicy(2 * GWEI, 500 * GWEI, Decimal(25))
+    assert fee_policy_from_env(
+        {"MAX_PRIORITY_FEE_GWEI": "0.5", "MAX_FEE_CAP_GWEI": "80", "FEE_BUMP_PERCENT": "12.5"}
+    ) == FeePolicy(GWEI // 2, 80 * GWEI, Decimal("12.5"))
+
+    with pytest.raises(AssertionError, match="at least 12.5%"):
+        fee_policy_from_env({"FEE_BUMP_PERCENT": "10"})
+    with pytest.raises(AssertionError, match="within the fee cap"):
+        fee_policy_from_env({"MAX_PRIORITY_FEE_GWEI": "10", "MAX_FEE_CAP_GWEI": "5"})
+
+
+class FakeNode:
+    def __init__(self):
+        self.sent = []
+
+    def __call__(self, method, params):
+        if method == "eth_getTransactionCount":
+            return "0x7"
+        if method == "eth_getBlockByNumber":
+            return {"number": "0x10", "baseFeePerGas": hex(GWEI)}
+        if method == "eth_sendRawTransaction":
+            self.sent.append(params[0])
+            return "0x" + "00" * 32
+        raise AssertionError(f"unexpected {method}")
+
+
+def test_failed_signing_is_not_journaled(tmp_path):
+    node = FakeNode()
+    journal = Journal(str(tmp_path / "sender.json"))
+
+    def cancelled(transaction):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        FeeBumpingSender(node, cancelled, "0x" + "01" * 20, 1, POLICY, journal).send("seal", None, b"", 21_000)
+    assert journal.get("seal") is None
+    assert Journal(journal.filename).get("seal") is None
+
+    entry = FeeBumpingSender(node, lambda transaction: b"signed", "0x" + "01" * 20, 1, POLICY, journal).send(
+        "seal", None, b"", 21_000
+    )
+    assert entry["status"] == PENDING
+    assert entry["nonce"] == 7
+    assert [attempt["raw_transaction"] for attempt in entry["attempts"]] == ["0x" + b"signed".hex()]
+    assert node.sent == ["0x" + b"signed".hex()]
+
+
+def test_resends_failed_and_replaced(tmp_path):
+    node = FakeNode()
+    journal = Journal(str(tmp_path / "sender.json"))
+    sender = FeeBumpingSender(node, lambda transaction: b"signed", "0x" + "01" * 20, 1, POLICY, journal)
+    attempt = {"raw_transaction": "0x00", "transaction_hash": "0x01", "max_fee": 1, "max_priority_fee": 1}
+
+    journal.update("mined", status=MINED, nonce=3, attempts=[attempt], transaction_hash="0x01")
+    assert sender.send("mined", None, b"", 21_000)["nonce"] == 3
+    assert node.sent == []
+
+    # the first re-sent transaction is pending at 7
+    for status, nonce in ((FAILED, 7), (REPLACED, 8)):
+        journal.update(status, status=status, nonce=3, attempts=[attempt], transaction_hash="0x01")
+        entry = sender.send(status, None, b"", 21_000)
+        assert entry["status"] == PENDING
+        assert entry["nonce"] == nonce
+        assert "transaction_hash" not in entry
+        assert [attempt["raw_transaction"] for attempt in entry["attempts"]] == ["0x" + b"signed".hex()]
+    assert Journal(journal.filename).get(FAILED) == journal.get(FAILED)
+
+
+"""
+
+    CONGESTION HARNESS
+
+"""
+
+
+@pytest.fixture
+def manual_mining(networks):
+    # transactions stay in the mempool until the test mines a block
+    rpc = Rpc(networks.active_provider.http_uri)
+    rpc("evm_setAutomine", [False])
+    yield rpc
+    rpc("evm_setAutomine", [True])
+
+
+def _congest(rpc, base_fee: int):
+    # the base fee of the next block is forced up, as if the previous blocks were full
+    rpc("hardhat_setNextBlockBaseFeePerGas", [hex(base_fee)])
+    rpc("evm_mine", [])
+
+
+def _sender(networks, rpc, account, journal, policy=POLICY) -> FeeBumpingSender:
+    provider = networks.active_provider
+    return FeeBumpingSender(
+        rpc,
+        ape_signer(account, provider.network.ecosystem),
+        account.address,
+        provider.chain_id,
+        policy,
+        journal,
+    )
+
+
+def test_bumps_until_included(networks, manual_mining, sealing_committee, stranger, tmp_path):
+    rpc = manual_mining
+    journal = Journal(str(tmp_path / "sender.json"))
+    sender = _sender(networks, rpc, sealing_committee, journal)
+
+    # a base fee spike prices out the first attempt
+    max_fee = sender.send("transfer", stranger.address, b"", 21000, value=1)["attempts"][0]["max_fee"]
+    _congest(rpc, 2 * max_fee)
+
+    for _ in range(20):
+        if sender.step()["transfer"] != PENDING:
+            break
+        rpc("evm_mine", [])
+
+    entry = journal.get("transfer")
+    assert entry["status"] == MINED
+    assert len(entry["attempts"]) > 1
+    assert entry["transaction_hash"] == entry["attempts"][-1]["transaction_hash"]
+    fees = [attempt["max_fee"] for attempt in entry["attempts"]]
+    assert fees == sorted(fees) and fees[-1] <= POLICY.max_fee_cap
+
+
+def test_capped_sender_waits(networks, manual_mining, sealing_committee, stranger, tmp_path):
+    rpc = manual_mining
+    policy = FeePolicy(GWEI, 3 * GWEI, Decimal(25))
+    sender = _sender(networks, rpc, sealing_committee, Journal(str(tmp_path / "sender.json")), policy)
+
+    sender.send("transfer", stranger.address, b"", 21000, value=1)
+    for _ in range(5):
+        _congest(rpc, 10 * GWEI)
+        assert sender.step()["transfer"] == PENDING
+
+    attempts = sender.journal.get("transfer")["attempts"]
+    assert attempts[-1]["max_fee"] <= policy.max_fee_cap
+    # once the cap is reached, the sender only keeps the last attempt in the mempool
+    assert len(attempts) < 5
+
+    _congest(rpc, GWEI // 10)
+    rpc("evm_mine", [])
+    assert sender.step()["transfer"] == MINED
+
+
+def test_restart_does_not_send_twice(networks, manual_mining, sealing_committee, stranger, tmp_path):
+    rpc = manual_mining
+    filename = str(tmp_path / "sender.json")
+    nonce = sealing_committee.nonce
+
+    _sender(networks, rpc, sealing_committee, Journal(filename)).send("transfer", stranger.address, b"", 21000, 1)
+
+    # a new process with the same journal resumes the pending transaction at its nonce
+    restarted = _sender(networks, rpc, sealing_committee, Journal(filename))
+    entry = restarted.send("transfer", stranger.address, b"", 21000, 1)
+    assert entry["nonce"] == nonce
+    assert len(entry["attempts"]) == 1
+
+    rpc("evm_mine", [])
+    assert restarted.step() == {"transfer": MINED}
+    assert sealing_committee.nonce == nonce + 1
@@ -0,0 +1,185 @@
+from ape import reverts
+import pytest
+import random
+
+from utils.constants import (
+    MAX_EXPIRY_PERIOD_SECONDS,
+    MAX_SEAL_DURATION_SECONDS,
+    MAX_SEALABLES,
+    MIN_SEAL_DURATION_SECONDS,
+    ZERO_ADDRESS,
+)
+from utils.validation import (
+    SEALABLES_EXCEEDS_MAX,
+    check_constructor,
+    check_seal,
+    validate_gate_seal_config,
+    validate_manifest,
+    validate_seal,
+)
+
+COMMITTEE = "0x6FB824b56210c67706AA39D4443bebB1d7eA1386"
+SEALABLES = [f"0x{index:040x}" for index in range(1, 4)]
+NOW = 1700000000
+DURATION = 7 * 24 * 60 * 60
+
+
+def test_valid_config():
+    assert validate_gate_seal_config(COMMITTEE, DURATION, SEALABLES, NOW + 1, NOW) == []
+    assert check_constructor(COMMITTEE, DURATION, SEALABLES, NOW + MAX_EXPIRY_PERIOD_SECONDS, NOW) is None
+
+
+def test_first_error_follows_the_constructor_order():
+    errors = validate_gate_seal_config(ZERO_ADDRESS, 1, [ZERO_ADDRESS, ZERO_ADDRESS], NOW, NOW)
+    assert errors == [
+        "sealing committee: zero address",
+        "seal duration: too short",
+        "expiry timestamp: must be in the future",
+        "sealables: includes zero address",
+        "sealables: includes duplicates",
+    ]
+    assert check_constructor(ZERO_ADDRESS, 1, [ZERO_ADDRESS, ZERO_ADDRESS], NOW, NOW) == errors[0]
+
+
+@pytest.mark.parametrize(
+    "sealing_committee, seal_duration_seconds, sealables, expiry_timestamp, error",
+    [
+        ("0x1234", DURATION, SEALABLES, NOW + 1, "invalid address: 0x1234"),
+        (COMMITTEE.lower(), DURATION, SEALABLES, NOW + 1, None),
+        (COMMITTEE.replace("F", "f", 1), DURATION, SEALABLES, NOW + 1, "invalid address"),
+        (COMMITTEE, -1, SEALABLES, NOW + 1, "invalid uint256: -1"),
+        (COMMITTEE, "604800", SEALABLES, NOW + 1, "invalid uint256: 604800"),
+        (COMMITTEE, DURATION, SEALABLES * 3, NOW + 1, SEALABLES_EXCEEDS_MAX),
+        (COMMITTEE, MAX_SEAL_DURATION_SECONDS + 1, SEALABLES, NOW + 1, "seal duration: exceeds max"),
+        (COMMITTEE, DURATION, [], NOW + 1, "sealables: empty list"),
+        (COMMITTEE, DURATION, SEALABLES, NOW + MAX_EXPIRY_PERIOD_SECONDS + 1, "expiry timestamp: exceeds max"),
+        (COMMITTEE, DURATION, [SEALABLES[0], SEALABLES[0].upper().replace("0X", "0x")], NOW + 1, "duplicates"),
+    ],
+)
+def test_constructor_errors(sealing_committee, seal_duration_seconds, sealables, expiry_timestamp, error):
+    message = check_constructor(sealing_committee, seal_duration_seconds, sealables, expiry_timestamp, NOW)
+    if error is None:
+        assert message is None
+    else:
+        assert error in message
+
+
+def test_seal_errors():
+    assert validate_seal(COMMITTEE, COMMITTEE, SEALABLES, NOW + 1, SEALABLES[:1], NOW) == []
+    assert validate_seal(SEALABLES[0], COMMITTEE, SEALABLES, NOW, [], NOW) == [
+        "sender: not SEALING_COMMITTEE",
+        "gate seal: expired",
+        "sealables: empty subset",
+    ]
+    assert check_seal(COMMITTEE, COMMITTEE, SEALABLES, NOW + 1, [SEALABLES[0]] * 2, NOW) == (
+        "sealables: includes duplicates"
+    )
+    assert check_seal(COMMITTEE, COMMITTEE, SEALABLES, NOW + 1, [COMMITTEE], NOW) == (
+        "sealables: includes a non-sealable"
+    )
+
+
+def test_manifest():
+    valid = {
+        "sealing_committee": COMMITTEE,
+        "seal_duration_seconds": DURATION,
+        "sealables": SEALABLES,
+        "expiry_timestamp": NOW + 1,
+    }
+    errors = validate_manifest(
+        [valid, {**valid, "seal_duration_seconds": 1}, {"sealing_committee": COMMITTEE}], NOW
+    )
+    assert errors == {
+        1: ["seal duration: too short"],
+        2: [
+            "config: missing seal_duration_seconds",
+            "config: missing sealables",
+            "config: missing expiry_timestamp",
+        ],
+    }
+
+
+"""
+
+    DIFFERENTIAL TESTS AGAINST THE CONTRACT
+
+"""
+
+
+def _random_constructor_arguments(rng, now, sealables):
+    # every field is either valid or one of the values around the boundaries of its asserts
+    sealing_committee = rng.choice([sealables[0].address, ZERO_ADDRESS])
+    seal_duration_seconds = rng.choice(
+        [
+            MIN_SEAL_DURATION_SECONDS - 1,
+            MIN_SEAL_DURATION_SECONDS,
+            DURATION,
+            MAX_SEAL_DURATION_SECONDS,
+            MAX_SEAL_DURATION_SECONDS + 1,
+        ]
+    )
+    addresses = [sealable.address for sealable in sealables]
+    chosen = rng.choice(
+        [
+            [],
+            addresses[: rng.randint(1, MAX_SEALABLES)],
+            addresses[:2] + [ZERO_ADDRESS],
+            addresses[:2] + addresses[:1],
+        ]
+    )
+    # `now` is the pending timestamp, the 100 seconds margin keeps the valid values
+    # clear of the block timestamp of the deployment
+    expiry_timestamp = rng.choice(
+        [now - 1, now + 100, now + MAX_EXPIRY_PERIOD_SECONDS - 100, now + MAX_EXPIRY_PERIOD_SECONDS + 100]
+    )
+    return sealing_committee, seal_duration_seconds, chosen, expiry_timestamp
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_constructor_matches_contract(project, deployer, chain, generate_sealables, seed):
+    rng = random.Random(seed)
+    sealables = generate_sealables(MAX_SEALABLES)
+    arguments = _random_constructor_arguments(rng, chain.pending_timestamp, sealables)
+
+    expected = check_constructor(*arguments, chain.pending_timestamp)
+    if expected is None:
+        gate_seal = project.GateSeal.deploy(*arguments, sender=deployer)
+        assert gate_seal.get_sealables() == arguments[2]
+    else:
+        with reverts(expected):
+            project.GateSeal.deploy(*arguments, sender=deployer)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_seal_matches_contract(
+    networks, gate_seal, sealables, sealing_committee, stranger, chain, generate_sealables, seed
+):
+    rng = random.Random(seed)
+    addresses = [sealable.address for sealable in sealables]
+    sender = rng.choice([sealing_committee, stranger])
+    subset = rng.choice(
+        [
+            [],
+            rng.sample(addresses, rng.randint(1, len(addresses))),
+            addresses[:1] * 2,
+            addresses[:1] + [generate_sealables(1)[0].address],
+        ]
+    )
+    if rng.random() < 0.25:
+        networks.active_provider.set_timestamp(gate_seal.get_expiry_timestamp())
+        networks.active_provider.mine()
+
+    expected = check_seal(
+        sender.address,
+        gate_seal.get_sealing_committee(),
+        gate_seal.get_sealables(),
+        gate_seal.get_expiry_timestamp(),
+        subset,
+        chain.pending_timestamp,
+    )
+    if expected is None:
+        gate_seal.seal(subset, sender=sender)
+        assert gate_seal.is_expired()
+    else:
+        with reverts(expected):
+            gate_seal.seal(subset, sender=sender)
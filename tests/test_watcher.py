@@ -0,0 +1,195 @@
+from utils.abi import encode_address, encode_seal, encode_uint256
+from utils.pipeline import ape_signer, get_fees
+from utils.rpc import Rpc
+from utils.seal_errors import FAILURE_NOT_PAUSED, FAILURE_PAUSE_REVERTED, encode_seal_failures
+from utils.logs import get_sealed_topic
+from utils.watcher import LEGACY_FAILURE, SealWatcher, build_seal_report, describe_revert, find_seal_transaction
+
+GATE_SEAL = "0x" + "ab" * 20
+COMMITTEE = "0x" + "cd" * 20
+OWNER = "0x" + "ef" * 20
+# a Safe `execTransaction` of the committee, calling `seal()` internally
+MULTISIG_TRANSACTION = {"hash": "0x04", "from": OWNER, "to": COMMITTEE, "input": "0x6a761202" + "00" * 64}
+SEALABLES = [f"0x{index:040x}" for index in range(1, 4)]
+
+
+def _error_revert_data(message: str) -> bytes:
+    encoded = message.encode()
+    return (
+        bytes.fromhex("08c379a0")
+        + encode_uint256(32)
+        + encode_uint256(len(encoded))
+        + encoded.ljust(-(-len(encoded) // 32) * 32, b"\x00")
+    )
+
+
+def _sealed_log(sealable: str) -> dict:
+    data = encode_address(GATE_SEAL) + encode_address(COMMITTEE) + encode_uint256(604800)
+    data += encode_address(sealable) + encode_uint256(1700000000)
+    return {
+        "address": GATE_SEAL,
+        "topics": [get_sealed_topic()],
+        "data": "0x" + data.hex(),
+        "transactionHash": MULTISIG_TRANSACTION["hash"],
+    }
+
+
+def _transaction(sealables: list[str], sender: str = COMMITTEE, transaction_hash: str = "0x01") -> dict:
+    return {"hash": transaction_hash, "from": sender, "to": GATE_SEAL, "input": "0x" + encode_seal(sealables).hex()}
+
+
+def test_find_seal_transaction():
+    other = {"hash": "0x02", "from": OWNER, "to": SEALABLES[0], "input": "0x" + encode_seal(SEALABLES).hex()}
+    creation = {"hash": "0x03", "from": OWNER, "to": None, "input": "0x"}
+    seal = _transaction(SEALABLES)
+    assert find_seal_transaction([other, creation, seal], GATE_SEAL, COMMITTEE) == seal
+    assert find_seal_transaction([other, creation], GATE_SEAL, COMMITTEE) is None
+    assert find_seal_transaction([other, seal], GATE_SEAL, COMMITTEE, "0x02") == other
+
+
+def test_skips_seal_calls_of_others():
+    # reverts with "sender: not SEALING_COMMITTEE", the committee may still seal in the same block
+    stranger = _transaction(SEALABLES, OWNER, "0x05")
+    assert find_seal_transaction([stranger], GATE_SEAL, COMMITTEE) is None
+    assert find_seal_transaction([stranger, _transaction(SEALABLES)], GATE_SEAL, COMMITTEE)["hash"] == "0x01"
+
+
+def test_find_multisig_seal_transaction():
+    transactions = [{"hash": "0x02", "from": OWNER, "to": SEALABLES[0], "input": "0x"}, MULTISIG_TRANSACTION]
+    assert find_seal_transaction(transactions, GATE_SEAL, COMMITTEE) is None
+    sealed_logs = [_sealed_log(sealable) for sealable in SEALABLES]
+    assert find_seal_transaction(transactions, GATE_SEAL, COMMITTEE, sealed_logs=sealed_logs) == MULTISIG_TRANSACTION
+
+
+def test_report_of_successful_seal():
+    receipt = {
+        "status": "0x1",
+        "blockNumber": "0x10",
+        "logs": [_sealed_log(sealable) for sealable in SEALABLES],
+    }
+    report = build_seal_report(_transaction(SEALABLES), receipt, GATE_SEAL, SEALABLES, [True] * 3)
+    assert report.succeeded and report.all_paused
+    assert report.block_number == 16
+    assert [(status.sealed, status.failure) for status in report.sealables] == [(True, None)] * 3
+
+
+def test_report_of_multisig_seal():
+    receipt = {"status": "0x1", "blockNumber": "0x10", "logs": [_sealed_log(sealable) for sealable in SEALABLES[:2]]}
+    report = build_seal_report(MULTISIG_TRANSACTION, receipt, GATE_SEAL, SEALABLES, [True, True, False])
+    assert report.succeeded and not report.all_paused
+    assert [status.sealed for status in report.sealables] == [True, True, False]
+
+    # the multisig transaction went through, the `seal()` it made did not
+    receipt["logs"] = []
+    report = build_seal_report(MULTISIG_TRANSACTION, receipt, GATE_SEAL, SEALABLES, [False] * 3)
+    assert not report.succeeded
+    assert report.error == "no Sealed logs, the seal() call failed"
+
+
+def test_report_of_failed_sealables():
+    message = str(encode_seal_failures({0: FAILURE_PAUSE_REVERTED, 2: FAILURE_NOT_PAUSED}))
+    receipt = {"status": "0x0", "blockNumber": "0x10", "logs": []}
+    report = build_seal_report(
+        _transaction(SEALABLES), receipt, GATE_SEAL, SEALABLES, [False, True, False], _error_revert_data(message)
+    )
+    assert not report.succeeded and not report.all_paused
+    assert report.error is None
+    assert [status.failure for status in report.sealables] == [
+        "pauseFor reverted",
+        None,
+        "not paused after pauseFor",
+    ]
+
+
+def test_describe_legacy_failures():
+    sealables = [f"0x{index:040x}" for index in range(1, 9)]
+    # the deployed GateSeals revert with the failed indexes as a reversed decimal string
+    for message, indexes in (("0", [0]), ("1", [1]), ("20", [0, 2]), ("6320", [0, 2, 3, 6]), ("7431", [1, 3, 4, 7])):
+        assert describe_revert(_error_revert_data(message), sealables) == (
+            None,
+            {sealables[index]: LEGACY_FAILURE for index in indexes},
+        )
+
+
+def test_describe_other_reverts():
+    assert describe_revert(_error_revert_data("gate seal: expired"), SEALABLES) == ("gate seal: expired", {})
+    assert describe_revert(None, SEALABLES) == ("reverted without a message", {})
+
+
+"""
+
+    LOCAL NODE
+
+"""
+
+
+def _send_seal(networks, account, gate_seal, sealables) -> str:
+    provider = networks.active_provider
+    rpc = Rpc(provider.http_uri)
+    max_fee, max_priority_fee = get_fees(rpc, 0)
+    raw_transaction = ape_signer(account, provider.network.ecosystem)(
+        {
+            "type": 2,
+            "chainId": provider.chain_id,
+            "nonce": account.nonce,
+            # a fixed gas limit, so that a reverting seal() is still sent
+            "gas": 1_000_000,
+            "maxFeePerGas": max_fee,
+            "maxPriorityFeePerGas": max_priority_fee,
+            "value": 0,
+            "to": gate_seal,
+            "data": "0x" + encode_seal(sealables).hex(),
+        }
+    )
+    return rpc("eth_sendRawTransaction", ["0x" + raw_transaction.hex()])
+
+
+def test_watches_seal_on_local_node(networks, gate_seal, sealing_committee, stranger, sealables):
+    watcher = SealWatcher(Rpc(networks.active_provider.http_uri), gate_seal.address)
+    assert watcher.poll() is None
+
+    addresses = [sealable.address for sealable in sealables]
+    # a seal() of someone else reverts and is not the seal being watched
+    _send_seal(networks, stranger, gate_seal.address, addresses)
+    assert watcher.poll() is None
+
+    transaction_hash = _send_seal(networks, sealing_committee, gate_seal.address, addresses)
+
+    report = watcher.watch(timeout=10)
+    assert report.transaction_hash == transaction_hash
+    assert report.succeeded and report.all_paused
+    assert [status.sealable.lower() for status in report.sealables] == [
+        address.lower() for address in addresses
+    ]
+    assert all(status.sealed for status in report.sealables)
+
+
+def test_watches_failed_seal_on_local_node(
+    networks,
+    project,
+    deployer,
+    sealing_committee,
+    seal_duration_seconds,
+    expiry_timestamp,
+    generate_sealables,
+):
+    sealables = generate_sealables(2) + generate_sealables(1, True) + generate_sealables(1, False, True)
+    gate_seal = project.GateSeal.deploy(
+        sealing_committee, seal_duration_seconds, sealables, expiry_timestamp, sender=deployer
+    )
+    addresses = [sealable.address for sealable in sealables]
+
+    transaction_hash = _send_seal(networks, sealing_committee, gate_seal.address, addresses)
+    # mined before the watcher starts, found through the transaction hash
+    report = SealWatcher(
+        Rpc(networks.active_provider.http_uri), gate_seal.address, transaction_hash
+    ).watch(timeout=10)
+
+    assert not report.succeeded
+    assert [status.failure for status in report.sealables] == [
+        None,
+        None,
+        "not paused after pauseFor",
+        "pauseFor reverted",
+    ]
+    assert not any(status.paused for status in report.sealables)
@@ -0,0 +1,94 @@
+from functools import lru_cache
+
+# A minimal ABI encoder for the handful of GateSeal and GateSealFactory calls,
+# so that calldata can be generated without loading eth-abi or ape.
+
+WORD_LENGTH = 32
+
+CREATE_GATE_SEAL_SIGNATURE = "create_gate_seal(address,uint256,address[],uint256)"
+SEAL_SIGNATURE = "seal(address[])"
+IS_PAUSED_SIGNATURE = "isPaused()"
+
+
+def keccak(data: bytes) -> bytes:
+    from eth_hash.auto import keccak as _keccak
+
+    return _keccak(data)
+
+
+@lru_cache(maxsize=None)
+def function_selector(signature: str) -> bytes:
+    return keccak(signature.encode())[:4]
+
+
+def address_to_bytes(address: str) -> bytes:
+    address = address[2:] if address.startswith("0x") else address
+    assert len(address) == 40, f"invalid address length: {address}"
+    return bytes.fromhex(address)
+
+
+def encode_uint256(value: int) -> bytes:
+    assert 0 <= value < 2**256, f"{value} does not fit in uint256"
+    return value.to_bytes(WORD_LENGTH, "big")
+
+
+def encode_address(address: str) -> bytes:
+    return address_to_bytes(address).rjust(WORD_LENGTH, b"\x00")
+
+
+def encode_address_array(addresses: list[str]) -> bytes:
+    return b"".join([encode_uint256(len(addresses))] + [encode_address(address) for address in addresses])
+
+
+def encode_create_gate_seal(
+    sealing_committee: str,
+    seal_duration_seconds: int,
+    sealables: list[str],
+    expiry_timestamp: int,
+) -> bytes:
+    # the dynamic `address[]` goes to the tail, right after the 4 head words
+    return b"".join(
+        (
+            function_selector(CREATE_GATE_SEAL_SIGNATURE),
+            encode_address(sealing_committee),
+            encode_uint256(seal_duration_seconds),
+            encode_uint256(4 * WORD_LENGTH),
+            encode_uint256(expiry_timestamp),
+            encode_address_array(sealables),
+        )
+    )
+
+
+def encode_seal(sealables: list[str]) -> bytes:
+    return b"".join(
+        (
+            function_selector(SEAL_SIGNATURE),
+            encode_uint256(WORD_LENGTH),
+            encode_address_array(sealables),
+        )
+    )
+
+
+def decode_uint256(data: bytes, offset: int = 0) -> int:
+    return int.from_bytes(data[offset : offset + WORD_LENGTH], "big")
+
+
+def decode_address(data: bytes, offset: int = 0) -> str:
+    return "0x" + data[offset + WORD_LENGTH - 20 : offset + WORD_LENGTH].hex()
+
+
+def decode_address_array(data: bytes) -> list[str]:
+    """
+    Decodes a single `address[]` argument or return value.
+    """
+    offset = decode_uint256(data)
+    length = decode_uint256(data, offset)
+    return [decode_address(data, offset + WORD_LENGTH * (1 + index)) for index in range(length)]
+
+
+def decode_seal(calldata: bytes) -> list[str]:
+    """
+    Returns the sealables of `seal(address[])` calldata.
+    """
+    assert calldata[:4] == function_selector(SEAL_SIGNATURE), "not a seal() call"
+    return decode_address_array(calldata[4:])
@@ -0,0 +1,48 @@
+from functools import lru_cache
+
+from utils.abi import address_to_bytes, keccak
+
+
+def _rlp_encode_nonce(nonce: int) -> bytes:
+    if nonce == 0:
+        return b"\x80"
+    if nonce < 0x80:
+        return bytes((nonce,))
+    encoded = nonce.to_bytes((nonce.bit_length() + 7) // 8, "big")
+    return bytes((0x80 + len(encoded),)) + encoded
+
+
+# manifests repeat the same committees and sealables, so the keccak of each is computed once
+@lru_cache(maxsize=4096)
+def to_checksum_address(address: str) -> str:
+    """
+    EIP-55 mixed-case checksum encoding.
+    """
+    lowercase = address_to_bytes(address).hex()
+    address_hash = keccak(lowercase.encode()).hex()
+    return "0x" + "".join(
+        char.upper() if int(address_hash[i], 16) >= 8 else char for i, char in enumerate(lowercase)
+    )
+
+
+def is_address(address: str) -> bool:
+    if not isinstance(address, str) or not address.startswith("0x") or len(address) != 42:
+        return False
+    try:
+        bytes.fromhex(address[2:])
+    except ValueError:
+        return False
+    # mixed-case addresses must carry a valid checksum
+    if address[2:].islower() or address[2:].isupper():
+        return True
+    return address == to_checksum_address(address)
+
+
+def compute_create_address(sender: str, nonce: int) -> str:
+    """
+    The address of a contract deployed by `sender` with a CREATE transaction at `nonce`,
+    i.e. keccak256(rlp([sender, nonce]))[12:].
+    """
+    assert nonce >= 0, "nonce cannot be negative"
+    payload = b"\x94" + address_to_bytes(sender) + _rlp_encode_nonce(nonce)
+    return to_checksum_address(keccak(bytes((0xC0 + len(payload),)) + payload)[12:].hex())
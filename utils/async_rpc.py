@@ -0,0 +1,279 @@
+import asyncio
+import json
+import time
+from typing import NamedTuple
+
+import aiohttp
+
+from utils.abi import (
+    decode_address,
+    decode_address_array,
+    decode_uint256,
+    encode_uint256,
+    function_selector,
+)
+from utils.constants import MAX_GATE_SEALS_PAGE_SIZE
+from utils.instrumentation import record_rpc_call
+from utils.logs import decode_gate_seal_created_logs, get_gate_seal_created_topic
+from utils.rpc import DEFAULT_BATCH_SIZE, DEFAULT_TIMEOUT_SECONDS, RpcError
+
+# An asyncio JSON-RPC client for reads over many contracts. Calls are sent as JSON-RPC batches
+# of at most `batch_size` calls, the batches of a single `batch()` go out concurrently over a pooled
+# keep-alive session, at most `max_concurrency` HTTP requests in flight. Failed HTTP requests
+# (connection errors, timeouts, 429 and 5xx) are retried with exponential backoff; JSON-RPC errors
+# of single calls are not, a reverted eth_call is an answer.
+#
+#     async with AsyncRpc(uri) as rpc:
+#         gate_seals = await get_factory_gate_seals(rpc, factory)
+#         states = await get_gate_seal_states(rpc, gate_seals)
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_RETRIES = 4
+DEFAULT_BACKOFF_SECONDS = 0.25
+MAX_BACKOFF_SECONDS = 8
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+KEEPALIVE_TIMEOUT_SECONDS = 60
+# most providers cap eth_getLogs at a few thousand blocks per call
+DEFAULT_LOGS_BLOCK_RANGE = 2_000
+
+GATE_SEAL_VIEWS = (
+    "get_sealing_committee()",
+    "get_seal_duration_seconds()",
+    "get_sealables()",
+    "get_expiry_timestamp()",
+    "is_expired()",
+)
+
+
+class RetryableError(Exception):
+    pass
+
+
+class AsyncRpc:
+    def __init__(
+        self,
+        uri: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        retries: int = DEFAULT_RETRIES,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+        timeout: int = DEFAULT_TIMEOUT_SECONDS,
+    ):
+        self.uri = uri
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self.timeout = timeout
+        self.session = None
+        self.semaphore = None
+        self.next_id = 0
+
+    async def __aenter__(self):
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.max_concurrency, keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS
+            ),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+
+    async def request(self, method: str, params: list):
+        return (await self.batch([(method, params)]))[0]
+
+    async def batch(self, calls: list[tuple[str, list]], raise_errors: bool = True) -> list:
+        """
+        Sends `(method, params)` pairs and returns the results in call order.
+        With `raise_errors=False`, failed calls are returned as `RpcError` instead of raising.
+        """
+        chunks = await asyncio.gather(
+            *(
+                self._post(calls[start : start + self.batch_size], raise_errors)
+                for start in range(0, len(calls), self.batch_size)
+            )
+        )
+        return [result for chunk in chunks for result in chunk]
+
+    async def _post(self, calls: list[tuple[str, list]], raise_errors: bool) -> list:
+        payload = []
+        for method, params in calls:
+            payload.append({"jsonrpc": "2.0", "id": self.next_id, "method": method, "params": params})
+            self.next_id += 1
+        body = json.dumps(payload)
+        label = "batch(" + ",".join(sorted({method for method, _ in calls})) + ")"
+
+        for attempt in range(self.retries + 1):
+            try:
+                response = await self._send(body, label)
+                break
+            except (RetryableError, aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == self.retries:
+                    raise
+                await asyncio.sleep(min(MAX_BACKOFF_SECONDS, self.backoff_seconds * 2**attempt))
+
+        # some nodes answer a batch they cannot handle with a single error object
+        if not isinstance(response, list):
+            error = response.get("error") if isinstance(response, dict) else None
+            raise RpcError(label, error or {"message": f"not a batch response: {response!r}"})
+        # batch responses may come back in any order
+        by_id = {item["id"]: item for item in response}
+        results = []
+        for item in payload:
+            result = by_id[item["id"]]
+            if "error" in result:
+                error = RpcError(item["method"], result["error"])
+                if raise_errors:
+                    raise error
+                results.append(error)
+                continue
+            results.append(result["result"])
+        return results
+
+    async def _send(self, body: str, label: str) -> list:
+        async with self.semaphore:
+            started_at = time.perf_counter()
+            response_bytes, failed = 0, True
+            try:
+                async with self.session.post(
+                    self.uri, data=body, headers={"Content-Type": "application/json"}
+                ) as response:
+                    content = await response.read()
+                    response_bytes, failed = len(content), not response.ok
+                    if response.status in RETRY_STATUSES:
+                        raise RetryableError(f"HTTP {response.status}")
+                    response.raise_for_status()
+                    return json.loads(content)
+            finally:
+                record_rpc_call(label, (time.perf_counter() - started_at) * 1000, len(body), response_bytes, failed)
+
+
+"""
+
+    CONTRACT READS
+
+"""
+
+
+class GateSealState(NamedTuple):
+    address: str
+    sealing_committee: str
+    seal_duration_seconds: int
+    sealables: list[str]
+    expiry_timestamp: int
+    is_expired: bool
+
+
+def _call(to: str, data: bytes, block: str) -> tuple[str, list]:
+    return ("eth_call", [{"to": to, "data": "0x" + data.hex()}, block])
+
+
+def _data(result: str) -> bytes:
+    return bytes.fromhex(result[2:])
+
+
+async def get_codes(rpc: AsyncRpc, addresses: list[str], block: str = "latest") -> list[bytes]:
+    codes = await rpc.batch([("eth_getCode", [address, block]) for address in addresses])
+    return [_data(code) for code in codes]
+
+
+async def get_gate_seal_states(
+    rpc: AsyncRpc, gate_seals: list[str], block: str = "latest"
+) -> list[GateSealState]:
+    """
+    Reads every view of every GateSeal, all in one `batch()`.
+    """
+    results = await rpc.batch(
+        [
+            _call(gate_seal, function_selector(view), block)
+            for gate_seal in gate_seals
+            for view in GATE_SEAL_VIEWS
+        ]
+    )
+    states = []
+    views = len(GATE_SEAL_VIEWS)
+    for index, gate_seal in enumerate(gate_seals):
+        committee, duration, sealables, expiry, expired = (
+            _data(result) for result in results[index * views : (index + 1) * views]
+        )
+        states.append(
+            GateSealState(
+                gate_seal,
+                decode_address(committee),
+                decode_uint256(duration),
+                decode_address_array(sealables),
+                decode_uint256(expiry),
+                decode_uint256(expired) == 1,
+            )
+        )
+    return states
+
+
+async def get_created_gate_seals(
+    rpc: AsyncRpc,
+    factory: str,
+    from_block: int = 0,
+    block: str = "latest",
+    block_range: int = DEFAULT_LOGS_BLOCK_RANGE,
+) -> list[str]:
+    """
+    Lists the GateSeals created by the factory from its GateSealCreated logs,
+    the block ranges are scanned concurrently.
+    """
+    to_block = int((await rpc.request("eth_getBlockByNumber", [block, False]))["number"], 16)
+    topic = get_gate_seal_created_topic()
+    chunks = await rpc.batch(
+        [
+            (
+                "eth_getLogs",
+                [
+                    {
+                        "address": factory,
+                        "topics": [topic],
+                        "fromBlock": hex(start),
+                        "toBlock": hex(min(start + block_range - 1, to_block)),
+                    }
+                ],
+            )
+            for start in range(from_block, to_block + 1, block_range)
+        ]
+    )
+    created = decode_gate_seal_created_logs([log for chunk in chunks for log in chunk])
+    return [created.gate_seal(index) for index in range(len(created))]
+
+
+async def get_factory_gate_seals(
+    rpc: AsyncRpc,
+    factory: str,
+    block: str = "latest",
+    page_size: int = MAX_GATE_SEALS_PAGE_SIZE,
+    from_block: int = 0,
+) -> list[str]:
+    """
+    Lists the GateSeals created by the factory, the pages after the count are fetched concurrently.
+    Factories deployed before the index have no `get_gate_seals_count()`, their GateSeals are
+    read from the GateSealCreated logs from `from_block` on.
+    """
+    try:
+        count = await rpc.request(*_call(factory, function_selector("get_gate_seals_count()"), block))
+    except RpcError:
+        return await get_created_gate_seals(rpc, factory, from_block, block)
+    count = decode_uint256(_data(count))
+    selector = function_selector("get_gate_seals(uint256,uint256)")
+    pages = await rpc.batch(
+        [
+            _call(factory, selector + encode_uint256(offset) + encode_uint256(page_size), block)
+            for offset in range(0, count, page_size)
+        ]
+    )
+    return [gate_seal for page in pages for gate_seal in decode_address_array(_data(page))]
+
+
+async def get_factory_blueprints(rpc: AsyncRpc, factories: list[str], block: str = "latest") -> list[str]:
+    results = await rpc.batch(
+        [_call(factory, function_selector("get_blueprint()"), block) for factory in factories]
+    )
+    return [decode_address(_data(result)) for result in results]
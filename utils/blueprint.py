@@ -1,15 +1,23 @@
-from ape import project
-from ape.logging import logger
+from typing import NamedTuple
 import sys
 
 # GateSeals are deployed using Vyper's `create_from_blueprint`
 # GateSeal blueprint is EIP5202-compliant bytecode
 # https://eips.ethereum.org/EIPS/eip-5202
 
+# EIP-5202 header
+# 0xFE71<version bits: 6><length encoding bits: 2>[<preamble data length: 1-2 bytes><preamble data>]<initcode>
+# the length encoding bits give the number of bytes (0, 1 or 2) used to store the preamble data length,
+# 0b11 is reserved
 EIP_5202_EXECUTION_HALT_BYTE = bytes.fromhex("fe")
 EIP_5202_BLUEPRINT_IDENTIFIER_BYTE = bytes.fromhex("71")
 EIP_5202_VERSION_BYTE = bytes.fromhex("00")
 
+EIP_5202_HEADER_BYTE_LENGTH = 3
+EIP_5202_LENGTH_ENCODING_MASK = 0b11
+EIP_5202_RESERVED_LENGTH_ENCODING = 0b11
+EIP_5202_MAX_VERSION = 0b111111
+
 # Bytecode preamble is not deployed on-chain
 # To properly deploy a blueprint contract, special deploy bytecode must be used.
 # The following preamble, prepended to regular deploy bytecode (output of vyper -f bytecode),
@@ -19,66 +27,161 @@ EIP_5202_VERSION_BYTE = bytes.fromhex("00")
 
 # OPERATIONS
 # deploy_preamble = "61" + bytecode len in 2 bytes + "3d81600a3d39f3"
-# 61  PUSH2 BYTECODE_LENGTH_2_BYTES: STACK 
+# 61  PUSH2 BYTECODE_LENGTH_2_BYTES: STACK
 # 3D  RETURNDATASIZE
 # 81  DUP2
 # 60  PUSH1 0x0a
 # 3D  RETURNDATASIZE
-# 39  CODECOPY 
+# 39  CODECOPY
 # F3  *RETURN
 DEPLOY_PREAMBLE_BYTE_LENGTH = 10
 DEPLOY_PREAMBLE_INITIAL_BYTE = bytes.fromhex("61")
 DEPLOY_PREABLE_POST_LENGTH_BYTES = bytes.fromhex("3d81600a3d39f3")
+# PUSH2 limits the blueprint to 0xffff bytes
+DEPLOY_PREAMBLE_MAX_BLUEPRINT_LENGTH = 0xFFFF
+
+# pre-computed single byte values to avoid converting on every verification
+_EXECUTION_HALT = EIP_5202_EXECUTION_HALT_BYTE[0]
+_BLUEPRINT_IDENTIFIER = EIP_5202_BLUEPRINT_IDENTIFIER_BYTE[0]
+_DEPLOY_PREAMBLE_INITIAL = DEPLOY_PREAMBLE_INITIAL_BYTE[0]
+
+
+class Blueprint(NamedTuple):
+    version: int
+    # `None` if the header has no preamble data, i.e. the length encoding bits are 0b00
+    preamble_data: memoryview | None
+    initcode: memoryview
+    # offset of the initcode in the blueprint, i.e. `code_offset` for `create_from_blueprint`
+    code_offset: int
+
+
+def _to_bytes(bytecode: str | bytes) -> bytes:
+    if isinstance(bytecode, str):
+        return bytes.fromhex(bytecode[2:] if bytecode.startswith("0x") else bytecode)
+    return bytecode
+
+
+def _preamble_length_bytes(preamble_data: bytes | None) -> int:
+    if preamble_data is None:
+        return 0
+    # an empty preamble data is still encoded with a single length byte
+    return 1 if len(preamble_data) <= 0xFF else 2
+
+
+def _eip5202_header(version: int, preamble_data: bytes | None) -> bytes:
+    assert 0 <= version <= EIP_5202_MAX_VERSION, "version does not fit in 6 bits"
+    n_length_bytes = _preamble_length_bytes(preamble_data)
+    header = bytes((_EXECUTION_HALT, _BLUEPRINT_IDENTIFIER, (version << 2) | n_length_bytes))
+    if not n_length_bytes:
+        return header
+    assert len(preamble_data) <= 0xFFFF, "preamble data length does not fit in 2 bytes"
+    return header + len(preamble_data).to_bytes(n_length_bytes, "big") + preamble_data
+
+
+def build_eip5202_blueprint(
+    initcode: str | bytes, version: int = 0, preamble_data: bytes | None = None
+) -> bytes:
+    """
+    Prepends the EIP-5202 header to the initcode. Bytes initcode is copied exactly once,
+    hex initcode is decoded first and so copied twice.
+    """
+    return b"".join((_eip5202_header(version, preamble_data), _to_bytes(initcode)))
+
+
+def parse_eip5202_blueprint(bytecode: bytes | bytearray | memoryview) -> Blueprint:
+    """
+    Parses the EIP-5202 header without copying the bytecode;
+    the preamble data and initcode are returned as views into `bytecode`.
+    """
+    view = memoryview(bytecode)
+    assert len(view) >= EIP_5202_HEADER_BYTE_LENGTH, "too short for an EIP5202 header"
+    assert view[0] == _EXECUTION_HALT, "not an EIP5202 blueprint, must start with 0xFE"
+    assert view[1] == _BLUEPRINT_IDENTIFIER, "not an EIP5202 blueprint, invalid identifier"
+
+    n_length_bytes = view[2] & EIP_5202_LENGTH_ENCODING_MASK
+    assert (
+        n_length_bytes != EIP_5202_RESERVED_LENGTH_ENCODING
+    ), "reserved bits are set, not an EIP5202 preamble"
+
+    if n_length_bytes == 0:
+        preamble_data = None
+        code_offset = EIP_5202_HEADER_BYTE_LENGTH
+    else:
+        data_offset = EIP_5202_HEADER_BYTE_LENGTH + n_length_bytes
+        assert len(view) >= data_offset, "truncated preamble data length"
+        code_offset = data_offset + int.from_bytes(
+            view[EIP_5202_HEADER_BYTE_LENGTH:data_offset], "big"
+        )
+        assert len(view) >= code_offset, "truncated preamble data"
+        preamble_data = view[data_offset:code_offset]
+
+    return Blueprint(
+        version=view[2] >> 2,
+        preamble_data=preamble_data,
+        initcode=view[code_offset:],
+        code_offset=code_offset,
+    )
 
 
-def construct_blueprint_deploy_bytecode(initial_gateseal_bytecode: str):
-    eip_5202_bytecode = (
-        EIP_5202_EXECUTION_HALT_BYTE
-        + EIP_5202_BLUEPRINT_IDENTIFIER_BYTE
-        + EIP_5202_VERSION_BYTE
-        + bytes.fromhex(initial_gateseal_bytecode[2:])
+def construct_blueprint_deploy_bytecode(
+    initial_gateseal_bytecode: str | bytes,
+    version: int = 0,
+    preamble_data: bytes | None = None,
+) -> bytes:
+    initcode = _to_bytes(initial_gateseal_bytecode)
+    header = _eip5202_header(version, preamble_data)
+    blueprint_length = len(header) + len(initcode)
+    assert (
+        blueprint_length <= DEPLOY_PREAMBLE_MAX_BLUEPRINT_LENGTH
+    ), "blueprint does not fit in the PUSH2 deploy preamble"
+
+    # joining the parts allocates the deploy bytecode once and copies the initcode once
+    return b"".join(
+        (
+            DEPLOY_PREAMBLE_INITIAL_BYTE,
+            blueprint_length.to_bytes(2, "big"),
+            DEPLOY_PREABLE_POST_LENGTH_BYTES,
+            header,
+            initcode,
+        )
     )
 
-    with_deploy_preamble = (
-        DEPLOY_PREAMBLE_INITIAL_BYTE
-        + bytes.fromhex(len(eip_5202_bytecode).to_bytes(2, "big").hex())
-        + DEPLOY_PREABLE_POST_LENGTH_BYTES
-        + eip_5202_bytecode
-    )
 
-    return with_deploy_preamble
+def verify_blueprint_deploy_preamble(blueprint_deploy_bytecode) -> Blueprint:
+    view = memoryview(blueprint_deploy_bytecode)
+    assert len(view) > DEPLOY_PREAMBLE_BYTE_LENGTH, "too short for a deploy preamble"
+    assert view[0] == _DEPLOY_PREAMBLE_INITIAL
+    assert int.from_bytes(view[1:3], "big") == len(view) - DEPLOY_PREAMBLE_BYTE_LENGTH
+    assert view[3:DEPLOY_PREAMBLE_BYTE_LENGTH] == DEPLOY_PREABLE_POST_LENGTH_BYTES
 
+    return verify_eip522_blueprint(view[DEPLOY_PREAMBLE_BYTE_LENGTH:])
 
-def verify_blueprint_deploy_preamble(blueprint_deploy_bytecode):
-    assert blueprint_deploy_bytecode[0] == int(DEPLOY_PREAMBLE_INITIAL_BYTE.hex(), 16)
-    assert int(blueprint_deploy_bytecode[1:3].hex(), 16) == int(
-        len(blueprint_deploy_bytecode[DEPLOY_PREAMBLE_BYTE_LENGTH:])
-        .to_bytes(2, "big")
-        .hex(),
-        16,
-    )
-    assert (
-        blueprint_deploy_bytecode[3:DEPLOY_PREAMBLE_BYTE_LENGTH].hex()
-        == DEPLOY_PREABLE_POST_LENGTH_BYTES.hex()
-    )
-
-    verify_eip522_blueprint(blueprint_deploy_bytecode[DEPLOY_PREAMBLE_BYTE_LENGTH:])
 
+def verify_eip522_blueprint(bytecode, version: int = 0) -> Blueprint:
+    blueprint = parse_eip5202_blueprint(bytecode)
+    assert blueprint.version == version, f"unexpected EIP5202 version {blueprint.version}"
+    assert len(blueprint.initcode) > 0, "blueprint has no initcode"
+    return blueprint
 
-def verify_eip522_blueprint(bytecode):
-    assert bytecode[0] == int(EIP_5202_EXECUTION_HALT_BYTE.hex(), 16)
-    assert bytecode[1] == int(EIP_5202_BLUEPRINT_IDENTIFIER_BYTE.hex(), 16)
-    assert bytecode[2] == int(EIP_5202_VERSION_BYTE.hex(), 16)
 
-    n_length_bytes = bytecode[2] & 0b11
-    assert n_length_bytes != 0b11, "reserved bits are set, not an EIP5202 preamble"
+def send_blueprint_deploy_transaction(
+    deployer, deploy_code, prompt=False, max_fee=None, max_priority_fee=None
+):
+    # ape is imported lazily to keep the bytecode helpers usable without it
+    from ape import project
+    from ape.logging import logger
 
+    # an EIP-1559 transaction, by default allowing the base fee to double before inclusion
+    if max_priority_fee is None:
+        max_priority_fee = project.provider.priority_fee
+    if max_fee is None:
+        max_fee = 2 * project.provider.base_fee + max_priority_fee
 
-def deploy_blueprint(deployer, deploy_code, prompt=False):
     transaction = project.provider.network.ecosystem.create_transaction(
         chain_id=project.provider.chain_id,
         data=deploy_code,
-        gas_price=project.provider.gas_price,
+        max_fee=max_fee,
+        max_priority_fee=max_priority_fee,
         nonce=deployer.nonce,
     )
 
@@ -92,5 +195,10 @@ def deploy_blueprint(deployer, deploy_code, prompt=False):
         if proceed.lower() not in ["y", "yes"]:
             logger.error("Script stopped.")
             sys.exit()
-    receipt = project.provider.send_transaction(signed_transaction)
-    return receipt.contract_address
+    return project.provider.send_transaction(signed_transaction)
+
+
+def deploy_blueprint(deployer, deploy_code, prompt=False, max_fee=None, max_priority_fee=None):
+    return send_blueprint_deploy_transaction(
+        deployer, deploy_code, prompt, max_fee, max_priority_fee
+    ).contract_address
@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import re
+
+# Compiled artifacts are cached on disk, keyed by the source hash, the compiler version
+# and the optimization mode, so that repeated runs do not pay for the compilation.
+# The deploy, check and verify scripts load their contracts from here rather than from
+# the ape project; the tests keep using the ape project.
+ARTIFACTS_CACHE_DIRECTORY = ".cache/artifacts"
+CONTRACTS_DIRECTORY = "contracts"
+# The audited sources the deployed factories and GateSeals in `deployed/` were built from.
+# The current GateSealFactory indexes the created GateSeals and the current GateSeal reports
+# the failure reasons of `seal()`, so their bytecode differs from what is on chain.
+# Excluded from the ape project in ape-config.yaml.
+LEGACY_CONTRACTS_DIRECTORY = os.path.join(CONTRACTS_DIRECTORY, "legacy")
+
+OPTIMIZATION_MODES = ["gas", "codesize", "none"]
+
+# `layout` carries the offsets of the immutables, see utils/bytecode.py
+OUTPUT_SELECTION = ["abi", "evm.bytecode", "evm.deployedBytecode", "layout"]
+
+VERSION_PRAGMA_PATTERN = re.compile(r"^#\s*(?:@version|pragma version)\s+[^\d]*([\d.]+)", re.MULTILINE)
+
+
+def _version_tuple(version: str) -> tuple:
+    return tuple(int(part) for part in version.split("."))
+
+
+def detect_vyper_version(source: str) -> str:
+    match = VERSION_PRAGMA_PATTERN.search(source)
+    assert match, "source has no version pragma"
+    return match.group(1)
+
+
+def get_optimization_modes(version: str) -> list[str]:
+    # Vyper only accepts `optimize: true/false` before 0.3.10
+    if _version_tuple(version) < (0, 3, 10):
+        return ["gas", "none"]
+    return OPTIMIZATION_MODES
+
+
+def get_optimize_setting(version: str, mode: str) -> bool | str:
+    assert mode in get_optimization_modes(version), f"vyper {version} does not support `{mode}` optimization"
+    if _version_tuple(version) < (0, 3, 10):
+        return mode == "gas"
+    return mode
+
+
+def get_source_path(name: str, legacy: bool = False) -> str:
+    if legacy:
+        source_path = os.path.join(LEGACY_CONTRACTS_DIRECTORY, f"{name}.vy")
+        if not os.path.exists(source_path):
+            raise FileNotFoundError(f"{name}.vy not found in {LEGACY_CONTRACTS_DIRECTORY}/")
+        return source_path
+
+    for root, directories, files in os.walk(CONTRACTS_DIRECTORY):
+        if os.path.normpath(root) == os.path.normpath(CONTRACTS_DIRECTORY) and "legacy" in directories:
+            directories.remove("legacy")
+        if f"{name}.vy" in files:
+            return os.path.join(root, f"{name}.vy")
+    raise FileNotFoundError(f"{name}.vy not found in {CONTRACTS_DIRECTORY}/")
+
+
+def get_artifact_key(source: str, version: str, mode: str) -> str:
+    # the outputs are part of the key, so that artifacts cached with fewer outputs are rebuilt
+    outputs = ",".join(OUTPUT_SELECTION)
+    return hashlib.sha256(f"{version}\0{mode}\0{outputs}\0{source}".encode()).hexdigest()
+
+
+def _compile(source_path: str, source: str, version: str, mode: str) -> dict:
+    import vvm
+
+    if version not in [str(installed) for installed in vvm.get_installed_vyper_versions()]:
+        vvm.install_vyper(version)
+
+    output = vvm.compile_standard(
+        {
+            "language": "Vyper",
+            "sources": {source_path: {"content": source}},
+            "settings": {
+                "optimize": get_optimize_setting(version, mode),
+                "outputSelection": {source_path: OUTPUT_SELECTION},
+            },
+        },
+        vyper_version=version,
+    )
+
+    name = os.path.splitext(os.path.basename(source_path))[0]
+    compiled = output["contracts"][source_path][name]
+    return {
+        "contract_name": name,
+        "source_path": source_path,
+        "compiler": {"version": version, "optimize": mode},
+        "abi": compiled["abi"],
+        "bytecode": "0x" + compiled["evm"]["bytecode"]["object"].removeprefix("0x"),
+        "runtime_bytecode": "0x" + compiled["evm"]["deployedBytecode"]["object"].removeprefix("0x"),
+        "layout": compiled["layout"],
+    }
+
+
+def get_artifact(name: str, mode: str = "gas", version: str | None = None, legacy: bool = False) -> dict:
+    """
+    Returns the compiled artifact for the contract, compiling it only on a cache miss.
+    The compiler version defaults to the version pragma of the source. With `legacy`,
+    the audited source the deployed contracts were built from is compiled instead.
+    """
+    source_path = get_source_path(name, legacy)
+    with open(source_path, "r") as source_file:
+        source = source_file.read()
+
+    version = version or detect_vyper_version(source)
+    key = get_artifact_key(source, version, mode)
+    artifact_filename = os.path.join(ARTIFACTS_CACHE_DIRECTORY, f"{name}-{key}.json")
+
+    if os.path.exists(artifact_filename):
+        with open(artifact_filename, "r") as artifact_file:
+            return json.load(artifact_file)
+
+    artifact = _compile(source_path, source, version, mode)
+    artifact["key"] = key
+
+    os.makedirs(ARTIFACTS_CACHE_DIRECTORY, exist_ok=True)
+    # write-then-rename so that an interrupted run never leaves a corrupted artifact behind
+    with open(f"{artifact_filename}.tmp", "w") as artifact_file:
+        json.dump(artifact, artifact_file)
+    os.replace(f"{artifact_filename}.tmp", artifact_filename)
+
+    return artifact
+
+
+def get_contract_container(name: str, mode: str = "gas", version: str | None = None, legacy: bool = False):
+    from ape.contracts import ContractContainer
+    from ethpm_types import ContractType
+
+    artifact = get_artifact(name, mode, version, legacy)
+    return ContractContainer(
+        ContractType(
+            contractName=artifact["contract_name"],
+            sourceId=artifact["source_path"],
+            abi=artifact["abi"],
+            deploymentBytecode={"bytecode": artifact["bytecode"]},
+            runtimeBytecode={"bytecode": artifact["runtime_bytecode"]},
+        )
+    )
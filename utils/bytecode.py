@@ -0,0 +1,99 @@
+from typing import NamedTuple
+
+# Vyper stores immutables in a data section appended to the runtime code at deploy time,
+# so the code at a GateSeal address is `runtime bytecode + immutables`.
+# The offsets of the immutables come from the `code_layout` section of the compiler's
+# `layout` output, kept in the artifacts of utils/build.py.
+
+
+class Immutable(NamedTuple):
+    name: str
+    type: str
+    offset: int
+    length: int
+
+
+def parse_code_layout(layout: dict) -> list[Immutable]:
+    """
+    Accepts either the full `vyper -f layout` output or only its `code_layout` section.
+    """
+    code_layout = layout.get("code_layout", layout)
+    immutables = [
+        Immutable(name, item["type"], item["offset"], item["length"])
+        for name, item in code_layout.items()
+    ]
+    return sorted(immutables, key=lambda immutable: immutable.offset)
+
+
+def get_code_layout(artifact: dict) -> list[Immutable]:
+    assert "code_layout" in artifact["layout"], f"{artifact['contract_name']}: no code layout in the artifact"
+    return parse_code_layout(artifact["layout"])
+
+
+def immutables_length(immutables: list[Immutable]) -> int:
+    return max((item.offset + item.length for item in immutables), default=0)
+
+
+def split_immutables(
+    deployed_code: bytes, immutables: list[Immutable]
+) -> tuple[memoryview, memoryview]:
+    """
+    Splits the deployed code into the runtime code and the immutables data section.
+    """
+    view = memoryview(deployed_code)
+    data_length = immutables_length(immutables)
+    assert len(view) >= data_length, "code is shorter than the immutables section"
+    return view[: len(view) - data_length], view[len(view) - data_length :]
+
+
+def decode_immutable(data: memoryview, immutable: Immutable):
+    word = data[immutable.offset : immutable.offset + immutable.length]
+    if immutable.type == "address":
+        assert not any(word[:12]), f"{immutable.name}: dirty address padding"
+        return "0x" + word[12:].hex()
+    if immutable.type.startswith("uint"):
+        return int.from_bytes(word, "big")
+    if immutable.type == "bool":
+        return bool(int.from_bytes(word, "big"))
+    raise ValueError(f"{immutable.name}: unsupported immutable type {immutable.type}")
+
+
+def decode_immutables(data: memoryview, immutables: list[Immutable]) -> dict:
+    return {immutable.name: decode_immutable(data, immutable) for immutable in immutables}
+
+
+def matches_runtime_code(
+    deployed_code: bytes, runtime_bytecode: bytes, immutables: list[Immutable]
+) -> tuple[bool, dict]:
+    """
+    Compares the deployed code to the locally compiled runtime bytecode with the immutables masked out.
+    Returns whether the code matches and, if it does, the decoded immutables.
+    """
+    if len(deployed_code) != len(runtime_bytecode) + immutables_length(immutables):
+        return False, {}
+
+    code, data = split_immutables(deployed_code, immutables)
+    if code != runtime_bytecode:
+        return False, {}
+
+    return True, decode_immutables(data, immutables)
+
+
+def find_gate_seal_param_mismatches(params: dict, immutables: dict, state) -> list[str]:
+    """
+    Compares the `params` of a deployed GateSeal file to the immutables of its code and to
+    its storage read through the views (`state` is a `utils.async_rpc.GateSealState`).
+    """
+    mismatches = []
+    if immutables["SEALING_COMMITTEE"] != params["sealing_committee"].lower():
+        mismatches.append(f"sealing committee {immutables['SEALING_COMMITTEE']}")
+    if immutables["SEAL_DURATION_SECONDS"] != params["seal_duration_seconds"]:
+        mismatches.append(f"seal duration {immutables['SEAL_DURATION_SECONDS']}")
+    if state.sealables != [sealable.lower() for sealable in params["sealables"]]:
+        mismatches.append(f"sealables {state.sealables}")
+    # sealing moves the expiry to the timestamp of the seal, i.e. only ever earlier
+    if state.expiry_timestamp != params["expiry_timestamp"] and not (
+        state.is_expired and state.expiry_timestamp < params["expiry_timestamp"]
+    ):
+        mismatches.append(f"expiry timestamp {state.expiry_timestamp}")
+    return mismatches
@@ -0,0 +1,226 @@
+"""
+Offline GateSeal tasks that do not need a network connection.
+
+Unlike the ape scripts, this entry point does not import ape;
+each subcommand imports only what it needs.
+
+    python -m utils.cli validate-config --sealing-committee 0x... --seal-duration-seconds 604800 ...
+    python -m utils.cli validate-manifest manifest.json
+    python -m utils.cli blueprint build --contract GateSeal
+    python -m utils.cli blueprint verify 0x61...
+    python -m utils.cli create-address --sender 0x... --nonce 42
+    python -m utils.cli calldata seal --sealables 0x...,0x...
+"""
+import argparse
+import os
+import sys
+import time
+
+
+def _read_hex(value: str) -> bytes:
+    # `@path` reads the hex string from a file
+    if value.startswith("@"):
+        with open(value[1:], "r") as hex_file:
+            value = hex_file.read().strip()
+    return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+
+
+def _split(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def validate_config(args) -> int:
+    from utils.validation import validate_gate_seal_config
+
+    errors = validate_gate_seal_config(
+        args.sealing_committee,
+        args.seal_duration_seconds,
+        _split(args.sealables),
+        args.expiry_timestamp,
+        args.now if args.now is not None else int(time.time()),
+    )
+    for error in errors:
+        print(f"error: {error}", file=sys.stderr)
+    if not errors:
+        print("config is valid")
+    return 1 if errors else 0
+
+
+def validate_manifest(args) -> int:
+    import json
+
+    from utils.validation import validate_manifest as validate
+
+    with open(args.manifest, "r") as manifest_file:
+        seals = json.load(manifest_file)["seals"]
+
+    errors = validate(seals, args.now if args.now is not None else int(time.time()))
+    for index, seal_errors in errors.items():
+        for error in seal_errors:
+            print(f"error: seals[{index}]: {error}", file=sys.stderr)
+    if not errors:
+        print(f"{len(seals)} configs are valid")
+    return 1 if errors else 0
+
+
+def blueprint_build(args) -> int:
+    from utils.blueprint import construct_blueprint_deploy_bytecode
+
+    if args.bytecode:
+        initcode = _read_hex(args.bytecode)
+    else:
+        from utils.build import get_artifact
+
+        initcode = get_artifact(args.contract, args.mode)["bytecode"]
+
+    preamble_data = _read_hex(args.preamble_data) if args.preamble_data is not None else None
+    print("0x" + construct_blueprint_deploy_bytecode(initcode, args.eip5202_version, preamble_data).hex())
+    return 0
+
+
+def blueprint_verify(args) -> int:
+    from utils.blueprint import (
+        DEPLOY_PREAMBLE_INITIAL_BYTE,
+        verify_blueprint_deploy_preamble,
+        verify_eip522_blueprint,
+    )
+
+    bytecode = _read_hex(args.bytecode)
+    try:
+        # deploy bytecode starts with PUSH2, a deployed blueprint with the 0xFE halt byte
+        if bytecode[:1] == DEPLOY_PREAMBLE_INITIAL_BYTE:
+            blueprint = verify_blueprint_deploy_preamble(bytecode)
+        else:
+            blueprint = verify_eip522_blueprint(bytecode, args.eip5202_version)
+    except AssertionError as error:
+        print(f"error: not a valid blueprint: {error}", file=sys.stderr)
+        return 1
+
+    print(f"version: {blueprint.version}")
+    print(f"code offset: {blueprint.code_offset}")
+    if blueprint.preamble_data is not None:
+        print(f"preamble data: 0x{blueprint.preamble_data.hex()}")
+    print(f"initcode: {len(blueprint.initcode)} bytes")
+
+    if args.contract:
+        from utils.build import get_artifact
+
+        expected = _read_hex(get_artifact(args.contract, args.mode)["bytecode"])
+        if blueprint.initcode != expected:
+            print(f"error: initcode does not match {args.contract}", file=sys.stderr)
+            return 1
+        print(f"initcode matches {args.contract}")
+    return 0
+
+
+def create_address(args) -> int:
+    from utils.address import compute_create_address
+
+    for nonce in range(args.nonce, args.nonce + args.count):
+        print(f"{nonce}: {compute_create_address(args.sender, nonce)}")
+    return 0
+
+
+def calldata_create_gate_seal(args) -> int:
+    from utils.abi import encode_create_gate_seal
+
+    print(
+        "0x"
+        + encode_create_gate_seal(
+            args.sealing_committee,
+            args.seal_duration_seconds,
+            _split(args.sealables),
+            args.expiry_timestamp,
+        ).hex()
+    )
+    return 0
+
+
+def calldata_seal(args) -> int:
+    from utils.abi import encode_seal
+
+    print("0x" + encode_seal(_split(args.sealables)).hex())
+    return 0
+
+
+def _add_gate_seal_config_arguments(parser):
+    # defaults are read from the same environment variables as scripts/deploy_gate_seal.py
+    for name, type, help in [
+        ("SEALING_COMMITTEE", str, None),
+        ("SEAL_DURATION_SECONDS", int, None),
+        ("SEALABLES", str, "comma-separated addresses"),
+        ("EXPIRY_TIMESTAMP", int, None),
+    ]:
+        parser.add_argument(
+            "--" + name.lower().replace("_", "-"),
+            type=type,
+            default=os.getenv(name),
+            required=not os.getenv(name),
+            help=help,
+        )
+
+
+def _add_artifact_arguments(parser, required=False):
+    parser.add_argument("--contract", required=required, help="contract name, e.g. GateSeal")
+    parser.add_argument("--mode", default="gas", help="compiler optimization mode")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m utils.cli", description="Offline GateSeal tasks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate = commands.add_parser("validate-config", help="validate GateSeal constructor parameters")
+    _add_gate_seal_config_arguments(validate)
+    validate.add_argument("--now", type=int, help="timestamp to validate the expiry against, defaults to now")
+    validate.set_defaults(handler=validate_config)
+
+    manifest = commands.add_parser("validate-manifest", help="validate every GateSeal config of a manifest")
+    manifest.add_argument("manifest", help='JSON file with {"seals": [{"sealing_committee": ..., ...}]}')
+    manifest.add_argument("--now", type=int, help="timestamp to validate the expiry against, defaults to now")
+    manifest.set_defaults(handler=validate_manifest)
+
+    blueprint = commands.add_parser("blueprint", help="build or verify EIP-5202 blueprints")
+    blueprint_commands = blueprint.add_subparsers(dest="blueprint_command", required=True)
+
+    build = blueprint_commands.add_parser("build", help="print the blueprint deploy bytecode")
+    source = build.add_mutually_exclusive_group(required=True)
+    source.add_argument("--bytecode", help="initcode as hex or @file")
+    source.add_argument("--contract", help="contract name, e.g. GateSeal")
+    build.add_argument("--mode", default="gas", help="compiler optimization mode")
+    build.add_argument("--preamble-data", help="EIP-5202 preamble data as hex or @file")
+    build.add_argument("--eip5202-version", type=int, default=0)
+    build.set_defaults(handler=blueprint_build)
+
+    verify = blueprint_commands.add_parser("verify", help="verify blueprint or blueprint deploy bytecode")
+    verify.add_argument("bytecode", help="bytecode as hex or @file")
+    verify.add_argument("--eip5202-version", type=int, default=0)
+    _add_artifact_arguments(verify)
+    verify.set_defaults(handler=blueprint_verify)
+
+    address = commands.add_parser("create-address", help="compute CREATE contract addresses")
+    address.add_argument("--sender", required=True)
+    address.add_argument("--nonce", type=int, required=True)
+    address.add_argument("--count", type=int, default=1)
+    address.set_defaults(handler=create_address)
+
+    calldata = commands.add_parser("calldata", help="generate transaction calldata")
+    calldata_commands = calldata.add_subparsers(dest="calldata_command", required=True)
+
+    create_gate_seal = calldata_commands.add_parser("create-gate-seal", help="GateSealFactory.create_gate_seal")
+    _add_gate_seal_config_arguments(create_gate_seal)
+    create_gate_seal.set_defaults(handler=calldata_create_gate_seal)
+
+    seal = calldata_commands.add_parser("seal", help="GateSeal.seal")
+    seal.add_argument("--sealables", required=True, help="comma-separated addresses")
+    seal.set_defaults(handler=calldata_seal)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,4 +13,8 @@ def get_deployer() -> api.accounts.AccountAPI:
 
 
 def is_live_network() -> bool:
-    return chain.chain_id in [MAINNET_ID, GOERLI_ID, HOLESKY_ID, HOODI_ID]  # type: ignore
+    return is_live_chain(chain.chain_id)
+
+
+def is_live_chain(chain_id: int) -> bool:
+    return chain_id in [MAINNET_ID, GOERLI_ID, HOLESKY_ID, HOODI_ID]
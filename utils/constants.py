@@ -1,5 +1,7 @@
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 BLUEPRINT_ZERO_ADDRESS = "blueprint: zero address"
+IMPLEMENTATION_ZERO_ADDRESS = "implementation: zero address"
+MAX_GATE_SEALS_PAGE_SIZE = 100
 MIN_SEALABLES = 1
 MAX_SEALABLES = 8
 
@@ -1,8 +1,49 @@
+import contextlib
+import glob
+import json
+import os
 from ape import networks
 
+DEPLOYED_DIRECTORY = "deployed"
 
-def construct_deployed_filename(address: str, type="gateseal", check=False) -> str:
+
+def get_deployed_network(check=False) -> str:
     network = networks.active_provider.network.name
     if check:
-        network = networks.active_provider.network.name.replace("-fork", "")
-    return f"deployed/{network}/{type}/{address.lower()}.json"
+        network = network.replace("-fork", "")
+    return network
+
+
+def construct_deployed_filename(address: str, type="gateseal", check=False, network: str | None = None) -> str:
+    network = network or get_deployed_network(check)
+    return f"{DEPLOYED_DIRECTORY}/{network}/{type}/{address.lower()}.json"
+
+
+def write_deployed_entries(entries: dict[str, dict]):
+    """
+    Writes deployed files by filename, all or nothing: every file is first staged next to
+    its target and renamed into place only once all of them are written.
+    """
+    staged = []
+    try:
+        for filename, data in entries.items():
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            staged.append(filename)
+            with open(f"{filename}.tmp", "w") as deployed_file:
+                deployed_file.write(json.dumps(data))
+    except BaseException:
+        for filename in staged:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(f"{filename}.tmp")
+        raise
+
+    for filename in staged:
+        os.replace(f"{filename}.tmp", filename)
+
+
+def load_deployed_entries(network: str, type="gateseal") -> list[dict]:
+    entries = []
+    for filename in sorted(glob.glob(os.path.join(DEPLOYED_DIRECTORY, network, type, "*.json"))):
+        with open(filename, "r") as deployed_file:
+            entries.append(json.load(deployed_file))
+    return entries
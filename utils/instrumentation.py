@@ -0,0 +1,230 @@
+import atexit
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable, NamedTuple
+
+# Opt-in instrumentation of the JSON-RPC calls scripts make through the provider.
+#
+# RPC_PROFILE=1 logs a summary when the script exits, RPC_PROFILE=<filename>.json also writes
+# every call and the summary to the file. Scripts tag their steps with `phase(...)`
+# so that the calls and the wall time can be attributed to e.g. "deploy blueprint" or "checks".
+
+RPC_PROFILE_VARIABLE = "RPC_PROFILE"
+NO_PHASE = "-"
+
+# upper bounds of the latency histogram buckets, the last bucket is unbounded
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class RpcCall(NamedTuple):
+    phase: str
+    method: str
+    latency_ms: float
+    request_bytes: int
+    response_bytes: int
+    failed: bool
+
+
+def _payload_size(payload) -> int:
+    return len(json.dumps(payload, default=str))
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    # nearest-rank percentile of sorted values
+    return values[max(0, -(-len(values) * percent // 100) - 1)]
+
+
+def latency_histogram(latencies: list[float]) -> dict[str, int]:
+    buckets = {f"<={bound}ms": 0 for bound in LATENCY_BUCKETS_MS}
+    buckets[f">{LATENCY_BUCKETS_MS[-1]}ms"] = 0
+    for latency in latencies:
+        bound = next((bound for bound in LATENCY_BUCKETS_MS if latency <= bound), None)
+        buckets[f"<={bound}ms" if bound else f">{LATENCY_BUCKETS_MS[-1]}ms"] += 1
+    return buckets
+
+
+class RpcRecorder:
+    def __init__(self):
+        self.calls = []
+        self.phases = []
+        # phase -> wall time in seconds
+        self.phase_durations = {}
+
+    @property
+    def current_phase(self) -> str:
+        return self.phases[-1] if self.phases else NO_PHASE
+
+    def record(self, method, latency_ms, request_bytes, response_bytes, failed=False):
+        self.calls.append(
+            RpcCall(self.current_phase, method, latency_ms, request_bytes, response_bytes, failed)
+        )
+
+    @contextmanager
+    def phase(self, name: str):
+        self.phases.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.pop()
+            self.phase_durations[name] = self.phase_durations.get(name, 0) + time.perf_counter() - start
+
+    def wrap(self, make_request: Callable) -> Callable:
+        def instrumented_make_request(method, params):
+            start = time.perf_counter()
+            failed = True
+            response = None
+            try:
+                response = make_request(method, params)
+                failed = isinstance(response, dict) and "error" in response
+                return response
+            finally:
+                self.record(
+                    str(method),
+                    (time.perf_counter() - start) * 1000,
+                    _payload_size(params),
+                    _payload_size(response) if response is not None else 0,
+                    failed,
+                )
+
+        return instrumented_make_request
+
+    def instrument(self, web3_provider):
+        """
+        Wraps `make_request` of the web3 provider, once.
+        """
+        if getattr(web3_provider.make_request, "instrumented", False):
+            return
+        web3_provider.make_request = self.wrap(web3_provider.make_request)
+        web3_provider.make_request.instrumented = True
+        # web3 caches the middleware chain built around the previous `make_request`, so that
+        # `web3.eth` calls would bypass the wrapper until the middleware changes
+        web3_provider._request_func_cache = (None, None)
+
+    def summary(self) -> dict:
+        def aggregate(calls):
+            latencies = sorted(call.latency_ms for call in calls)
+            return {
+                "calls": len(calls),
+                "failed": sum(call.failed for call in calls),
+                "total_ms": round(sum(latencies), 3),
+                "p50_ms": round(_percentile(latencies, 50), 3),
+                "p95_ms": round(_percentile(latencies, 95), 3),
+                "max_ms": round(latencies[-1], 3),
+                "request_bytes": sum(call.request_bytes for call in calls),
+                "response_bytes": sum(call.response_bytes for call in calls),
+            }
+
+        def group(key):
+            groups = {}
+            for call in self.calls:
+                groups.setdefault(getattr(call, key), []).append(call)
+            return {name: aggregate(calls) for name, calls in groups.items()}
+
+        phases = group("phase")
+        for name, duration in self.phase_durations.items():
+            phases.setdefault(name, {"calls": 0, "total_ms": 0})["wall_ms"] = round(duration * 1000, 3)
+
+        return {
+            "total": aggregate(self.calls) if self.calls else {"calls": 0},
+            "histogram": latency_histogram([call.latency_ms for call in self.calls]),
+            "methods": group("method"),
+            "phases": phases,
+        }
+
+
+def format_summary(summary: dict) -> str:
+    output = [f"{summary['total']['calls']} RPC calls, {summary['total'].get('total_ms', 0):.0f} ms"]
+
+    output.append(
+        f"{'method':<32} {'calls':>6} {'total ms':>10} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} "
+        f"{'bytes in/out':>16}"
+    )
+    methods = sorted(summary["methods"].items(), key=lambda item: item[1]["total_ms"], reverse=True)
+    for method, stats in methods:
+        output.append(
+            f"{method:<32} {stats['calls']:>6} {stats['total_ms']:>10.1f} {stats['p50_ms']:>8.1f} "
+            f"{stats['p95_ms']:>8.1f} {stats['max_ms']:>8.1f} "
+            f"{str(stats['request_bytes']) + '/' + str(stats['response_bytes']):>16}"
+        )
+
+    output.append(f"{'phase':<32} {'calls':>6} {'rpc ms':>10} {'wall ms':>10}")
+    for name, stats in summary["phases"].items():
+        wall = stats.get("wall_ms")
+        output.append(
+            f"{name:<32} {stats['calls']:>6} {stats['total_ms']:>10.1f} "
+            f"{f'{wall:.1f}' if wall is not None else '-':>10}"
+        )
+
+    histogram = summary["histogram"].items()
+    output.append("latency: " + ", ".join(f"{bucket}: {count}" for bucket, count in histogram if count))
+    return "\n".join(output)
+
+
+_recorder: RpcRecorder | None = None
+
+
+def get_recorder() -> RpcRecorder | None:
+    return _recorder
+
+
+def record_rpc_call(method, latency_ms, request_bytes, response_bytes, failed=False):
+    """
+    Records a call made outside of the provider, e.g. a `utils/rpc.py` batch; no-op unless enabled.
+    """
+    if _recorder is not None:
+        _recorder.record(method, latency_ms, request_bytes, response_bytes, failed)
+
+
+@contextmanager
+def phase(name: str):
+    if _recorder is None:
+        yield
+        return
+    with _recorder.phase(name):
+        yield
+
+
+def report(recorder: RpcRecorder, filename: str | None = None):
+    from ape.logging import logger
+
+    summary = recorder.summary()
+    logger.info("RPC profile:\n" + format_summary(summary))
+    if filename:
+        with open(filename, "w") as report_file:
+            json.dump(
+                {"summary": summary, "calls": [call._asdict() for call in recorder.calls]},
+                report_file,
+                indent=4,
+            )
+        logger.success(f"RPC profile: {filename}")
+
+
+def instrument_provider(
+    provider, filename: str | None = None, report_at_exit: bool = True
+) -> RpcRecorder:
+    """
+    Records every request the ape provider sends through its web3 provider, directly or through
+    `web3.eth`, and reports at exit.
+    """
+    global _recorder
+    if _recorder is None:
+        _recorder = RpcRecorder()
+        if report_at_exit:
+            atexit.register(report, _recorder, filename)
+
+    _recorder.instrument(provider.web3.provider)
+    return _recorder
+
+
+def instrument_from_env() -> RpcRecorder | None:
+    value = os.getenv(RPC_PROFILE_VARIABLE)
+    if not value or value.lower() in ("0", "false", "no"):
+        return None
+
+    from ape import networks
+
+    filename = value if value.endswith(".json") else None
+    return instrument_provider(networks.active_provider, filename)
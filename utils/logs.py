@@ -0,0 +1,138 @@
+import struct
+from array import array
+from functools import lru_cache
+from typing import NamedTuple
+
+from utils.abi import keccak
+
+# Decodes GateSealCreated and Sealed logs straight from their topics and data, in bulk and
+# without the ABI machinery of ape or eth-abi. Neither event has indexed fields, so the data
+# of a log is a fixed number of words in declaration order: the data of all matching logs is
+# concatenated and unpacked by a single `struct` pass.
+#
+# Decoded logs are kept in columns instead of an object per log: addresses as 20-byte values
+# concatenated into one `bytes`, durations and timestamps as `array("Q")`. They are turned
+# into hex strings only when a single log is looked at.
+
+GATE_SEAL_CREATED_SIGNATURE = "GateSealCreated(address)"
+SEALED_SIGNATURE = "Sealed(address,address,uint256,address,uint256)"
+
+ADDRESS_LENGTH = 20
+
+# an address word is 12 zero bytes and the address, a uint256 word is kept if it fits in
+# 64 bits, i.e. its 24 high bytes are zero
+_ADDRESS_WORD = "12x20s"
+_UINT64_WORD = "24sQ"
+_ZERO_HIGH_BYTES = bytes(24)
+
+GATE_SEAL_CREATED_LAYOUT = struct.Struct(">" + _ADDRESS_WORD)
+SEALED_LAYOUT = struct.Struct(">" + 2 * _ADDRESS_WORD + _UINT64_WORD + _ADDRESS_WORD + _UINT64_WORD)
+
+
+class SealedEvent(NamedTuple):
+    gate_seal: str
+    sealed_by: str
+    sealed_for: int
+    sealable: str
+    sealed_at: int
+
+
+@lru_cache(maxsize=None)
+def event_topic(signature: str) -> str:
+    return "0x" + keccak(signature.encode()).hex()
+
+
+def get_sealed_topic() -> str:
+    return event_topic(SEALED_SIGNATURE)
+
+
+def get_gate_seal_created_topic() -> str:
+    return event_topic(GATE_SEAL_CREATED_SIGNATURE)
+
+
+def get_address(column: bytes, index: int) -> str:
+    return "0x" + column[index * ADDRESS_LENGTH : (index + 1) * ADDRESS_LENGTH].hex()
+
+
+class GateSealCreatedLogs:
+    def __init__(self, factories: bytes, gate_seals: bytes):
+        # the factory that emitted the log
+        self.factories = factories
+        self.gate_seals = gate_seals
+
+    def __len__(self) -> int:
+        return len(self.gate_seals) // ADDRESS_LENGTH
+
+    def gate_seal(self, index: int) -> str:
+        return get_address(self.gate_seals, index)
+
+
+class SealedLogs:
+    def __init__(
+        self, gate_seals: bytes, sealed_by: bytes, sealed_for: array, sealables: bytes, sealed_at: array
+    ):
+        self.gate_seals = gate_seals
+        self.sealed_by = sealed_by
+        self.sealed_for = sealed_for
+        self.sealables = sealables
+        self.sealed_at = sealed_at
+
+    def __len__(self) -> int:
+        return len(self.sealed_at)
+
+    def event(self, index: int) -> SealedEvent:
+        return SealedEvent(
+            get_address(self.gate_seals, index),
+            get_address(self.sealed_by, index),
+            self.sealed_for[index],
+            get_address(self.sealables, index),
+            self.sealed_at[index],
+        )
+
+    def events(self) -> list[SealedEvent]:
+        return [self.event(index) for index in range(len(self))]
+
+
+def _unpack(logs: list[dict], topic: str, layout: struct.Struct) -> tuple[list[dict], list[tuple]]:
+    """
+    Returns the logs with the topic and their data unpacked into columns.
+    """
+    matching = [log for log in logs if log["topics"][:1] == [topic]]
+    data_length = 2 + 2 * layout.size
+    assert all(len(log["data"]) == data_length for log in matching), "unexpected log data length"
+
+    data = bytes.fromhex("".join([log["data"][2:] for log in matching]))
+    columns = list(zip(*layout.iter_unpack(data)))
+    if not columns:
+        columns = [()] * len(layout.unpack(bytes(layout.size)))
+    return matching, columns
+
+
+def _uint64_column(high_bytes: tuple, values: tuple) -> array:
+    assert set(high_bytes) <= {_ZERO_HIGH_BYTES}, "value does not fit in 64 bits"
+    return array("Q", values)
+
+
+def decode_gate_seal_created_logs(logs: list[dict]) -> GateSealCreatedLogs:
+    """
+    Decodes the GateSealCreated logs among JSON-RPC `logs`, other logs are skipped.
+    """
+    matching, (gate_seals,) = _unpack(logs, get_gate_seal_created_topic(), GATE_SEAL_CREATED_LAYOUT)
+    factories = bytes.fromhex("".join([log["address"][2:] for log in matching]))
+    return GateSealCreatedLogs(factories, b"".join(gate_seals))
+
+
+def decode_sealed_logs(logs: list[dict]) -> SealedLogs:
+    """
+    Decodes the Sealed logs among JSON-RPC `logs`, other logs are skipped.
+    """
+    _, (gate_seals, sealed_by, sealed_for_high, sealed_for, sealables, sealed_at_high, sealed_at) = _unpack(
+        logs, get_sealed_topic(), SEALED_LAYOUT
+    )
+    return SealedLogs(
+        b"".join(gate_seals),
+        b"".join(sealed_by),
+        _uint64_column(sealed_for_high, sealed_for),
+        b"".join(sealables),
+        _uint64_column(sealed_at_high, sealed_at),
+    )
@@ -0,0 +1,243 @@
+import contextlib
+import json
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, NamedTuple
+
+from eth_utils.address import to_checksum_address
+
+from utils.blueprint import verify_eip522_blueprint
+from utils.helpers import construct_deployed_filename
+from utils.pipeline import (
+    JOURNAL_DIRECTORY,
+    Journal,
+    NonceManager,
+    Step,
+    build_deployment_plan,
+    execute_plan,
+    get_created_gate_seal,
+    get_journal_filename,
+    get_plan_id,
+    get_step_receipts,
+)
+from utils.rpc import Rpc
+from utils.sender import FeeBumpingSender, FeePolicy, initial_fees
+from utils.validation import validate_manifest
+
+# Deploys the pipeline of utils/pipeline.py to several networks at once from a single manifest,
+#
+#     {
+#         "networks": {
+#             "holesky": {"rpc": "HOLESKY_RPC_URL", "chain_id": 17000, "seals": [{...}]},
+#             "mainnet": {"rpc": "MAINNET_RPC_URL", "chain_id": 1, "seals": [{...}]}
+#         }
+#     }
+#
+# `rpc` names the environment variable holding the RPC URL, so that API keys stay out of the
+# manifest, and `seals` are GateSeal configs as in the `params` of the deployed GateSeal files.
+#
+# Every network gets its own JSON-RPC endpoint, nonces and journal, and runs in a thread of its own.
+# The deployed files of all networks are written together once every network is done: if any
+# network fails, nothing is written and the journals are kept, so that the next run resumes.
+
+LOCAL_BASE_PORT = 8555
+LOCAL_BASE_CHAIN_ID = 31337
+NODE_STARTUP_TIMEOUT_SECONDS = 60
+NODE_POLL_INTERVAL_SECONDS = 0.5
+
+
+class NetworkTarget(NamedTuple):
+    # name of the `deployed/<network>` directory
+    name: str
+    uri: str
+    chain_id: int
+    seals: list[dict]
+
+
+class NetworkPlan(NamedTuple):
+    target: NetworkTarget
+    steps: list[Step]
+    journal: Journal
+    fee_policy: FeePolicy
+    # the fees of the first attempts at the time of preparation
+    max_fee: int
+    max_priority_fee: int
+    resumed: bool
+
+
+def load_manifest(filename: str) -> dict:
+    with open(filename, "r") as manifest_file:
+        manifest = json.load(manifest_file)
+    assert manifest.get("networks"), f"{filename} has no networks"
+    return manifest
+
+
+def get_targets(manifest: dict, environ: dict | None = None) -> list[NetworkTarget]:
+    environ = os.environ if environ is None else environ
+    targets = []
+    for name, network in manifest["networks"].items():
+        uri = environ.get(network["rpc"])
+        assert uri, f"{name}: `{network['rpc']}` not found"
+        targets.append(NetworkTarget(name, uri, network["chain_id"], network["seals"]))
+    return targets
+
+
+def get_local_targets(manifest: dict, uris: list[str]) -> list[NetworkTarget]:
+    """
+    Targets the local nodes of `start_local_nodes` instead of the networks of the manifest.
+    """
+    return [
+        NetworkTarget(f"{name}-local", uri, LOCAL_BASE_CHAIN_ID + index, network["seals"])
+        for index, (uri, (name, network)) in enumerate(zip(uris, manifest["networks"].items()))
+    ]
+
+
+def wait_for_node(uri: str, process: subprocess.Popen, timeout: int = NODE_STARTUP_TIMEOUT_SECONDS):
+    deadline = time.monotonic() + timeout
+    while True:
+        assert process.poll() is None, f"node at {uri} exited with {process.returncode}"
+        try:
+            Rpc(uri)("eth_chainId", [])
+            return
+        except Exception:
+            assert time.monotonic() < deadline, f"node at {uri} did not start in {timeout}s"
+            time.sleep(NODE_POLL_INTERVAL_SECONDS)
+
+
+@contextlib.contextmanager
+def start_local_nodes(count: int, base_port: int = LOCAL_BASE_PORT, base_chain_id: int = LOCAL_BASE_CHAIN_ID):
+    """
+    Runs `count` hardhat nodes on consecutive ports and chain ids, yields their URIs.
+    """
+    processes = []
+    uris = [f"http://127.0.0.1:{base_port + index}" for index in range(count)]
+    try:
+        for index in range(count):
+            processes.append(
+                subprocess.Popen(
+                    ["npx", "hardhat", "node", "--port", str(base_port + index)],
+                    # see hardhat.config.js
+                    env={**os.environ, "HARDHAT_CHAIN_ID": str(base_chain_id + index)},
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            )
+        for uri, process in zip(uris, processes):
+            wait_for_node(uri, process)
+        yield uris
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait()
+
+
+def prepare_network(
+    target: NetworkTarget,
+    deployer: str,
+    gate_seal_initcode: str | bytes,
+    factory_initcode: str | bytes,
+    fee_policy: FeePolicy,
+    journal_directory: str = JOURNAL_DIRECTORY,
+) -> NetworkPlan:
+    """
+    Checks the network and the seals, and lays out the deployment plan without sending anything.
+    """
+    rpc = Rpc(target.uri)
+    chain_id, latest, pending_nonce = rpc.batch(
+        [
+            ("eth_chainId", []),
+            ("eth_getBlockByNumber", ["latest", False]),
+            ("eth_getTransactionCount", [deployer, "pending"]),
+        ]
+    )
+    assert int(chain_id, 16) == target.chain_id, (
+        f"{target.name}: {target.uri} serves chain {int(chain_id, 16)}, expected {target.chain_id}"
+    )
+
+    errors = validate_manifest(target.seals, int(latest["timestamp"], 16))
+    assert not errors, f"{target.name}: " + "; ".join(
+        f"seals[{index}]: {error}" for index, seal_errors in errors.items() for error in seal_errors
+    )
+
+    journal = Journal(get_journal_filename(target.chain_id, deployer, journal_directory))
+    resumed = journal.start_nonce is not None
+    # a resumed run lays out the plan from the nonce of the interrupted run
+    start_nonce = journal.start_nonce if resumed else int(pending_nonce, 16)
+    steps = build_deployment_plan(
+        deployer, NonceManager(start_nonce), gate_seal_initcode, factory_initcode, target.seals
+    )
+    journal.begin(get_plan_id(steps), start_nonce)
+
+    max_fee, max_priority_fee = initial_fees(fee_policy, int(latest["baseFeePerGas"], 16))
+    return NetworkPlan(target, steps, journal, fee_policy, max_fee, max_priority_fee, resumed)
+
+
+def prepare_networks(targets: list[NetworkTarget], *args, **kwargs) -> list[NetworkPlan]:
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        return list(executor.map(lambda target: prepare_network(target, *args, **kwargs), targets))
+
+
+def deploy_network(plan: NetworkPlan, sign: Callable[[dict], bytes], deployer: str) -> dict[str, dict]:
+    """
+    Executes the plan of a single network and returns its deployed files by filename.
+    """
+    target = plan.target
+    rpc = Rpc(target.uri)
+    execute_plan(plan.steps, FeeBumpingSender(rpc, sign, deployer, target.chain_id, plan.fee_policy, plan.journal))
+
+    receipts = get_step_receipts(rpc, plan.steps, plan.journal)
+    blueprint, factory, *gate_seals = plan.steps
+    verify_eip522_blueprint(bytes.fromhex(rpc("eth_getCode", [blueprint.contract_address, "latest"])[2:]))
+
+    entries = {
+        construct_deployed_filename(factory.contract_address, "factory", network=target.name): {
+            "factory": factory.contract_address,
+            "blueprint": blueprint.contract_address,
+            "tx_hash": receipts[factory.name]["transactionHash"],
+            "deployer": deployer,
+        }
+    }
+    for step, seal in zip(gate_seals, target.seals):
+        receipt = receipts[step.name]
+        gate_seal_address = to_checksum_address(get_created_gate_seal(receipt))
+        assert gate_seal_address == step.contract_address, f"{target.name}: {step.name}: unexpected address"
+        entries[construct_deployed_filename(gate_seal_address, "gateseal", network=target.name)] = {
+            "factory": factory.contract_address,
+            "gate_seal": gate_seal_address,
+            "tx_hash": receipt["transactionHash"],
+            "deployer": deployer,
+            "params": seal,
+        }
+    return entries
+
+
+def deploy_networks(
+    plans: list[NetworkPlan], sign: Callable[[dict], bytes], deployer: str
+) -> tuple[dict[str, dict], dict[str, Exception]]:
+    """
+    Deploys to every network concurrently. Returns the deployed files of all networks
+    by filename and the errors of the failed networks by network name.
+    """
+    lock = threading.Lock()
+
+    # an account may prompt for its passphrase, one network at a time
+    def locked_sign(transaction: dict) -> bytes:
+        with lock:
+            return sign(transaction)
+
+    with ThreadPoolExecutor(max_workers=len(plans)) as executor:
+        futures = {
+            plan.target.name: executor.submit(deploy_network, plan, locked_sign, deployer) for plan in plans
+        }
+
+    entries, errors = {}, {}
+    for name, future in futures.items():
+        try:
+            entries.update(future.result())
+        except Exception as error:
+            errors[name] = error
+    return entries, errors
@@ -0,0 +1,227 @@
+import json
+import os
+from typing import NamedTuple
+
+from utils.abi import decode_address, decode_uint256, encode_address, function_selector
+from utils.rpc import RpcError
+
+# GateSeals assume that they are allowed to pause their sealables, nothing on-chain checks that
+# until `seal()` fails during an emergency. The checker asks every sealable whether each GateSeal
+# using it still holds the pause permission, in two rounds of concurrent JSON-RPC batches
+# however many pairs there are:
+# 1. the role getters (e.g. `PAUSE_ROLE()`) and `owner()` of every distinct sealable,
+# 2. `hasRole(role, gate_seal)` of every (GateSeal, sealable) pair.
+#
+# The permission is probed with `hasRole` by default, probes are configured per sealable in JSON:
+# {
+#     "default": {"kind": "has_role", "role_getter": "PAUSE_ROLE()"},
+#     "sealables": {
+#         "0x...": {"kind": "has_role", "role": "0x<bytes32 role>"},
+#         "0x...": {"kind": "owner"}
+#     }
+# }
+
+PERMISSIONS_STATE_DIRECTORY = ".cache/permissions"
+
+HAS_ROLE = "has_role"
+OWNER = "owner"
+PROBE_KINDS = (HAS_ROLE, OWNER)
+
+DEFAULT_ROLE_GETTER = "PAUSE_ROLE()"
+HAS_ROLE_SIGNATURE = "hasRole(bytes32,address)"
+OWNER_SIGNATURE = "owner()"
+GET_EXPIRY_TIMESTAMP_SIGNATURE = "get_expiry_timestamp()"
+
+
+class Probe(NamedTuple):
+    kind: str = HAS_ROLE
+    role_getter: str = DEFAULT_ROLE_GETTER
+    # a fixed bytes32 role as a hex string, skips the role getter
+    role: str | None = None
+
+
+class PermissionCheck(NamedTuple):
+    gate_seal: str
+    sealable: str
+    probe: str
+    # `None` if the probe itself failed, e.g. the sealable has no such role getter
+    permitted: bool | None
+    error: str | None = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.gate_seal.lower()}:{self.sealable.lower()}"
+
+
+def parse_probes(data: dict) -> tuple[Probe, dict[str, Probe]]:
+    """
+    Returns the default probe and the probes by lowercase sealable address.
+    """
+
+    def parse(probe: dict) -> Probe:
+        unknown = set(probe) - set(Probe._fields)
+        assert not unknown, f"unknown probe keys: {', '.join(sorted(unknown))}"
+        probe = Probe(**probe)
+        assert probe.kind in PROBE_KINDS, f"unknown probe kind {probe.kind}"
+        assert probe.role is None or len(probe.role) == 66, f"role must be a bytes32 hex string: {probe.role}"
+        return probe
+
+    return parse(data.get("default", {})), {
+        sealable.lower(): parse(probe) for sealable, probe in data.get("sealables", {}).items()
+    }
+
+
+def load_probes(filename: str | None) -> tuple[Probe, dict[str, Probe]]:
+    if not filename:
+        return Probe(), {}
+    with open(filename, "r") as probes_file:
+        return parse_probes(json.load(probes_file))
+
+
+def _call(to: str, data: bytes, block: str) -> tuple[str, list]:
+    return ("eth_call", [{"to": to, "data": "0x" + data.hex()}, block])
+
+
+def _describe(error: RpcError) -> str:
+    return f"{error.method} failed: {error.error.get('message', error.error)}"
+
+
+def _result(result) -> bytes | RpcError:
+    if isinstance(result, RpcError):
+        return result
+    data = bytes.fromhex(result[2:])
+    # calls to accounts without code or without the function succeed with no data
+    if len(data) < 32:
+        return RpcError("eth_call", {"message": "no return data"})
+    return data
+
+
+def get_gate_seal_pairs(gate_seals: list[dict]) -> list[tuple[str, str]]:
+    """
+    Lists `(gate_seal, sealable)` pairs of the entries of `deployed/<network>/gateseal`.
+    """
+    return [
+        (entry["gate_seal"], sealable) for entry in gate_seals for sealable in entry["params"]["sealables"]
+    ]
+
+
+async def get_active_gate_seals(
+    rpc, gate_seals: list[str], now: int, block: str = "latest"
+) -> tuple[list[str], dict[str, str]]:
+    """
+    Filters out expired (including already sealed) GateSeals, which no longer need the permission.
+    Returns the active GateSeals and the errors of the ones whose expiry could not be read,
+    e.g. a GateSeal with no code at its address.
+    """
+    selector = function_selector(GET_EXPIRY_TIMESTAMP_SIGNATURE)
+    results = await rpc.batch([_call(gate_seal, selector, block) for gate_seal in gate_seals], raise_errors=False)
+    active, errors = [], {}
+    for gate_seal, result in zip(gate_seals, results):
+        result = _result(result)
+        if isinstance(result, RpcError):
+            errors[gate_seal] = _describe(result)
+        elif decode_uint256(result) > now:
+            active.append(gate_seal)
+    return active, errors
+
+
+def get_expiry_failures(gate_seals: list[dict], errors: dict[str, str]) -> list[PermissionCheck]:
+    """
+    Reports every pair of the GateSeals whose expiry could not be read as a failed probe.
+    """
+    return [
+        PermissionCheck(gate_seal, sealable, "expiry", None, errors[gate_seal])
+        for gate_seal, sealable in get_gate_seal_pairs(gate_seals)
+        if gate_seal in errors
+    ]
+
+
+async def check_permissions(
+    rpc,
+    pairs: list[tuple[str, str]],
+    default_probe: Probe = Probe(),
+    probes: dict[str, Probe] | None = None,
+    block: str = "latest",
+) -> list[PermissionCheck]:
+    """
+    Probes whether every GateSeal may pause its sealable, `rpc` is a utils/async_rpc.py::AsyncRpc.
+    """
+    probes = probes or {}
+    pair_probes = [probes.get(sealable.lower(), default_probe) for _, sealable in pairs]
+
+    # 1. role getters and owners, once per sealable
+    lookups = {}
+    for (_, sealable), probe in zip(pairs, pair_probes):
+        if probe.kind == OWNER:
+            lookups.setdefault((sealable.lower(), OWNER_SIGNATURE), sealable)
+        elif probe.role is None:
+            lookups.setdefault((sealable.lower(), probe.role_getter), sealable)
+    results = await rpc.batch(
+        [_call(sealable, function_selector(signature), block) for (_, signature), sealable in lookups.items()],
+        raise_errors=False,
+    )
+    looked_up = {key: _result(result) for key, result in zip(lookups, results)}
+
+    # 2. hasRole of every pair whose role is known
+    role_calls = {}
+    for index, ((gate_seal, sealable), probe) in enumerate(zip(pairs, pair_probes)):
+        if probe.kind != HAS_ROLE:
+            continue
+        role = bytes.fromhex(probe.role[2:]) if probe.role else looked_up[(sealable.lower(), probe.role_getter)]
+        if isinstance(role, bytes):
+            role_calls[index] = _call(
+                sealable, function_selector(HAS_ROLE_SIGNATURE) + role[:32] + encode_address(gate_seal), block
+            )
+    results = await rpc.batch(list(role_calls.values()), raise_errors=False) if role_calls else []
+    has_role = {index: _result(result) for index, result in zip(role_calls, results)}
+
+    checks = []
+    for index, ((gate_seal, sealable), probe) in enumerate(zip(pairs, pair_probes)):
+        if probe.kind == OWNER:
+            result = looked_up[(sealable.lower(), OWNER_SIGNATURE)]
+            permitted = (
+                decode_address(result).lower() == gate_seal.lower() if isinstance(result, bytes) else None
+            )
+        else:
+            result = has_role.get(index, looked_up.get((sealable.lower(), probe.role_getter)))
+            permitted = decode_uint256(result) == 1 if isinstance(result, bytes) else None
+        error = _describe(result) if permitted is None else None
+        checks.append(PermissionCheck(gate_seal, sealable, probe.kind, permitted, error))
+    return checks
+
+
+def get_permissions_state_filename(network: str) -> str:
+    return os.path.join(PERMISSIONS_STATE_DIRECTORY, f"{network}.json")
+
+
+def load_permissions_state(filename: str) -> dict[str, bool | None]:
+    if not os.path.exists(filename):
+        return {}
+    with open(filename, "r") as state_file:
+        return json.load(state_file)
+
+
+def save_permissions_state(filename: str, checks: list[PermissionCheck]):
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    with open(f"{filename}.tmp", "w") as state_file:
+        json.dump({check.key: check.permitted for check in checks}, state_file, indent=4)
+    os.replace(f"{filename}.tmp", filename)
+
+
+def find_drift(checks: list[PermissionCheck], previous: dict[str, bool | None]) -> list[str]:
+    """
+    Describes every pair that is not permitted, and every pair whose permission changed
+    since the previous check.
+    """
+    drift = []
+    for check in checks:
+        pair = f"{check.gate_seal} -> {check.sealable}"
+        was = previous.get(check.key)
+        if check.permitted is None:
+            drift.append(f"{pair}: {check.probe} probe failed, {check.error}")
+        elif not check.permitted:
+            since = ", was permitted on the previous check" if was else ""
+            drift.append(f"{pair}: not permitted by {check.probe}{since}")
+        elif was is False:
+            drift.append(f"{pair}: permitted again")
+    return drift
@@ -0,0 +1,280 @@
+import json
+import os
+import time
+from typing import Callable, NamedTuple
+
+from utils.abi import encode_address, encode_create_gate_seal, keccak
+from utils.address import compute_create_address
+from utils.blueprint import construct_blueprint_deploy_bytecode
+from utils.logs import decode_gate_seal_created_logs
+
+# The pipeline signs the blueprint, factory and GateSeal transactions up front with locally
+# tracked nonces, broadcasts them back to back and then waits for all receipts at once.
+# This works because every address is known in advance:
+# - the blueprint and the factory are CREATE-deployed by the deployer at consecutive nonces,
+# - GateSeals are CREATE-deployed by the factory whose nonce starts at 1 (EIP-161).
+#
+# The transactions go through the fee bumping sender of utils/sender.py at the nonces of the plan,
+# so a step stuck behind a rising base fee is re-broadcast with higher fees at the same nonce.
+# Every signed transaction is written to the journal before it is broadcast, so a crashed run
+# can be resumed by re-broadcasting the very same transactions instead of signing new ones.
+
+JOURNAL_DIRECTORY = ".cache/journals"
+
+# GateSeal creation cannot be estimated before the factory is mined,
+# so its gas limit is derived from the number of sealables instead
+CREATE_GATE_SEAL_BASE_GAS_LIMIT = 1_000_000
+CREATE_GATE_SEAL_GAS_LIMIT_PER_SEALABLE = 50_000
+GAS_LIMIT_MARGIN_PERCENT = 20
+
+RECEIPT_POLL_INTERVAL_SECONDS = 1
+RECEIPT_TIMEOUT_SECONDS = 600
+
+
+class Step(NamedTuple):
+    name: str
+    nonce: int
+    to: str | None
+    data: bytes
+    # address of the contract the step deploys
+    contract_address: str
+    # `None` if the gas limit has to be estimated
+    gas_limit: int | None
+
+
+class NonceManager:
+    """
+    Hands out consecutive nonces starting from the one fetched once from the node.
+    """
+
+    def __init__(self, next_nonce: int):
+        self.next_nonce = next_nonce
+
+    def take(self) -> int:
+        nonce = self.next_nonce
+        self.next_nonce += 1
+        return nonce
+
+
+def create_gate_seal_gas_limit(sealables: list[str]) -> int:
+    return CREATE_GATE_SEAL_BASE_GAS_LIMIT + CREATE_GATE_SEAL_GAS_LIMIT_PER_SEALABLE * len(sealables)
+
+
+def build_deployment_plan(
+    deployer: str,
+    nonces: NonceManager,
+    gate_seal_initcode: str | bytes,
+    factory_initcode: str | bytes,
+    seals: list[dict],
+) -> list[Step]:
+    """
+    Lays out the blueprint, factory and GateSeal transactions for consecutive deployer nonces.
+    `seals` are GateSeal configs with the same keys as the `params` of the deployed GateSeal files.
+    """
+    nonce = nonces.take()
+    blueprint_address = compute_create_address(deployer, nonce)
+    steps = [
+        Step(
+            "blueprint",
+            nonce,
+            None,
+            construct_blueprint_deploy_bytecode(gate_seal_initcode),
+            blueprint_address,
+            None,
+        )
+    ]
+
+    if isinstance(factory_initcode, str):
+        factory_initcode = bytes.fromhex(factory_initcode.removeprefix("0x"))
+    nonce = nonces.take()
+    factory_address = compute_create_address(deployer, nonce)
+    steps.append(
+        Step(
+            "factory",
+            nonce,
+            None,
+            factory_initcode + encode_address(blueprint_address),
+            factory_address,
+            None,
+        )
+    )
+
+    for index, seal in enumerate(seals):
+        steps.append(
+            Step(
+                f"gateseal-{index}",
+                nonces.take(),
+                factory_address,
+                encode_create_gate_seal(
+                    seal["sealing_committee"],
+                    seal["seal_duration_seconds"],
+                    seal["sealables"],
+                    seal["expiry_timestamp"],
+                ),
+                compute_create_address(factory_address, index + 1),
+                create_gate_seal_gas_limit(seal["sealables"]),
+            )
+        )
+
+    return steps
+
+
+def get_plan_id(steps: list[Step]) -> str:
+    # the plan is identified by its transactions, so a resumed run cannot silently change them
+    return keccak(
+        json.dumps([[step.name, step.nonce, step.to, step.data.hex()] for step in steps]).encode()
+    ).hex()
+
+
+class Journal:
+    """
+    Per-step state of a deployment, persisted after every change.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.plan_id = None
+        self.start_nonce = None
+        self.steps = {}
+
+        if os.path.exists(filename):
+            with open(filename, "r") as journal_file:
+                data = json.load(journal_file)
+            self.plan_id = data["plan_id"]
+            self.start_nonce = data["start_nonce"]
+            self.steps = data["steps"]
+
+    def begin(self, plan_id: str, start_nonce: int):
+        if self.plan_id is not None:
+            assert self.plan_id == plan_id, f"{self.filename} belongs to a different deployment plan"
+            return
+        self.plan_id = plan_id
+        self.start_nonce = start_nonce
+        self.save()
+
+    def get(self, name: str) -> dict | None:
+        return self.steps.get(name)
+
+    def update(self, name: str, **fields):
+        self.steps.setdefault(name, {}).update(fields)
+        self.save()
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.filename) or ".", exist_ok=True)
+        # write-then-rename so that a crash never leaves a truncated journal
+        with open(f"{self.filename}.tmp", "w") as journal_file:
+            json.dump(
+                {"plan_id": self.plan_id, "start_nonce": self.start_nonce, "steps": self.steps},
+                journal_file,
+                indent=4,
+            )
+        os.replace(f"{self.filename}.tmp", self.filename)
+
+    def archive(self):
+        """
+        Moves the finished journal aside so that the next deployment starts a new one.
+        """
+        os.replace(self.filename, f"{os.path.splitext(self.filename)[0]}-{int(time.time())}.done.json")
+
+
+def get_journal_filename(chain_id: int, deployer: str, directory: str = JOURNAL_DIRECTORY) -> str:
+    return os.path.join(directory, f"{chain_id}-{deployer.lower()}.json")
+
+
+def get_fees(make_request: Callable, max_priority_fee: int | None = None) -> tuple[int, int]:
+    """
+    Returns `(max_fee, max_priority_fee)` allowing the base fee to double before inclusion.
+    """
+    base_fee = int(make_request("eth_getBlockByNumber", ["latest", False])["baseFeePerGas"], 16)
+    if max_priority_fee is None:
+        max_priority_fee = int(make_request("eth_maxPriorityFeePerGas", []), 16)
+    return 2 * base_fee + max_priority_fee, max_priority_fee
+
+
+def estimate_gas_limit(make_request: Callable, deployer: str, step: Step) -> int:
+    transaction = {"from": deployer, "data": "0x" + step.data.hex()}
+    if step.to:
+        transaction["to"] = step.to
+    estimate = int(make_request("eth_estimateGas", [transaction]), 16)
+    return estimate * (100 + GAS_LIMIT_MARGIN_PERCENT) // 100
+
+
+def is_already_known(error: Exception) -> bool:
+    message = str(error).lower()
+    return "already known" in message or "already imported" in message
+
+
+def is_nonce_too_low(error: Exception) -> bool:
+    # either the transaction itself was mined or another transaction used its nonce
+    return "nonce too low" in str(error).lower()
+
+
+def _assert_not_lost(step: Step, entry: dict):
+    if entry["status"] == "failed":
+        raise AssertionError(f"{step.name} transaction {entry['transaction_hash']} reverted")
+    if entry["status"] == "replaced":
+        raise RuntimeError(f"{step.name}: nonce {step.nonce} was used by another transaction")
+
+
+def execute_plan(steps: list[Step], sender, timeout: int = RECEIPT_TIMEOUT_SECONDS) -> dict:
+    """
+    Sends every step that has not been mined yet and waits for all receipts, bumping the fees
+    of the steps that are not included. `sender` is a utils/sender.py::FeeBumpingSender of
+    the deployer journaling to the journal of the plan. Returns the receipts by step name.
+    """
+    journal = sender.journal
+    pending = []
+
+    for step in steps:
+        entry = journal.get(step.name)
+        if entry is not None:
+            if entry["status"] == "mined":
+                continue
+            _assert_not_lost(step, entry)
+            # resuming: the transaction that was already signed for this nonce is re-broadcast
+            gas_limit = entry["gas"]
+        else:
+            gas_limit = step.gas_limit or estimate_gas_limit(sender.make_request, sender.sender, step)
+        sender.send(step.name, step.to, step.data, gas_limit, nonce=step.nonce)
+        journal.update(step.name, contract_address=step.contract_address)
+        pending.append(step)
+
+    deadline = time.monotonic() + timeout
+    while pending:
+        statuses = sender.step()
+        for step in pending:
+            _assert_not_lost(step, journal.get(step.name))
+        if all(statuses[step.name] == "mined" for step in pending):
+            break
+        waiting = ", ".join(step.name for step in pending if statuses[step.name] != "mined")
+        assert time.monotonic() < deadline, f"timed out waiting for {waiting}"
+        time.sleep(RECEIPT_POLL_INTERVAL_SECONDS)
+
+    return {step.name: sender.receipts[step.name] for step in pending}
+
+
+def get_step_receipts(rpc, steps: list[Step], journal: Journal) -> dict:
+    """
+    Fetches the receipts of all steps by their journaled transaction hashes in a single batch,
+    including the steps mined before a crash that `execute_plan` does not return.
+    `rpc.batch(calls)` performs a JSON-RPC batch, see utils/rpc.py::Rpc.
+    """
+    receipts = rpc.batch(
+        [("eth_getTransactionReceipt", [journal.get(step.name)["transaction_hash"]]) for step in steps]
+    )
+    return {step.name: receipt for step, receipt in zip(steps, receipts)}
+
+
+def ape_signer(account, ecosystem) -> Callable[[dict], bytes]:
+    def sign(transaction: dict) -> bytes:
+        signed = account.sign_transaction(ecosystem.create_transaction(**transaction))
+        assert signed, "transaction was not signed"
+        return signed.serialize_transaction()
+
+    return sign
+
+
+def get_created_gate_seal(receipt: dict) -> str:
+    created = decode_gate_seal_created_logs(receipt["logs"])
+    assert len(created) == 1, "expected a single GateSealCreated log"
+    return created.gate_seal(0)
@@ -0,0 +1,341 @@
+import re
+import zlib
+from html import escape
+from typing import Callable, NamedTuple
+
+# Gas profiling of a single transaction from its `debug_traceTransaction` struct logs.
+#
+# Every step's gas is attributed to the frame (contract) executing it and, through the compiler's
+# pc map, to the source line and the function the line belongs to. Vyper internal functions are
+# inlined jumps, so they show up as separate functions of the same contract.
+#
+# The gas of a step is the difference between its `gas` and the `gas` of the next step in the same
+# frame; for CALL/CREATE steps this includes the gas the callee consumed, which is subtracted
+# again so that every unit of gas is counted exactly once ("self" gas).
+
+CALL_OPCODES = {"CALL", "CALLCODE", "DELEGATECALL", "STATICCALL"}
+CREATE_OPCODES = {"CREATE", "CREATE2"}
+
+MODULE_FUNCTION = "<module>"
+UNMAPPED_FUNCTION = "<unmapped>"
+CONSTRUCTOR_FUNCTION = "__init__"
+INTRINSIC = "<intrinsic>"
+
+_FUNCTION_DEFINITION = re.compile(r"^def\s+(\w+)\s*\(")
+
+
+class CodeMap(NamedTuple):
+    name: str
+    # pc -> source line, runtime code only
+    lines: dict[int, int]
+    # source line -> function name
+    functions: dict[int, str]
+    source_lines: list[str]
+
+
+class Frame(NamedTuple):
+    # a placeholder for contracts whose creation has not returned yet
+    address: str
+    is_create: bool
+
+
+class StepCost(NamedTuple):
+    # names of the calling contracts and functions, outermost first
+    stack: tuple[str, ...]
+    contract: str
+    function: str
+    line: int | None
+    opcode: str
+    gas: int
+
+
+def get_function_lines(source: str) -> dict[int, str]:
+    """
+    Maps every source line to the name of the function defined around it,
+    lines outside of functions belong to `<module>`. Decorators belong to the function they decorate.
+    """
+    lines = source.splitlines()
+    functions = {}
+    current = MODULE_FUNCTION
+    for number, line in enumerate(lines, start=1):
+        if line.startswith("@"):
+            following = (_FUNCTION_DEFINITION.match(next_line) for next_line in lines[number:])
+            current = next((match.group(1) for match in following if match), MODULE_FUNCTION)
+        elif _FUNCTION_DEFINITION.match(line):
+            current = _FUNCTION_DEFINITION.match(line).group(1)
+        elif line and not line[0].isspace() and not line.startswith(("#", ")")):
+            # any other top-level statement ends the function body
+            current = MODULE_FUNCTION
+        functions[number] = current
+    return functions
+
+
+def build_code_map(name: str, pcmap: dict, source: str) -> CodeMap:
+    """
+    `pcmap` is the parsed compiler pc map, e.g. `contract_type.pcmap.parse()`.
+    """
+    lines = {pc: item.line_start for pc, item in pcmap.items() if item.line_start is not None}
+    return CodeMap(name, lines, get_function_lines(source), source.splitlines())
+
+
+def get_step_costs(struct_logs: list[dict]) -> list[int]:
+    """
+    Returns the self gas of every step, see the module comment.
+    """
+    costs = [0] * len(struct_logs)
+    # indexes of the steps waiting for the next step at their depth
+    open_steps = []
+    # index of a CALL/CREATE step -> indexes of the steps of its frame
+    child_gas = {}
+    # indexes of the CALL/CREATE steps of the active frames
+    callers = []
+
+    for index, step in enumerate(struct_logs):
+        depth = step["depth"]
+        while open_steps and struct_logs[open_steps[-1]]["depth"] >= depth:
+            previous = open_steps.pop()
+            if struct_logs[previous]["depth"] == depth:
+                costs[previous] = struct_logs[previous]["gas"] - step["gas"]
+            else:
+                # the last step of a finished frame
+                costs[previous] = struct_logs[previous]["gasCost"]
+
+        if index and depth > struct_logs[index - 1]["depth"]:
+            callers.append(index - 1)
+        while callers and struct_logs[callers[-1]]["depth"] >= depth:
+            callers.pop()
+        if callers:
+            child_gas.setdefault(callers[-1], []).append(index)
+
+        open_steps.append(index)
+
+    for previous in open_steps:
+        costs[previous] = struct_logs[previous]["gasCost"]
+
+    # the callee's direct steps already include the gas of everything they called in turn
+    for caller, children in child_gas.items():
+        costs[caller] -= sum(costs[child] for child in children)
+
+    return costs
+
+
+def _to_address(word: str) -> str:
+    return "0x" + word.removeprefix("0x")[-40:].rjust(40, "0")
+
+
+def profile_struct_logs(
+    struct_logs: list[dict],
+    to: str | None,
+    created_address: str | None,
+    resolve: Callable[[str], CodeMap | None],
+) -> list[StepCost]:
+    """
+    Attributes the gas of every step. `to` is the transaction recipient, `None` for contract
+    creation in which case `created_address` is the deployed contract. `resolve(address)` returns
+    the code map of the runtime code at the address or `None` if the contract is unknown.
+    """
+    costs = get_step_costs(struct_logs)
+    code_maps = {}
+
+    def contract_name(address):
+        if address not in code_maps:
+            code_maps[address] = resolve(address)
+        return code_maps[address].name if code_maps[address] else address
+
+    # contracts created within the transaction are only known once their constructor returns,
+    # until then they are labelled with a placeholder
+    created = {}
+    root = Frame(to.lower() if to else created_address.lower(), to is None)
+    frames = [root]
+    # "contract.function" labels of the callers of the active frames
+    labels = []
+    next_frame = None
+    results = []
+
+    for index, step in enumerate(struct_logs):
+        depth = step["depth"]
+        if depth > len(frames):
+            labels.append(f"{results[-1].contract}.{results[-1].function}")
+            frames.append(next_frame)
+        while depth < len(frames):
+            finished = frames.pop()
+            labels.pop()
+            if finished.is_create and step.get("stack"):
+                # CREATE pushes the address of the created contract once the constructor returns
+                created[finished.address] = contract_name(_to_address(step["stack"][-1]))
+
+        frame = frames[-1]
+        opcode = step["op"]
+        line = None
+        if frame.is_create:
+            # pc maps cover the runtime code only, constructors are attributed as a whole
+            contract = frame.address if frame.address.startswith("<") else contract_name(frame.address)
+            function = CONSTRUCTOR_FUNCTION
+        else:
+            contract = contract_name(frame.address)
+            code_map = code_maps[frame.address]
+            line = code_map.lines.get(step["pc"]) if code_map else None
+            function = code_map.functions.get(line, UNMAPPED_FUNCTION) if line else UNMAPPED_FUNCTION
+
+        if opcode in CALL_OPCODES:
+            next_frame = Frame(_to_address(step["stack"][-2]), False)
+        elif opcode in CREATE_OPCODES:
+            next_frame = Frame(f"<create {index}>", True)
+
+        results.append(StepCost(tuple(labels), contract, function, line, opcode, costs[index]))
+
+    if not created:
+        return results
+
+    def rename(label):
+        contract, _, function = label.partition(".")
+        return f"{created.get(contract, contract)}.{function}" if function else created.get(label, label)
+
+    return [
+        step._replace(
+            stack=tuple(rename(label) for label in step.stack),
+            contract=created.get(step.contract, step.contract),
+        )
+        for step in results
+    ]
+
+
+def summarize_by_line(steps: list[StepCost]) -> dict[tuple[str, int | None], int]:
+    totals = {}
+    for step in steps:
+        key = (step.contract, step.line)
+        totals[key] = totals.get(key, 0) + step.gas
+    return totals
+
+
+def summarize_by_function(steps: list[StepCost]) -> dict[tuple[str, str], int]:
+    totals = {}
+    for step in steps:
+        key = (step.contract, step.function)
+        totals[key] = totals.get(key, 0) + step.gas
+    return totals
+
+
+def fold_stacks(steps: list[StepCost], intrinsic_gas: int = 0) -> dict[str, int]:
+    """
+    Collapses the steps into the "folded stacks" format of flamegraph.pl, inferno and speedscope.
+    """
+    folded = {INTRINSIC: intrinsic_gas} if intrinsic_gas else {}
+    for step in steps:
+        key = ";".join(step.stack + (f"{step.contract}.{step.function}",))
+        folded[key] = folded.get(key, 0) + step.gas
+    return folded
+
+
+def format_folded_stacks(folded: dict[str, int]) -> str:
+    return "".join(f"{stack} {gas}\n" for stack, gas in sorted(folded.items()) if gas > 0)
+
+
+def format_line_table(totals: dict, code_maps: dict[str, CodeMap], limit: int | None = None) -> str:
+    rows = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+    output = [f"{'gas':>10}  {'contract:line':<24}  source"]
+    for (contract, line), gas in rows:
+        code_map = code_maps.get(contract)
+        source = code_map.source_lines[line - 1].strip() if code_map and line else ""
+        location = f"{contract}:{line or '-'}"
+        output.append(f"{gas:>10}  {location:<24}  {source}")
+    return "\n".join(output)
+
+
+def format_function_table(totals: dict) -> str:
+    total = sum(totals.values()) or 1
+    rows = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+    output = [f"{'gas':>10}  {'share':>6}  function"]
+    for (contract, function), gas in rows:
+        output.append(f"{gas:>10}  {100 * gas / total:>5.1f}%  {contract}.{function}")
+    return "\n".join(output)
+
+
+FLAMEGRAPH_WIDTH = 1200
+FLAMEGRAPH_FRAME_HEIGHT = 18
+
+
+def render_flamegraph_svg(folded: dict[str, int], title: str = "") -> str:
+    """
+    Renders the folded stacks as a static flamegraph, widths are proportional to gas.
+    """
+    tree = {"gas": 0, "children": {}}
+    for stack, gas in folded.items():
+        if gas <= 0:
+            continue
+        node = tree
+        node["gas"] += gas
+        for name in stack.split(";"):
+            node = node["children"].setdefault(name, {"gas": 0, "children": {}})
+            node["gas"] += gas
+
+    rectangles = []
+    max_depth = 0
+    scale = FLAMEGRAPH_WIDTH / (tree["gas"] or 1)
+
+    def visit(node, x, depth):
+        nonlocal max_depth
+        max_depth = max(max_depth, depth)
+        for name, child in sorted(node["children"].items()):
+            width = child["gas"] * scale
+            rectangles.append((name, child["gas"], x, depth, width))
+            visit(child, x, depth + 1)
+            x += width
+
+    visit(tree, 0.0, 0)
+
+    height = (max_depth + 2) * FLAMEGRAPH_FRAME_HEIGHT
+    output = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{FLAMEGRAPH_WIDTH}" height="{height}" '
+        'font-family="monospace" font-size="11">',
+        f'<text x="4" y="12">{escape(title)} ({tree["gas"]} gas)</text>',
+    ]
+    for name, gas, x, depth, width in rectangles:
+        # the root is at the bottom like in flamegraph.pl
+        y = height - (depth + 1) * FLAMEGRAPH_FRAME_HEIGHT
+        hue = 20 + zlib.crc32(name.encode()) % 40
+        label = escape(name) if width > 7 * len(name) else ""
+        output.append(
+            f'<g><title>{escape(name)}: {gas} gas</title>'
+            f'<rect x="{x:.2f}" y="{y}" width="{max(width - 0.5, 0.1):.2f}" '
+            f'height="{FLAMEGRAPH_FRAME_HEIGHT - 1}" fill="hsl({hue},90%,60%)"/>'
+            f'<text x="{x + 3:.2f}" y="{y + 12}">{label}</text></g>'
+        )
+    output.append("</svg>")
+    return "\n".join(output)
+
+
+def fetch_struct_logs(make_request: Callable, transaction_hash: str) -> list[dict]:
+    # memory and storage are not needed and make the trace an order of magnitude larger
+    trace = make_request(
+        "debug_traceTransaction",
+        [transaction_hash, {"disableMemory": True, "disableStorage": True}],
+    )
+    return trace["structLogs"]
+
+
+TRANSACTION_GAS = 21_000
+CREATE_TRANSACTION_GAS = 32_000
+ZERO_BYTE_GAS = 4
+NON_ZERO_BYTE_GAS = 16
+# EIP-3860, charged from Shanghai on
+INITCODE_WORD_GAS = 2
+
+
+def is_shanghai_block(block: dict) -> bool:
+    # EIP-4895 added the withdrawals root to the header in the same fork
+    return block.get("withdrawalsRoot") is not None
+
+
+def get_intrinsic_gas(data: bytes, is_create: bool, shanghai: bool = True) -> int:
+    """
+    The gas charged before the first step, i.e. the part of `gasUsed` the trace does not cover.
+    Pass `shanghai=False` for transactions in blocks before Shanghai, e.g. on the local london node.
+    """
+    zero_bytes = data.count(0)
+    gas = TRANSACTION_GAS + ZERO_BYTE_GAS * zero_bytes + NON_ZERO_BYTE_GAS * (len(data) - zero_bytes)
+    if is_create:
+        gas += CREATE_TRANSACTION_GAS
+        if shanghai:
+            gas += INITCODE_WORD_GAS * ((len(data) + 31) // 32)
+    return gas
@@ -0,0 +1,100 @@
+import contextlib
+import time
+
+import requests
+
+from utils.instrumentation import record_rpc_call
+
+# Public RPC endpoints typically cap the number of calls in a single batch
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_TIMEOUT_SECONDS = 30
+
+
+class RpcError(RuntimeError):
+    def __init__(self, method: str, error: dict):
+        super().__init__(f"{method} failed: {error}")
+        self.method = method
+        self.error = error
+
+    @property
+    def data(self) -> bytes | None:
+        """
+        Revert data of a failed call, nodes put it either right in `data` or one level deeper.
+        """
+        data = self.error.get("data")
+        if isinstance(data, dict):
+            data = data.get("data")
+        if not isinstance(data, str) or not data.startswith("0x"):
+            return None
+        return bytes.fromhex(data[2:])
+
+
+def batch_request(
+    uri: str,
+    calls: list[tuple[str, list]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    timeout: int = DEFAULT_TIMEOUT_SECONDS,
+    raise_errors: bool = True,
+    session: requests.Session | None = None,
+) -> list:
+    """
+    Sends `(method, params)` pairs as JSON-RPC batches and returns the results in call order.
+    With `raise_errors=False`, failed calls are returned as `RpcError` instead of raising.
+    Without a `session`, one is opened for the call.
+    """
+    results = []
+    with contextlib.ExitStack() as stack:
+        if session is None:
+            session = stack.enter_context(requests.Session())
+        for start in range(0, len(calls), batch_size):
+            payload = [
+                {"jsonrpc": "2.0", "id": start + i, "method": method, "params": params}
+                for i, (method, params) in enumerate(calls[start : start + batch_size])
+            ]
+            label = "batch(" + ",".join(sorted({item["method"] for item in payload})) + ")"
+            started_at = time.perf_counter()
+            response = session.post(uri, json=payload, timeout=timeout)
+            record_rpc_call(
+                label,
+                (time.perf_counter() - started_at) * 1000,
+                len(response.request.body or b""),
+                len(response.content),
+                not response.ok,
+            )
+            response.raise_for_status()
+
+            items = response.json()
+            # some nodes answer a batch they cannot handle with a single error object
+            if not isinstance(items, list):
+                error = items.get("error") if isinstance(items, dict) else None
+                raise RpcError(label, error or {"message": f"not a batch response: {items!r}"})
+            # batch responses may come back in any order
+            by_id = {item["id"]: item for item in items}
+            for item in payload:
+                result = by_id[item["id"]]
+                if "error" in result:
+                    error = RpcError(item["method"], result["error"])
+                    if raise_errors:
+                        raise error
+                    results.append(error)
+                    continue
+                results.append(result["result"])
+
+    return results
+
+
+class Rpc:
+    """
+    JSON-RPC client over `batch_request`, callable as `make_request(method, params)`.
+    Every call goes over the same keep-alive session.
+    """
+
+    def __init__(self, uri: str):
+        self.uri = uri
+        self.session = requests.Session()
+
+    def __call__(self, method: str, params: list):
+        return batch_request(self.uri, [(method, params)], session=self.session)[0]
+
+    def batch(self, calls: list[tuple[str, list]], raise_errors: bool = True) -> list:
+        return batch_request(self.uri, calls, raise_errors=raise_errors, session=self.session)
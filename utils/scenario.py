@@ -0,0 +1,211 @@
+import json
+import random
+from typing import NamedTuple
+
+from utils.constants import MAX_SEALABLES
+
+# Stress scenarios fire many `seal()` transactions into the same block window of a local node
+# with automining disabled and measure how quickly they are included.
+#
+# A scenario is a JSON file in `scenarios/`, every key but "name" is optional:
+# {
+#     "name": "...",
+#     "factories": 2,                    # GateSealFactories sharing one blueprint
+#     "gate_seals_per_factory": 1,
+#     "sealables_per_gate_seal": 8,
+#     "sealable_pool": 16,               # distinct SealableMocks the GateSeals draw from
+#     "failing_sealables": 0,            # mocks of the pool that fail to pause
+#     "committees": 2,                   # distinct sealing committee accounts
+#     "background_transfers": 0,         # other traffic competing for the same blocks
+#     "background_deployments": 0,
+#     "block_gas_limit": 30000000,
+#     "max_blocks": 10,                  # blocks to mine before giving up on inclusion
+#     "seal_priority_fee_gwei": 2,
+#     "background_priority_fee_gwei": 1,
+#     "seed": 0
+# }
+
+SCENARIOS_DIRECTORY = "scenarios"
+
+SCENARIO_DEFAULTS = {
+    "factories": 1,
+    "gate_seals_per_factory": 1,
+    "sealables_per_gate_seal": MAX_SEALABLES,
+    "sealable_pool": None,
+    "failing_sealables": 0,
+    "committees": 1,
+    "background_transfers": 0,
+    "background_deployments": 0,
+    "block_gas_limit": 30_000_000,
+    "max_blocks": 10,
+    "seal_priority_fee_gwei": 2,
+    "background_priority_fee_gwei": 1,
+    "seed": 0,
+}
+
+SEAL_BASE_GAS_LIMIT = 100_000
+SEAL_GAS_LIMIT_PER_SEALABLE = 50_000
+
+SEAL = "seal"
+BACKGROUND_TRANSFER = "transfer"
+BACKGROUND_DEPLOYMENT = "deployment"
+
+
+class Scenario(NamedTuple):
+    name: str
+    factories: int
+    gate_seals_per_factory: int
+    sealables_per_gate_seal: int
+    sealable_pool: int
+    failing_sealables: int
+    committees: int
+    background_transfers: int
+    background_deployments: int
+    block_gas_limit: int
+    max_blocks: int
+    seal_priority_fee_gwei: int
+    background_priority_fee_gwei: int
+    seed: int
+
+    @property
+    def gate_seals(self) -> int:
+        return self.factories * self.gate_seals_per_factory
+
+
+class SentTransaction(NamedTuple):
+    kind: str
+    transaction_hash: str
+    # the latest block when the transaction was sent, i.e. latency 1 is the next block
+    sent_at_block: int
+    expected_to_fail: bool = False
+
+
+def parse_scenario(data: dict) -> Scenario:
+    unknown = set(data) - set(SCENARIO_DEFAULTS) - {"name"}
+    assert not unknown, f"unknown scenario keys: {', '.join(sorted(unknown))}"
+    assert "name" in data, "scenario: name missing"
+
+    values = {**SCENARIO_DEFAULTS, **data}
+    if values["sealable_pool"] is None:
+        # every GateSeal gets its own sealables by default
+        values["sealable_pool"] = (
+            values["factories"] * values["gate_seals_per_factory"] * values["sealables_per_gate_seal"]
+        )
+
+    scenario = Scenario(**values)
+    assert scenario.factories > 0, "factories: must be positive"
+    assert scenario.gate_seals_per_factory > 0, "gate_seals_per_factory: must be positive"
+    assert 0 < scenario.sealables_per_gate_seal <= MAX_SEALABLES, "sealables_per_gate_seal: out of range"
+    assert (
+        scenario.sealable_pool >= scenario.sealables_per_gate_seal
+    ), "sealable_pool: fewer than sealables_per_gate_seal"
+    assert 0 <= scenario.failing_sealables <= scenario.sealable_pool, "failing_sealables: out of range"
+    assert scenario.committees > 0, "committees: must be positive"
+    assert scenario.max_blocks > 0, "max_blocks: must be positive"
+    return scenario
+
+
+def load_scenario(filename: str) -> Scenario:
+    with open(filename, "r") as scenario_file:
+        return parse_scenario(json.load(scenario_file))
+
+
+def plan_failing_sealables(scenario: Scenario) -> set[int]:
+    """
+    Picks the indexes of the sealable pool that fail to pause, deterministically for the seed.
+    """
+    rng = random.Random(scenario.seed)
+    return set(rng.sample(range(scenario.sealable_pool), scenario.failing_sealables))
+
+
+def plan_gate_seal_sealables(scenario: Scenario) -> list[list[int]]:
+    """
+    Assigns consecutive pool indexes to every GateSeal, wrapping around the pool,
+    so that GateSeals share sealables when the pool is smaller than needed.
+    """
+    per_gate_seal = scenario.sealables_per_gate_seal
+    return [
+        [(index * per_gate_seal + offset) % scenario.sealable_pool for offset in range(per_gate_seal)]
+        for index in range(scenario.gate_seals)
+    ]
+
+
+def seal_gas_limit(sealables: int) -> int:
+    return SEAL_BASE_GAS_LIMIT + SEAL_GAS_LIMIT_PER_SEALABLE * sealables
+
+
+def _distribution(values: list[int]) -> dict:
+    if not values:
+        return {}
+    values = sorted(values)
+    return {
+        "min": values[0],
+        "p50": values[(len(values) - 1) // 2],
+        "p95": values[max(0, -(-len(values) * 95 // 100) - 1)],
+        "max": values[-1],
+    }
+
+
+def summarize_scenario(
+    scenario: Scenario, sent: list[SentTransaction], receipts: dict[str, dict | None], blocks: list[dict]
+) -> dict:
+    """
+    `receipts` are raw JSON-RPC receipts by transaction hash, `None` if never included;
+    `blocks` are the raw JSON-RPC blocks mined during the scenario.
+    """
+    kinds = {}
+    for transaction in sent:
+        stats = kinds.setdefault(
+            transaction.kind,
+            {"sent": 0, "included": 0, "failed": 0, "unexpected_outcomes": 0, "latencies": []},
+        )
+        stats["sent"] += 1
+        receipt = receipts.get(transaction.transaction_hash)
+        if receipt is None:
+            continue
+        stats["included"] += 1
+        stats["latencies"].append(int(receipt["blockNumber"], 16) - transaction.sent_at_block)
+        failed = int(receipt["status"], 16) == 0
+        stats["failed"] += failed
+        stats["unexpected_outcomes"] += failed != transaction.expected_to_fail
+
+    for stats in kinds.values():
+        stats["not_included"] = stats["sent"] - stats["included"]
+        stats["failure_rate"] = round(stats["failed"] / stats["included"], 4) if stats["included"] else None
+        stats["latency_blocks"] = _distribution(stats.pop("latencies"))
+
+    return {
+        "scenario": scenario._asdict(),
+        "transactions": kinds,
+        "blocks": [
+            {
+                "number": int(block["number"], 16),
+                "transactions": len(block["transactions"]),
+                "gas_used": int(block["gasUsed"], 16),
+                "gas_limit": int(block["gasLimit"], 16),
+                "utilization": round(int(block["gasUsed"], 16) / int(block["gasLimit"], 16), 4),
+            }
+            for block in blocks
+        ],
+    }
+
+
+def format_summary(summary: dict) -> str:
+    output = [
+        f"{'kind':<12} {'sent':>6} {'included':>9} {'failed':>7} {'unexpected':>11} "
+        f"{'latency p50/p95/max':>20}"
+    ]
+    for kind, stats in summary["transactions"].items():
+        latency = stats["latency_blocks"]
+        latency = f"{latency['p50']}/{latency['p95']}/{latency['max']}" if latency else "-"
+        output.append(
+            f"{kind:<12} {stats['sent']:>6} {stats['included']:>9} {stats['failed']:>7} "
+            f"{stats['unexpected_outcomes']:>11} {latency:>20}"
+        )
+    output.append(f"{'block':<12} {'txs':>6} {'gas used':>12} {'utilization':>12}")
+    for block in summary["blocks"]:
+        output.append(
+            f"{block['number']:<12} {block['transactions']:>6} {block['gas_used']:>12} "
+            f"{100 * block['utilization']:>11.1f}%"
+        )
+    return "\n".join(output)
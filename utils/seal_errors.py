@@ -0,0 +1,102 @@
+from typing import NamedTuple
+
+from utils.constants import MAX_SEALABLES
+
+# When some of the sealables fail to seal, `seal()` reverts with an `Error(string)` whose message
+# is the decimal string of a single uint256, see GateSeal.vy::_encode_failure():
+# bits 0..7 - bitmask of the failed indexes
+# bits 8 + 2 * i and 9 + 2 * i - reason why the sealable at index i failed
+#
+# GateSeals deployed before this encoding report the failed indexes as a reversed decimal string
+# instead, e.g. "6320" for the indexes [0, 2, 3, 6], see `decode_legacy_failed_indexes`.
+
+FAILURE_PAUSE_REVERTED = 1
+FAILURE_NOT_PAUSED = 2
+
+FAILURE_REASONS = {
+    FAILURE_PAUSE_REVERTED: "pauseFor reverted",
+    FAILURE_NOT_PAUSED: "not paused after pauseFor",
+}
+
+FAILURE_REASON_BIT_LENGTH = 2
+FAILURE_REASON_MASK = 0b11
+FAILURE_INDEXES_MASK = 2**MAX_SEALABLES - 1
+
+# Error(string)
+ERROR_SELECTOR = bytes.fromhex("08c379a0")
+
+
+class SealFailure(NamedTuple):
+    index: int
+    reason: int
+    # `None` unless the sealables passed to `seal()` are given to the decoder
+    sealable: str | None = None
+
+    @property
+    def description(self) -> str:
+        return FAILURE_REASONS.get(self.reason, f"unknown reason {self.reason}")
+
+
+def encode_seal_failures(failures: dict[int, int]) -> int:
+    """
+    Encodes `{sealable index: reason}` the same way as `seal()` does.
+    """
+    value = 0
+    for index, reason in failures.items():
+        assert 0 <= index < MAX_SEALABLES, f"sealable index {index} out of range"
+        assert reason in FAILURE_REASONS, f"unknown failure reason {reason}"
+        value += 2**index + reason * 2 ** (MAX_SEALABLES + FAILURE_REASON_BIT_LENGTH * index)
+    return value
+
+
+def decode_error_message(revert_data: bytes) -> str:
+    """
+    Returns the message of an `Error(string)` revert.
+    """
+    assert revert_data[:4] == ERROR_SELECTOR, "not an Error(string) revert"
+    length = int.from_bytes(revert_data[36:68], "big")
+    return revert_data[68 : 68 + length].decode()
+
+
+def _to_value(error: int | str | bytes) -> int:
+    if isinstance(error, int):
+        return error
+    if isinstance(error, str) and error.startswith("0x"):
+        error = bytes.fromhex(error[2:])
+    if isinstance(error, (bytes, bytearray)):
+        error = decode_error_message(bytes(error))
+    assert error.isdigit(), f"not a seal failure: {error!r}"
+    return int(error)
+
+
+def decode_seal_failures(
+    error: int | str | bytes, sealables: list[str] | None = None
+) -> list[SealFailure]:
+    """
+    Decodes the `seal()` failure from either the revert message, e.g. "33033",
+    the encoded integer or the raw `Error(string)` revert data.
+    """
+    value = _to_value(error)
+    assert value >> (MAX_SEALABLES * (1 + FAILURE_REASON_BIT_LENGTH)) == 0, "not a seal failure"
+
+    failures = []
+    for index in range(MAX_SEALABLES):
+        reason = (
+            value >> (MAX_SEALABLES + FAILURE_REASON_BIT_LENGTH * index)
+        ) & FAILURE_REASON_MASK
+        failed = bool(value & (1 << index))
+        assert failed == bool(reason), f"inconsistent failure at index {index}"
+        if failed:
+            sealable = sealables[index] if sealables is not None else None
+            failures.append(SealFailure(index, reason, sealable))
+
+    return failures
+
+
+def decode_legacy_failed_indexes(message: str) -> list[int]:
+    """
+    Decodes the error message of GateSeals that report the failed indexes as a reversed
+    decimal string, e.g. "6320" -> [0, 2, 3, 6].
+    """
+    assert message.isdigit(), f"not a legacy seal failure: {message!r}"
+    return sorted(int(digit) for digit in message)
@@ -0,0 +1,267 @@
+import math
+import os
+import time
+from decimal import Decimal
+from typing import Callable, NamedTuple
+
+from utils.abi import keccak
+from utils.pipeline import Journal, is_already_known, is_nonce_too_low
+
+# The sender broadcasts an EIP-1559 transaction and, for as long as it is not included,
+# re-broadcasts it at the same nonce with both fees bumped every `blocks_per_bump` blocks,
+# never going over the fee cap. Nodes only accept a replacement if both fees grow by at least
+# 10% (geth's default price bump); the bump must also be at least 12.5%, the largest base fee
+# increase per block, so that a stuck transaction catches up with a rising base fee.
+#
+# Every signed attempt is written to a journal before it is broadcast (see utils/pipeline.py),
+# so a restarted sender picks up the pending transaction at its nonce and keeps bumping it
+# instead of sending it again. A transaction that failed or whose nonce was taken is sent
+# again at a fresh nonce, unless the caller fixed its nonce, as the deployment pipeline of
+# utils/pipeline.py does for its precomputed addresses.
+
+SENDER_JOURNAL_DIRECTORY = ".cache/senders"
+
+GWEI = 10**9
+REPLACEMENT_MIN_BUMP_PERCENT = 10
+MIN_BUMP_PERCENT = Decimal("12.5")
+
+DEFAULT_MAX_PRIORITY_FEE_GWEI = "2"
+DEFAULT_MAX_FEE_CAP_GWEI = "500"
+DEFAULT_BUMP_PERCENT = "25"
+DEFAULT_BLOCKS_PER_BUMP = 1
+
+POLL_INTERVAL_SECONDS = 1
+TIMEOUT_SECONDS = 600
+
+PENDING = "pending"
+MINED = "mined"
+FAILED = "failed"
+# the nonce was used by a transaction the sender does not know about
+REPLACED = "replaced"
+
+
+class FeePolicy(NamedTuple):
+    max_priority_fee: int
+    max_fee_cap: int
+    bump_percent: Decimal = Decimal(DEFAULT_BUMP_PERCENT)
+
+
+def fee_policy_from_env(environ: dict | None = None) -> FeePolicy:
+    """
+    Reads MAX_PRIORITY_FEE_GWEI, MAX_FEE_CAP_GWEI and FEE_BUMP_PERCENT, all optional.
+    """
+    environ = os.environ if environ is None else environ
+    policy = FeePolicy(
+        int(Decimal(environ.get("MAX_PRIORITY_FEE_GWEI") or DEFAULT_MAX_PRIORITY_FEE_GWEI) * GWEI),
+        int(Decimal(environ.get("MAX_FEE_CAP_GWEI") or DEFAULT_MAX_FEE_CAP_GWEI) * GWEI),
+        Decimal(environ.get("FEE_BUMP_PERCENT") or DEFAULT_BUMP_PERCENT),
+    )
+    assert policy.bump_percent >= MIN_BUMP_PERCENT, f"fee bump must be at least {MIN_BUMP_PERCENT}%"
+    assert 0 < policy.max_priority_fee <= policy.max_fee_cap, "max priority fee must be within the fee cap"
+    return policy
+
+
+def _bump(value: int, percent: Decimal | int) -> int:
+    # rounded up, so that a bumped fee always clears the node's replacement threshold
+    return math.ceil(value * (100 + Decimal(percent)) / 100)
+
+
+def initial_fees(policy: FeePolicy, base_fee: int) -> tuple[int, int]:
+    """
+    Returns `(max_fee, max_priority_fee)` allowing the base fee to double, within the cap.
+    """
+    max_fee = min(2 * base_fee + policy.max_priority_fee, policy.max_fee_cap)
+    return max_fee, min(policy.max_priority_fee, max_fee)
+
+
+def bump_fees(
+    policy: FeePolicy, max_fee: int, max_priority_fee: int, base_fee: int
+) -> tuple[int, int] | None:
+    """
+    Returns the fees of the replacement transaction, `None` if the cap does not allow a
+    replacement the node would accept.
+    """
+    bumped_priority_fee = max(_bump(max_priority_fee, policy.bump_percent), max_priority_fee + 1)
+    bumped_max_fee = max(_bump(max_fee, policy.bump_percent), 2 * base_fee + bumped_priority_fee)
+
+    bumped_max_fee = min(bumped_max_fee, policy.max_fee_cap)
+    bumped_priority_fee = min(bumped_priority_fee, bumped_max_fee)
+    if bumped_max_fee < _bump(max_fee, REPLACEMENT_MIN_BUMP_PERCENT) or bumped_priority_fee < _bump(
+        max_priority_fee, REPLACEMENT_MIN_BUMP_PERCENT
+    ):
+        return None
+    return bumped_max_fee, bumped_priority_fee
+
+
+def get_sender_journal_filename(chain_id: int, sender: str) -> str:
+    return os.path.join(SENDER_JOURNAL_DIRECTORY, f"{chain_id}-{sender.lower()}.json")
+
+
+class FeeBumpingSender:
+    """
+    Sends named transactions and bumps their fees until they are included.
+    `make_request(method, params)` performs a JSON-RPC call, `sign(transaction)` returns
+    the raw signed transaction, see utils/pipeline.py::ape_signer.
+    """
+
+    def __init__(
+        self,
+        make_request: Callable,
+        sign: Callable[[dict], bytes],
+        sender: str,
+        chain_id: int,
+        policy: FeePolicy,
+        journal: Journal,
+        blocks_per_bump: int = DEFAULT_BLOCKS_PER_BUMP,
+    ):
+        self.make_request = make_request
+        self.sign = sign
+        self.sender = sender
+        self.chain_id = chain_id
+        self.policy = policy
+        self.journal = journal
+        self.blocks_per_bump = blocks_per_bump
+        # the receipts `step()` found, by name
+        self.receipts = {}
+
+    def send(
+        self, name: str, to: str | None, data: bytes, gas_limit: int, value: int = 0, nonce: int | None = None
+    ) -> dict:
+        """
+        Broadcasts the transaction unless the journal already has it pending or mined, in which
+        case a pending one is re-broadcast as is. The nonce defaults to the next free one.
+        Returns the journal entry.
+        """
+        entry = self.journal.get(name)
+        # journals of earlier versions may hold an entry whose signing failed, nothing was sent
+        if entry is not None and entry["attempts"]:
+            if entry["status"] == PENDING:
+                # the node may have dropped the transaction while the sender was not running
+                self._broadcast(entry["attempts"][-1]["raw_transaction"])
+            if entry["status"] in (PENDING, MINED):
+                return entry
+
+        entry = {
+            "status": PENDING,
+            "nonce": self._next_nonce() if nonce is None else nonce,
+            "to": to,
+            "data": "0x" + data.hex(),
+            "gas": gas_limit,
+            "value": value,
+        }
+        # journaled together with its first signed attempt, so that a signer that fails or
+        # is cancelled leaves nothing behind
+        block = self.make_request("eth_getBlockByNumber", ["latest", False])
+        attempt = self._sign(
+            entry,
+            *initial_fees(self.policy, int(block["baseFeePerGas"], 16)),
+            block_number=int(block["number"], 16),
+        )
+        # a failed or replaced entry is replaced as a whole, its receipt fields included
+        self.journal.steps.pop(name, None)
+        self.journal.update(name, **entry, attempts=[attempt])
+        self._broadcast(attempt["raw_transaction"])
+        return self.journal.get(name)
+
+    def step(self) -> dict[str, str]:
+        """
+        Checks every pending transaction once and bumps the ones that waited long enough.
+        Returns the status of every transaction by name.
+        """
+        block = self.make_request("eth_getBlockByNumber", ["latest", False])
+        block_number = int(block["number"], 16)
+        base_fee = int(block["baseFeePerGas"], 16)
+        # fetched before the receipts, so that a transaction mined in between is not taken
+        # for a replacement
+        mined_nonce = int(self.make_request("eth_getTransactionCount", [self.sender, "latest"]), 16)
+
+        for name, entry in list(self.journal.steps.items()):
+            if entry["status"] != PENDING or not entry["attempts"]:
+                continue
+
+            receipt = self._find_receipt(entry)
+            if receipt is not None:
+                self.receipts[name] = receipt
+                self.journal.update(
+                    name,
+                    status=MINED if int(receipt["status"], 16) == 1 else FAILED,
+                    transaction_hash=receipt["transactionHash"],
+                    block_number=int(receipt["blockNumber"], 16),
+                )
+                continue
+
+            if mined_nonce > entry["nonce"]:
+                self.journal.update(name, status=REPLACED)
+                continue
+
+            last = entry["attempts"][-1]
+            if block_number - last["sent_at_block"] < self.blocks_per_bump:
+                continue
+            fees = bump_fees(self.policy, last["max_fee"], last["max_priority_fee"], base_fee)
+            if fees is None:
+                # capped: keep the last attempt in the mempool and wait for the base fee to drop
+                self._broadcast(last["raw_transaction"])
+                continue
+            self._attempt(name, *fees, block_number=block_number)
+
+        return {name: entry["status"] for name, entry in self.journal.steps.items()}
+
+    def wait(
+        self, name: str, timeout: int = TIMEOUT_SECONDS, interval: float = POLL_INTERVAL_SECONDS
+    ) -> dict:
+        deadline = time.monotonic() + timeout
+        while self.step()[name] == PENDING:
+            assert time.monotonic() < deadline, f"{name} not included within {timeout}s"
+            time.sleep(interval)
+        return self.journal.get(name)
+
+    def _attempt(self, name: str, max_fee: int, max_priority_fee: int, block_number: int):
+        entry = self.journal.get(name)
+        attempt = self._sign(entry, max_fee, max_priority_fee, block_number)
+        self.journal.update(name, attempts=entry["attempts"] + [attempt])
+        self._broadcast(attempt["raw_transaction"])
+
+    def _sign(self, entry: dict, max_fee: int, max_priority_fee: int, block_number: int) -> dict:
+        transaction = {
+            "type": 2,
+            "chainId": self.chain_id,
+            "nonce": entry["nonce"],
+            "gas": entry["gas"],
+            "maxFeePerGas": max_fee,
+            "maxPriorityFeePerGas": max_priority_fee,
+            "value": entry["value"],
+            "data": entry["data"],
+        }
+        if entry["to"]:
+            transaction["to"] = entry["to"]
+        raw_transaction = "0x" + self.sign(transaction).hex()
+        return {
+            "raw_transaction": raw_transaction,
+            "transaction_hash": "0x" + keccak(bytes.fromhex(raw_transaction[2:])).hex(),
+            "max_fee": max_fee,
+            "max_priority_fee": max_priority_fee,
+            "sent_at_block": block_number,
+        }
+
+    def _broadcast(self, raw_transaction: str):
+        try:
+            self.make_request("eth_sendRawTransaction", [raw_transaction])
+        except Exception as error:
+            # either the very same transaction or one of the other attempts is already in,
+            # a nonce used by a foreign transaction is reported as REPLACED by `step()`
+            if not is_already_known(error) and not is_nonce_too_low(error):
+                raise
+
+    def _find_receipt(self, entry: dict) -> dict | None:
+        # any of the attempts may be the one that got included
+        for attempt in reversed(entry["attempts"]):
+            receipt = self.make_request("eth_getTransactionReceipt", [attempt["transaction_hash"]])
+            if receipt is not None:
+                return receipt
+        return None
+
+    def _next_nonce(self) -> int:
+        nonce = int(self.make_request("eth_getTransactionCount", [self.sender, "pending"]), 16)
+        # a pending transaction dropped by the node still holds its nonce
+        pending = [entry["nonce"] + 1 for entry in self.journal.steps.values() if entry["status"] == PENDING]
+        return max([nonce] + pending)
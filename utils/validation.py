@@ -0,0 +1,174 @@
+from typing import Iterator
+
+from utils.address import is_address
+from utils.constants import (
+    MAX_EXPIRY_PERIOD_SECONDS,
+    MAX_SEAL_DURATION_SECONDS,
+    MAX_SEALABLES,
+    MIN_SEAL_DURATION_SECONDS,
+    ZERO_ADDRESS,
+)
+
+# The checks mirror the asserts of GateSeal.vy in the same order and with the same messages,
+# so the first error is exactly what the transaction would revert with. The remaining errors
+# are reported as well so that every problem of a config can be fixed at once.
+#
+# Arguments are ABI-decoded before the contract code runs: invalid addresses, values that do not
+# fit in uint256 and more than MAX_SEALABLES sealables cannot even be encoded (or revert without
+# a message), so these are checked first and stop the validation.
+
+SEALABLES_EXCEEDS_MAX = "sealables: exceeds max"
+
+MANIFEST_KEYS = ("sealing_committee", "seal_duration_seconds", "sealables", "expiry_timestamp")
+
+
+def _abi_errors(addresses: list, uints: list, sealables: list) -> list[str]:
+    errors = [f"invalid address: {address}" for address in addresses if not is_address(address)]
+    errors += [
+        f"invalid uint256: {value}"
+        for value in uints
+        if not isinstance(value, int) or isinstance(value, bool) or not 0 <= value < 2**256
+    ]
+    if len(sealables) > MAX_SEALABLES:
+        errors.append(SEALABLES_EXCEEDS_MAX)
+    return errors
+
+
+def _has_duplicates(sealables: list[str]) -> bool:
+    return len({sealable.lower() for sealable in sealables}) != len(sealables)
+
+
+def _constructor_errors(
+    sealing_committee, seal_duration_seconds, sealables, expiry_timestamp, now
+) -> Iterator[str]:
+    abi_errors = _abi_errors(
+        [sealing_committee, *sealables], [seal_duration_seconds, expiry_timestamp], sealables
+    )
+    if abi_errors:
+        yield from abi_errors
+        return
+
+    # GateSeal.__init__
+    if sealing_committee.lower() == ZERO_ADDRESS:
+        yield "sealing committee: zero address"
+    if seal_duration_seconds < MIN_SEAL_DURATION_SECONDS:
+        yield "seal duration: too short"
+    if seal_duration_seconds > MAX_SEAL_DURATION_SECONDS:
+        yield "seal duration: exceeds max"
+    if len(sealables) == 0:
+        yield "sealables: empty list"
+    if expiry_timestamp <= now:
+        yield "expiry timestamp: must be in the future"
+    if expiry_timestamp > now + MAX_EXPIRY_PERIOD_SECONDS:
+        yield "expiry timestamp: exceeds max expiry period"
+    if any(sealable.lower() == ZERO_ADDRESS for sealable in sealables):
+        yield "sealables: includes zero address"
+    if _has_duplicates(sealables):
+        yield "sealables: includes duplicates"
+
+
+def validate_gate_seal_config(
+    sealing_committee: str,
+    seal_duration_seconds: int,
+    sealables: list[str],
+    expiry_timestamp: int,
+    now: int,
+) -> list[str]:
+    """
+    Checks the GateSeal constructor parameters offline and returns the list of errors,
+    `now` being the timestamp of the block the GateSeal is expected to be deployed in.
+    """
+    return list(
+        _constructor_errors(sealing_committee, seal_duration_seconds, sealables, expiry_timestamp, now)
+    )
+
+
+def check_constructor(
+    sealing_committee: str,
+    seal_duration_seconds: int,
+    sealables: list[str],
+    expiry_timestamp: int,
+    now: int,
+) -> str | None:
+    """
+    Returns the message the GateSeal deployment would revert with, `None` if it would succeed.
+    """
+    return next(
+        _constructor_errors(sealing_committee, seal_duration_seconds, sealables, expiry_timestamp, now),
+        None,
+    )
+
+
+def _seal_errors(sender, sealing_committee, sealables, expiry_timestamp, subset, now) -> Iterator[str]:
+    abi_errors = _abi_errors([sender, *subset], [], subset)
+    if abi_errors:
+        yield from abi_errors
+        return
+
+    # GateSeal.seal
+    if sender.lower() != sealing_committee.lower():
+        yield "sender: not SEALING_COMMITTEE"
+    if now >= expiry_timestamp:
+        yield "gate seal: expired"
+    if len(subset) == 0:
+        yield "sealables: empty subset"
+    if _has_duplicates(subset):
+        yield "sealables: includes duplicates"
+    configured = {sealable.lower() for sealable in sealables}
+    if any(sealable.lower() not in configured for sealable in subset):
+        yield "sealables: includes a non-sealable"
+
+
+def validate_seal(
+    sender: str,
+    sealing_committee: str,
+    sealables: list[str],
+    expiry_timestamp: int,
+    subset: list[str],
+    now: int,
+) -> list[str]:
+    """
+    Checks a `seal(subset)` call from `sender` against a GateSeal deployed with the given
+    parameters. Failures of the sealables themselves can only be detected on-chain.
+    """
+    return list(_seal_errors(sender, sealing_committee, sealables, expiry_timestamp, subset, now))
+
+
+def check_seal(
+    sender: str,
+    sealing_committee: str,
+    sealables: list[str],
+    expiry_timestamp: int,
+    subset: list[str],
+    now: int,
+) -> str | None:
+    """
+    Returns the message `seal(subset)` would revert with before calling the sealables.
+    """
+    return next(_seal_errors(sender, sealing_committee, sealables, expiry_timestamp, subset, now), None)
+
+
+def validate_manifest(seals: list[dict], now: int) -> dict[int, list[str]]:
+    """
+    Validates every GateSeal config of a deployment manifest,
+    returns the errors of the invalid configs by their index.
+    """
+    errors = {}
+    for index, seal in enumerate(seals):
+        missing = [key for key in MANIFEST_KEYS if key not in seal]
+        if missing:
+            errors[index] = [f"config: missing {key}" for key in missing]
+            continue
+        if not isinstance(seal["sealables"], list):
+            errors[index] = ["sealables: not a list"]
+            continue
+        config_errors = validate_gate_seal_config(
+            seal["sealing_committee"],
+            seal["seal_duration_seconds"],
+            seal["sealables"],
+            seal["expiry_timestamp"],
+            now,
+        )
+        if config_errors:
+            errors[index] = config_errors
+    return errors
@@ -0,0 +1,266 @@
+import time
+from typing import NamedTuple
+
+from utils.abi import (
+    IS_PAUSED_SIGNATURE,
+    SEAL_SIGNATURE,
+    decode_address,
+    decode_address_array,
+    decode_seal,
+    function_selector,
+)
+from utils.logs import SealedEvent, decode_sealed_logs, get_sealed_topic
+from utils.rpc import RpcError
+from utils.seal_errors import (
+    ERROR_SELECTOR,
+    FAILURE_REASONS,
+    decode_error_message,
+    decode_legacy_failed_indexes,
+    decode_seal_failures,
+)
+
+# The watcher follows new blocks through a block filter (`eth_newBlockFilter`), the closest
+# to a new heads subscription that every HTTP endpoint supports. The committee is usually a
+# multisig, so `seal()` is an internal call of e.g. a Safe `execTransaction`: the seal is spotted
+# by the Sealed logs the GateSeal emits rather than by the transaction. A direct `seal()` call
+# of the committee is spotted by its calldata too, so that a reverted one is found without TX_HASH.
+# Calls from anyone else revert on the committee check and are not the seal being watched.
+#
+# As soon as a block includes the seal, its receipt and `isPaused()` of every target sealable at
+# that very block go out in a single JSON-RPC batch, so the per-sealable status is known within
+# the block of inclusion. A reverted transaction is replayed with `eth_call` on the parent block
+# to recover the revert data, which is decoded with utils/seal_errors.py. The GateSeals in
+# `deployed/` are the legacy build reporting the failed indexes only, none of their messages is
+# a valid bitmask failure, so the bitmask is tried first and the legacy format otherwise.
+
+POLL_INTERVAL_SECONDS = 0.2
+LEGACY_FAILURE = "failed, the GateSeal does not report why"
+WATCH_TIMEOUT_SECONDS = 600
+
+
+class SealableStatus(NamedTuple):
+    sealable: str
+    # a Sealed log was emitted for the sealable
+    sealed: bool
+    # `isPaused()` at the block of inclusion
+    paused: bool
+    # why `seal()` failed to pause the sealable, if it did
+    failure: str | None = None
+
+
+class SealReport(NamedTuple):
+    transaction_hash: str
+    block_number: int
+    succeeded: bool
+    sealables: list[SealableStatus]
+    # revert message of a `seal()` that failed before reaching the sealables
+    error: str | None = None
+
+    @property
+    def all_paused(self) -> bool:
+        return all(status.paused for status in self.sealables)
+
+
+def get_sealed_events(receipt: dict, gate_seal: str) -> list[SealedEvent]:
+    logs = [log for log in receipt["logs"] if log["address"].lower() == gate_seal.lower()]
+    return decode_sealed_logs(logs).events()
+
+
+def is_seal_call(transaction: dict, gate_seal: str) -> bool:
+    selector = "0x" + function_selector(SEAL_SIGNATURE).hex()
+    to = transaction.get("to") or ""
+    return to.lower() == gate_seal.lower() and transaction["input"].startswith(selector)
+
+
+def find_seal_transaction(
+    transactions: list[dict],
+    gate_seal: str,
+    sealing_committee: str,
+    transaction_hash: str | None = None,
+    sealed_logs: list[dict] = (),
+) -> dict | None:
+    """
+    Finds the seal among the full transactions of a block: the transaction with the given hash
+    if it is known, otherwise the one that emitted the Sealed logs of the GateSeal or a direct
+    `seal()` call to it from the sealing committee.
+    """
+    if transaction_hash is None and sealed_logs:
+        transaction_hash = sealed_logs[0]["transactionHash"]
+    for transaction in transactions:
+        if transaction_hash is not None:
+            if transaction["hash"].lower() == transaction_hash.lower():
+                return transaction
+        elif is_seal_call(transaction, gate_seal) and transaction["from"].lower() == sealing_committee.lower():
+            return transaction
+    return None
+
+
+def describe_revert(revert_data: bytes | None, sealables: list[str]) -> tuple[str | None, dict]:
+    """
+    Returns the revert message and the failures of the sealables by address.
+    A seal failure carries the failures only, any other revert the message only.
+    """
+    if not revert_data or revert_data[:4] != ERROR_SELECTOR:
+        return "reverted without a message", {}
+    message = decode_error_message(revert_data)
+    if not message.isdigit():
+        return message, {}
+    return None, decode_failures(message, sealables)
+
+
+def decode_failures(message: str, sealables: list[str]) -> dict:
+    """
+    Returns the failures of the sealables by address from the message of a seal failure,
+    either the bitmask or the legacy reversed indexes, e.g. "0" for the first sealable.
+    """
+    try:
+        failures = decode_seal_failures(message, sealables)
+    except AssertionError:
+        failures = []
+    if failures and all(failure.reason in FAILURE_REASONS for failure in failures):
+        return {failure.sealable.lower(): failure.description for failure in failures}
+    return {sealables[index].lower(): LEGACY_FAILURE for index in decode_legacy_failed_indexes(message)}
+
+
+def build_seal_report(
+    transaction: dict,
+    receipt: dict,
+    gate_seal: str,
+    sealables: list[str],
+    paused: list[bool],
+    revert_data: bytes | None = None,
+) -> SealReport:
+    """
+    Reports on the target `sealables`, `paused` being their `isPaused()` in the block of inclusion.
+    """
+    sealed = {event.sealable.lower() for event in get_sealed_events(receipt, gate_seal)}
+    # a multisig transaction may go through while the `seal()` it makes fails
+    succeeded = int(receipt["status"], 16) == 1 and bool(sealed)
+
+    error, failures = None, {}
+    if int(receipt["status"], 16) == 0:
+        # the failures index the sealables passed to `seal()`, known only for a direct call
+        seal_sealables = sealables
+        if is_seal_call(transaction, gate_seal):
+            seal_sealables = decode_seal(bytes.fromhex(transaction["input"][2:]))
+        error, failures = describe_revert(revert_data, seal_sealables)
+    elif not succeeded:
+        error = "no Sealed logs, the seal() call failed"
+    return SealReport(
+        transaction["hash"],
+        int(receipt["blockNumber"], 16),
+        succeeded,
+        [
+            SealableStatus(sealable, sealable.lower() in sealed, is_paused, failures.get(sealable.lower()))
+            for sealable, is_paused in zip(sealables, paused)
+        ],
+        error,
+    )
+
+
+def format_report(report: SealReport) -> str:
+    outcome = "sealed" if report.succeeded else f"reverted: {report.error or 'sealables failed'}"
+    output = [f"{report.transaction_hash} in block {report.block_number}, {outcome}"]
+    for status in report.sealables:
+        output.append(
+            f"{status.sealable} sealed={status.sealed} paused={status.paused}"
+            + (f" failure={status.failure}" if status.failure else "")
+        )
+    return "\n".join(output)
+
+
+def get_sealing_committee(rpc, gate_seal: str) -> str:
+    call = {"to": gate_seal, "data": "0x" + function_selector("get_sealing_committee()").hex()}
+    return decode_address(bytes.fromhex(rpc("eth_call", [call, "latest"])[2:]))
+
+
+def get_sealables(rpc, gate_seal: str) -> list[str]:
+    call = {"to": gate_seal, "data": "0x" + function_selector("get_sealables()").hex()}
+    return decode_address_array(bytes.fromhex(rpc("eth_call", [call, "latest"])[2:]))
+
+
+class SealWatcher:
+    """
+    Watches for the seal of a GateSeal, `rpc(method, params)` performs a JSON-RPC call and
+    `rpc.batch(calls)` a batch of them, see utils/rpc.py::Rpc. The target `sealables` default
+    to every sealable of the GateSeal.
+    """
+
+    def __init__(
+        self, rpc, gate_seal: str, transaction_hash: str | None = None, sealables: list[str] | None = None
+    ):
+        self.rpc = rpc
+        self.gate_seal = gate_seal
+        self.transaction_hash = transaction_hash
+        self.sealables = sealables if sealables is not None else get_sealables(rpc, gate_seal)
+        self.sealing_committee = get_sealing_committee(rpc, gate_seal)
+        self.filter_id = rpc("eth_newBlockFilter", [])
+        # the transaction may have been mined before the filter was installed
+        self.check_mined = transaction_hash is not None
+
+    def poll(self) -> SealReport | None:
+        if self.check_mined:
+            self.check_mined = False
+            transaction = self.rpc("eth_getTransactionByHash", [self.transaction_hash])
+            if transaction is not None and transaction["blockNumber"] is not None:
+                return self.report(transaction)
+
+        topic = get_sealed_topic()
+        for block_hash in self.rpc("eth_getFilterChanges", [self.filter_id]):
+            sealed_logs, block = self.rpc.batch(
+                [
+                    ("eth_getLogs", [{"blockHash": block_hash, "address": self.gate_seal, "topics": [topic]}]),
+                    ("eth_getBlockByHash", [block_hash, True]),
+                ]
+            )
+            transaction = find_seal_transaction(
+                block["transactions"], self.gate_seal, self.sealing_committee, self.transaction_hash, sealed_logs
+            )
+            if transaction is not None:
+                return self.report(transaction)
+        return None
+
+    def report(self, transaction: dict) -> SealReport:
+        sealables = self.sealables
+        block_number = transaction["blockNumber"]
+        is_paused = "0x" + function_selector(IS_PAUSED_SIGNATURE).hex()
+
+        receipt, *paused = self.rpc.batch(
+            [("eth_getTransactionReceipt", [transaction["hash"]])]
+            + [("eth_call", [{"to": sealable, "data": is_paused}, block_number]) for sealable in sealables]
+        )
+        paused = [int(result, 16) == 1 for result in paused]
+
+        revert_data = None
+        if int(receipt["status"], 16) == 0:
+            revert_data = self.replay(transaction)
+        return build_seal_report(transaction, receipt, self.gate_seal, sealables, paused, revert_data)
+
+    def replay(self, transaction: dict) -> bytes | None:
+        # the outer transaction is replayed as is, e.g. the multisig call.
+        # The parent block lacks the transactions mined before the seal in the same block
+        # and has an earlier timestamp, neither changes the outcome unless it was racing expiry
+        parent = hex(int(transaction["blockNumber"], 16) - 1)
+        call = {
+            "from": transaction["from"],
+            "to": transaction["to"],
+            "data": transaction["input"],
+            "gas": transaction["gas"],
+        }
+        try:
+            self.rpc("eth_call", [call, parent])
+        except RpcError as error:
+            return error.data
+        return None
+
+    def watch(
+        self, timeout: int = WATCH_TIMEOUT_SECONDS, interval: float = POLL_INTERVAL_SECONDS
+    ) -> SealReport:
+        deadline = time.monotonic() + timeout
+        while True:
+            report = self.poll()
+            if report is not None:
+                self.rpc("eth_uninstallFilter", [self.filter_id])
+                return report
+            assert time.monotonic() < deadline, f"no seal of {self.gate_seal} within {timeout}s"
+            time.sleep(interval)